@@ -0,0 +1,79 @@
+# Stress test for concurrent QR check-ins.
+#
+# Fires thousands of check-ins from many processes and threads at once against each
+# storage backend, then checks that no name was lost and the player cap was never exceeded.
+#
+#   python benchmarks/checkin_stress.py --checkins 4000 --processes 8 --threads 8
+
+import argparse
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pickleball_engine.storage import STORE_BACKENDS, CHECKED_IN, EVENT_FULL, ALREADY_CHECKED_IN
+
+EVENT_CODE = "STRESS"
+
+
+def make_store(backend, data_dir):
+    if backend == 'sqlite':
+        return STORE_BACKENDS[backend](Path(data_dir) / "events.db")
+    return STORE_BACKENDS[backend](data_dir)
+
+def run_worker(args):
+    """One process: check in its share of names from a pool of threads"""
+    backend, data_dir, names, threads = args
+    store = make_store(backend, data_dir)
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(lambda name: store.check_in(EVENT_CODE, name), names))
+    return list(zip(names, results))
+
+def run_backend(backend, checkins, processes, threads, player_cap, duplicates):
+    with tempfile.TemporaryDirectory() as data_dir:
+        store = make_store(backend, data_dir)
+        store.save_event(EVENT_CODE, {'event_name': 'Stress', 'player_cap': player_cap, 'players': []})
+        
+        names = [f"Player {i}" for i in range(checkins)]
+        # Some players scan twice
+        attempts = names + names[:duplicates]
+        shares = [attempts[i::processes] for i in range(processes)]
+        
+        start = time.perf_counter()
+        with Pool(processes) as pool:
+            results = [r for share in pool.map(run_worker, [(backend, data_dir, s, threads) for s in shares]) for r in share]
+        elapsed = time.perf_counter() - start
+        
+        accepted = {name for name, result in results if result == CHECKED_IN}
+        stored = make_store(backend, data_dir).load_event(EVENT_CODE)['players']
+        counts = {status: sum(1 for _, r in results if r == status)
+                  for status in (CHECKED_IN, ALREADY_CHECKED_IN, EVENT_FULL)}
+        
+        assert len(stored) == len(set(stored)), "duplicate names stored"
+        assert set(stored) == accepted, f"{len(accepted - set(stored))} accepted check-ins were lost"
+        assert len(stored) <= player_cap, f"player cap exceeded: {len(stored)} > {player_cap}"
+        assert len(stored) == min(player_cap, checkins), "check-ins rejected while the event had room"
+        
+        print(f"{backend:7} {len(attempts)} attempts in {elapsed:.2f}s "
+              f"({len(attempts) / elapsed:.0f}/s) -> {len(stored)} stored, {counts}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent QR check-in stress test")
+    parser.add_argument('--checkins', type=int, default=2000)
+    parser.add_argument('--processes', type=int, default=8)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--player-cap', type=int, default=1500)
+    parser.add_argument('--duplicates', type=int, default=200)
+    parser.add_argument('--backend', choices=sorted(STORE_BACKENDS), action='append')
+    args = parser.parse_args()
+    
+    for backend in args.backend or sorted(STORE_BACKENDS):
+        run_backend(backend, args.checkins, args.processes, args.threads, args.player_cap, args.duplicates)
+    print("OK - no lost check-ins, cap never exceeded")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+# Scheduler benchmark - speed and fairness of every format across player and court counts.
+#
+# Each (format, players, courts) case simulates N rounds with random results, timing the
+# create_* scheduler and measuring partner/opponent repeats and sit-out fairness.
+#
+# The default grid takes about 40s on one core, a third of it the multi-start search's deadline.
+#
+#   python benchmarks/scheduler_benchmark.py --output results.json
+#   python benchmarks/scheduler_benchmark.py --players 16 64 --courts 4 --compare results.json
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pickleball_engine import (
+    TournamentState,
+    record_games_batch,
+    create_classic_round_robin_matchups,
+    create_optimized_round,
+    search_optimized_round,
+    record_round_history,
+    create_popcorn_matchups,
+    create_gauntlet_matchups,
+    create_up_down_river_groups,
+    create_scramble_groups,
+    create_mixed_madness_matchups,
+    create_cream_crop_groups,
+    create_balanced_round,
+    choose_sitters,
+    court_game_count,
+    court_game_at,
+    group_repeats,
+)
+
+DEFAULT_PLAYERS = [4, 8, 12, 16, 24, 32, 48, 64, 96, 128, 192, 256]
+DEFAULT_COURTS = [1, 2, 4, 8, 16, 32]
+DEFAULT_ROUNDS = 10
+
+# Games simulated per court in group formats, like a real 3-5 game round
+GROUP_GAMES_PER_ROUND = 5
+
+# Fail --compare when a case gets this much slower, or its repeat rates this much worse
+LATENCY_REGRESSION_RATIO = 1.5
+# ...ignoring sub-millisecond timing noise
+LATENCY_REGRESSION_FLOOR_MS = 0.5
+FAIRNESS_REGRESSION_DELTA = 0.05
+
+
+def balanced_round(s):
+    """Balanced pairing the way build_round runs it: fair bench first, then skill-balanced courts"""
+    playing, sitting = choose_sitters(s.players, min(s.num_courts, len(s.players) // 4) * 4, s.sit_out_counts)
+    games, _ = create_balanced_round(playing, s.num_courts, s.ratings, s.history)
+    return games, sitting
+
+
+# Each scheduler takes the state and returns (games, sitting) or (court groups, sitting)
+SCHEDULERS = {
+    "Classic Round Robin": lambda s: create_optimized_round(
+        s.players, s.num_courts, s.history, s.sit_out_counts),
+    "Classic Round Robin (multi-start)": lambda s: search_optimized_round(
+        s.players, s.num_courts, s.history, s.sit_out_counts),
+    "Classic Round Robin (greedy)": lambda s: create_classic_round_robin_matchups(
+        s.players, s.num_courts, s.history, s.sit_out_counts),
+    "Popcorn": lambda s: create_popcorn_matchups(s.players, s.num_courts, sit_out_counts=s.sit_out_counts),
+    "Balanced pairing": balanced_round,
+    "Gauntlet": lambda s: create_gauntlet_matchups(
+        s.players, s.num_courts, s.scores, sit_out_counts=s.sit_out_counts),
+    "Claim the Throne": lambda s: create_gauntlet_matchups(
+        s.players, s.num_courts, s.scores, sit_out_counts=s.sit_out_counts),
+    "Up and Down the River": lambda s: create_up_down_river_groups(
+        s.players, s.num_courts, s.scores, sit_out_counts=s.sit_out_counts),
+    "Cream of the Crop": lambda s: create_cream_crop_groups(
+        s.players, s.num_courts, s.scores, sit_out_counts=s.sit_out_counts),
+    "Scramble": lambda s: create_scramble_groups(s.players, s.num_courts, sit_out_counts=s.sit_out_counts),
+    "Double Header": lambda s: create_scramble_groups(s.players, s.num_courts, sit_out_counts=s.sit_out_counts),
+    "Mixed Madness": lambda s: create_mixed_madness_matchups(
+        s.players, s.num_courts, s.gender_assignments, s.sit_out_counts),
+}
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+def is_grouped(result):
+    """True for a group format's (court groups, sitting) result"""
+    return bool(result[0]) and 'players' in result[0][0]
+
+def round_games(state, result):
+    """Games actually played this round, and who sat out.
+
+    A group court plays its first GROUP_GAMES_PER_ROUND games, named one at a time
+    from the court's design - like the app, and without naming the whole rotation.
+    """
+    games, sitting = result
+    if not is_grouped(result):
+        return games, list(sitting)
+    
+    games = []
+    repeats = group_repeats(state)
+    for group in result[0]:
+        court_players = group['players']
+        for i in range(min(GROUP_GAMES_PER_ROUND, court_game_count(court_players, repeats))):
+            games.append(dict(court_game_at(court_players, i, repeats), court=group['court']))
+    return games, list(sitting)
+
+def simulate_results(state, games, rng):
+    """Random scores, one batch per court game slot so nobody is in two games at once"""
+    batches = {}
+    for game in games:
+        batch = batches.setdefault(game['court'], [])
+        batch.append(game)
+    for slot in range(max((len(b) for b in batches.values()), default=0)):
+        results = []
+        for court, court_games in batches.items():
+            if slot < len(court_games):
+                winner = rng.randint(0, 1)
+                results.append({
+                    'court': court,
+                    'team1': court_games[slot]['team1'],
+                    'team2': court_games[slot]['team2'],
+                    'score1': 11 if winner else rng.randint(0, 9),
+                    'score2': rng.randint(0, 9) if winner else 11
+                })
+        record_games_batch(state, results)
+
+def run_case(format_name, num_players, num_courts, num_rounds, seed):
+    rng = random.Random(seed)
+    random.seed(seed)
+    players = [f"P{i}" for i in range(num_players)]
+    state = TournamentState(
+        players=players, num_courts=num_courts, num_rounds=num_rounds, format_choice=format_name,
+        gender_assignments={p: 'MF'[i % 2] for i, p in enumerate(players)}
+    )
+    state.ensure_player_stats(players)
+    scheduler = SCHEDULERS[format_name]
+    
+    latencies = []
+    partners = Counter()
+    opponents = Counter()
+    sit_outs = Counter({p: 0 for p in players})
+    peak_bytes = 0
+    
+    for round_number in range(1, num_rounds + 1):
+        state.current_round = round_number
+        if round_number == 1:
+            tracemalloc.start()
+            scheduler(state)
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        
+        start = time.perf_counter()
+        result = scheduler(state)
+        latencies.append((time.perf_counter() - start) * 1000)
+        
+        games, sitting = round_games(state, result)
+        for game in games:
+            for team, other in ((game['team1'], game['team2']), (game['team2'], game['team1'])):
+                partners[frozenset(team)] += 1
+                for p in team:
+                    for q in other:
+                        if p < q:
+                            opponents[(p, q)] += 1
+        sit_outs.update(sitting)
+        # Like the app, court groups count toward the sit-out rotation but not partner history
+        record_round_history([] if is_grouped(result) else games, sitting, state.history, state.sit_out_counts)
+        simulate_results(state, games, rng)
+    
+    partner_total = sum(partners.values())
+    opponent_total = sum(opponents.values())
+    sit_counts = list(sit_outs.values())
+    return {
+        'format': format_name,
+        'players': num_players,
+        'courts': num_courts,
+        'rounds': num_rounds,
+        'latency_ms': {
+            'p50': round(percentile(latencies, 50), 4),
+            'p95': round(percentile(latencies, 95), 4),
+            'p99': round(percentile(latencies, 99), 4),
+            'max': round(max(latencies), 4),
+        },
+        'peak_kib': round(peak_bytes / 1024, 1),
+        'games': partner_total // 2,
+        'repeat_partner_rate': round((partner_total - len(partners)) / partner_total, 4) if partner_total else 0,
+        'repeat_opponent_rate': round((opponent_total - len(opponents)) / opponent_total, 4) if opponent_total else 0,
+        'sit_out_variance': round(statistics.pvariance(sit_counts), 4),
+        'sit_out_spread': max(sit_counts) - min(sit_counts),
+    }
+
+def case_key(result):
+    return (result['format'], result['players'], result['courts'], result['rounds'])
+
+def compare(results, baseline_path):
+    """Print per-case changes against an earlier run; returns the number of regressions"""
+    with open(baseline_path) as f:
+        baseline = {case_key(r): r for r in json.load(f)['results']}
+    
+    regressions = 0
+    for result in results:
+        old = baseline.get(case_key(result))
+        if not old:
+            continue
+        notes = []
+        old_p95 = max(old['latency_ms']['p95'], 0.01)
+        ratio = result['latency_ms']['p95'] / old_p95
+        slower_by = result['latency_ms']['p95'] - old['latency_ms']['p95']
+        if ratio > LATENCY_REGRESSION_RATIO and slower_by > LATENCY_REGRESSION_FLOOR_MS:
+            notes.append(f"p95 {old['latency_ms']['p95']:.2f} -> {result['latency_ms']['p95']:.2f} ms")
+        for metric in ('repeat_partner_rate', 'repeat_opponent_rate'):
+            if result[metric] - old[metric] > FAIRNESS_REGRESSION_DELTA:
+                notes.append(f"{metric} {old[metric]:.3f} -> {result[metric]:.3f}")
+        if notes:
+            regressions += 1
+            print(f"REGRESSION {result['format']} {result['players']}p/{result['courts']}c: {'; '.join(notes)}")
+    print(f"{regressions} regression(s) against {baseline_path}")
+    return regressions
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=Path(__file__).resolve().parent).stdout.strip() or None
+    except OSError:
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every scheduler for speed and fairness")
+    parser.add_argument('--players', type=int, nargs='+', default=DEFAULT_PLAYERS)
+    parser.add_argument('--courts', type=int, nargs='+', default=DEFAULT_COURTS)
+    parser.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS)
+    parser.add_argument('--formats', nargs='+', choices=sorted(SCHEDULERS), default=list(SCHEDULERS))
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help="Write results as JSON to this file")
+    parser.add_argument('--compare', help="Earlier --output file to check for regressions")
+    args = parser.parse_args()
+    
+    results = []
+    print(f"{'format':30} {'players':>7} {'courts':>6} {'p50ms':>8} {'p95ms':>8} {'peakKiB':>8} "
+          f"{'rep.part':>8} {'rep.opp':>8} {'sit.var':>8}")
+    for format_name in args.formats:
+        for num_players in args.players:
+            for num_courts in args.courts:
+                # Skip courts that could never be filled
+                if num_courts * 4 > num_players and num_courts > 1:
+                    continue
+                r = run_case(format_name, num_players, num_courts, args.rounds, args.seed)
+                results.append(r)
+                print(f"{format_name:30} {num_players:7} {num_courts:6} {r['latency_ms']['p50']:8.3f} "
+                      f"{r['latency_ms']['p95']:8.3f} {r['peak_kib']:8.1f} {r['repeat_partner_rate']:8.3f} "
+                      f"{r['repeat_opponent_rate']:8.3f} {r['sit_out_variance']:8.3f}")
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'revision': git_revision(),
+                'python': platform.python_version(),
+                'rounds': args.rounds,
+                'seed': args.seed,
+                'results': results,
+            }, f, indent=2)
+    
+    if args.compare and compare(results, args.compare):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# Session simulator - which format, court count and round count gives the most play per hour.
+#
+# Runs hundreds of simulated sessions per configuration through the real schedulers, with
+# random game lengths, spread across every core, and ranks the configurations.
+#
+#   python benchmarks/session_simulator.py --players 20 --courts 4 5 --rounds 6 8 --sessions 400
+#   python benchmarks/session_simulator.py --players 16 --courts 4 --continuous --game-minutes 15 --output sim.json
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pickleball_engine import (
+    FORMAT_NAMES,
+    CONTINUOUS_FORMATS,
+    SIMULATED_SESSIONS,
+    GameDurations,
+    simulate_configs,
+)
+
+
+def build_configs(args):
+    configs = []
+    for format_name in args.formats:
+        for num_players in args.players:
+            for num_courts in args.courts:
+                # Skip courts that could never be filled
+                if num_courts * 4 > num_players and num_courts > 1:
+                    continue
+                for num_rounds in args.rounds:
+                    config = {'format': format_name, 'players': num_players, 'courts': num_courts,
+                              'rounds': num_rounds}
+                    configs.append(config)
+                    if args.continuous and format_name in CONTINUOUS_FORMATS:
+                        configs.append(dict(config, play_mode="Continuous"))
+    return configs
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo session length and play time for each configuration")
+    parser.add_argument('--players', type=int, nargs='+', default=[16])
+    parser.add_argument('--courts', type=int, nargs='+', default=[4])
+    parser.add_argument('--rounds', type=int, nargs='+', default=[8])
+    parser.add_argument('--formats', nargs='+', choices=FORMAT_NAMES, default=FORMAT_NAMES)
+    parser.add_argument('--continuous', action='store_true', help="Also simulate continuous play where possible")
+    parser.add_argument('--sessions', type=int, default=SIMULATED_SESSIONS)
+    parser.add_argument('--processes', type=int, help="Worker processes (default: every core)")
+    parser.add_argument('--game-minutes', type=float, default=12, help="Mean game length")
+    parser.add_argument('--game-sd', type=float, default=3, help="Standard deviation of game length")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    configs = build_configs(args)
+    durations = GameDurations(args.game_minutes, args.game_sd)
+    start = time.perf_counter()
+    results = simulate_configs(configs, args.sessions, args.processes, durations, args.seed)
+    elapsed = time.perf_counter() - start
+
+    # Most games per player per hour first
+    results.sort(key=lambda r: r['games_per_player_hour'], reverse=True)
+    print(f"{'format':24} {'mode':10} {'players':>7} {'courts':>6} {'rounds':>6} {'minutes':>8} {'p90':>6} "
+          f"{'idle%':>6} {'games/pl':>8} {'spread':>6} {'sit.spr':>7} {'g/pl/hr':>7}")
+    for r in results:
+        sit_out_spread = '-' if r['sit_out_spread'] is None else f"{r['sit_out_spread']:.1f}"
+        print(f"{r['format']:24} {r.get('play_mode', 'Rounds'):10} {r['players']:7} {r['courts']:6} {r['rounds']:6} "
+              f"{r['session_minutes']:8.0f} {r['session_minutes_p90']:6.0f} {r['court_idle_share']:6.0%} "
+              f"{r['games_per_player']:8.1f} {r['games_per_player_spread']:6.1f} {sit_out_spread:>7} "
+              f"{r['games_per_player_hour']:7.2f}")
+    print(f"{len(configs) * args.sessions} sessions in {elapsed:.1f}s")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'sessions': args.sessions,
+                'game_minutes': args.game_minutes,
+                'game_sd': args.game_sd,
+                'seed': args.seed,
+                'results': results,
+            }, f, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+# Pickleball scheduling engine - pure Python, no Streamlit import.
+# The Streamlit app in pickleball_round_robin.py is a thin client of this package.
+
+from .stats import new_player_stats, calculate_win_percentage
+from .standings import (
+    TIEBREAK_KEYS,
+    HEAD_TO_HEAD,
+    DEFAULT_TIEBREAKS,
+    TIEBREAK_PRESETS,
+    StandingsIndex,
+)
+from .registry import PlayerRegistry, PairHistory
+from .state import TournamentState
+from .scoring import ScoreError, validate_result, record_game, record_games_batch
+from .sitouts import choose_sitters, pair_sit_out_count, bench_order, fair_bench
+from .ratings import INITIAL_RATING, expected_score, RatingTable
+from .seeding import Seeding
+from .formats import (
+    fixed_pairs,
+    split_into_courts,
+    create_classic_round_robin_matchups,
+    create_popcorn_matchups,
+    create_gauntlet_matchups,
+    create_up_down_river_groups,
+    create_scramble_groups,
+    create_mixed_madness_matchups,
+    create_cream_crop_groups,
+)
+from .court_games import (
+    court_game_design,
+    court_schedule,
+    court_game_count,
+    court_game_at,
+    generate_court_games,
+)
+from .matching import create_optimized_round, record_round_history
+from .schedule import (
+    PRECOMPUTABLE_FORMATS,
+    build_schedule_table,
+    SessionSchedule,
+    planned_fairly,
+    get_planned_round,
+)
+from .search import (
+    PARALLEL_SEARCH_MIN_PLAYERS,
+    SEARCH_DEADLINE,
+    SEARCH_SLOTS,
+    round_cost,
+    cost_floor,
+    process_context,
+    get_search_pool,
+    warm_search_pool,
+    serial_search,
+    multi_start_search,
+    search_optimized_round,
+    optimize_round,
+)
+from .balance import create_balanced_round
+from .rounds import FORMAT_NAMES, SEEDED_FORMATS, PAIRING_MODES, BALANCED_FORMATS, build_round, apply_round, generate_new_round
+from .dispatch import (
+    PLAY_MODES,
+    CONTINUOUS_FORMATS,
+    DISPATCH_WINDOW,
+    continuous_play,
+    pick_game,
+    dispatch_courts,
+    apply_dispatch,
+)
+from .court_scores import (
+    FIXED_PAIR_COURT_GAMES,
+    RECORDED,
+    DUPLICATE,
+    ScoreConflict,
+    group_repeats,
+    current_court_game,
+    court_report,
+    court_conflict,
+    record_court_results,
+    submit_court_score,
+    submit_round_scores,
+)
+from .utilization import court_utilization
+from .simulation import (
+    CHANGEOVER_MINUTES,
+    ROUND_BREAK_MINUTES,
+    SIMULATED_SESSIONS,
+    GameDurations,
+    simulate_session,
+    simulate_configs,
+)
+from .prefetch import (
+    PREFETCH_WORKERS,
+    depends_on_results,
+    round_inputs,
+    prefetch_next_round,
+    repair_round,
+    take_prefetched_round,
+)
+from .eventlog import (
+    SNAPSHOT_INTERVAL,
+    ROUND_SETTINGS,
+    SETTINGS,
+    apply_event,
+    EventLog,
+    open_event_log,
+    start_round,
+    current_settings,
+    save_settings,
+)
+from .storage import (
+    get_data_dir,
+    generate_event_code,
+    CHECKED_IN,
+    ALREADY_CHECKED_IN,
+    EVENT_FULL,
+    EVENT_NOT_FOUND,
+    JsonFileStore,
+    SQLiteEventStore,
+    STORE_BACKENDS,
+    get_store,
+    set_store,
+    save_event_data,
+    load_event_data,
+    get_event_version,
+    check_in_player,
+    add_player_to_event,
+    remove_player_from_event,
+    rename_player_in_event,
+)
+from .display import (
+    DISPLAY_STANDINGS_ROWS,
+    court_view,
+    bench_view,
+    standings_view,
+    build_board,
+    render_board_html,
+)
+from .live import (
+    LIVE_EVENT_LIMIT,
+    LIVE_EVENT_IDLE_SECONDS,
+    LiveEvent,
+    EventCache,
+    get_live_event,
+    get_event_cache,
+)
+from .qr import render_qr_png, render_qr_svg, render_qr_print_sheet
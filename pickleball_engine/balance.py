@@ -0,0 +1,86 @@
+# Skill-balanced matchmaking - foursomes and team splits chosen so every game is as even as possible
+
+import random
+import time
+
+from .ratings import RatingTable
+
+# Added to a court's cost for each repeated partnership, in rating points, so balancing
+# doesn't undo partner rotation unless the games would be very lopsided otherwise
+REPEAT_PARTNER_PENALTY = 200
+
+# The three ways to split a foursome a, b, c, d into two teams
+SPLITS = ((0, 1, 2, 3), (0, 2, 1, 3), (0, 3, 1, 2))
+
+
+def best_split(four, rating, repeat_partner):
+    """(cost, ordered foursome) for the fairest split of four players.
+
+    Cost is the gap between the two teams' mean ratings, plus a penalty per repeat partnership.
+    """
+    best = None
+    for a, b, c, d in SPLITS:
+        p, q, r, s = four[a], four[b], four[c], four[d]
+        cost = abs(rating[p] + rating[q] - rating[r] - rating[s]) / 2
+        cost += REPEAT_PARTNER_PENALTY * (repeat_partner(p, q) + repeat_partner(r, s))
+        if best is None or cost < best[0]:
+            best = (cost, (p, q, r, s))
+    return best
+
+def create_balanced_round(players, num_courts, ratings=None, history=None, time_budget=0.05, rng=None):
+    """Group the players into courts and teams so predicted games are as close as possible.
+
+    `players` should already exclude the bench (see choose_sitters); any extra beyond
+    num_courts * 4 are returned as sitting. Starts from a rating-sorted grouping - neighbours
+    in rating share a court, best with worst vs the middle two - then swaps players between
+    courts while that lowers the total gap. Returns (games, sitting) like the other create_* functions.
+    """
+    ratings = ratings or RatingTable()
+    rng = rng or random
+    courts_used = min(num_courts, len(players) // 4)
+    if courts_used == 0:
+        return [], list(players)
+    
+    # Shuffle first so equally rated players (e.g. everyone, in round 1) aren't grouped by roster order
+    ranked = ratings.ranked(rng.sample(list(players), len(players)))
+    playing, sitting = ranked[:courts_used * 4], ranked[courts_used * 4:]
+    rating = {p: ratings.rating(p) for p in playing}
+    if history is not None:
+        repeat_partner = history.partnered
+    else:
+        repeat_partner = lambda p, q: False
+    
+    courts = [best_split(playing[c * 4:c * 4 + 4], rating, repeat_partner) for c in range(courts_used)]
+    
+    deadline = time.perf_counter() + time_budget
+    iterations = 0
+    stale = 0
+    stale_limit = 100 + 20 * len(playing)
+    while courts_used > 1 and stale < stale_limit:
+        iterations += 1
+        if iterations % 64 == 0 and time.perf_counter() > deadline:
+            break
+        
+        ci, cj = rng.sample(range(courts_used), 2)
+        i, j = rng.randrange(4), rng.randrange(4)
+        four_i, four_j = list(courts[ci][1]), list(courts[cj][1])
+        four_i[i], four_j[j] = four_j[j], four_i[i]
+        new_i = best_split(four_i, rating, repeat_partner)
+        new_j = best_split(four_j, rating, repeat_partner)
+        if new_i[0] + new_j[0] < courts[ci][0] + courts[cj][0]:
+            courts[ci], courts[cj] = new_i, new_j
+            stale = 0
+        else:
+            stale += 1
+    
+    # Strongest foursome on court 1
+    courts.sort(key=lambda court: sum(rating[p] for p in court[1]), reverse=True)
+    games = []
+    for c, (_, (p, q, r, s)) in enumerate(courts):
+        games.append({
+            'court': c + 1,
+            'team1': [p, q],
+            'team2': [r, s]
+        })
+    
+    return games, sitting
@@ -0,0 +1,416 @@
+# Game sequences for courts where a group of players rotates partners (Scramble, Double Header,
+# Up and Down the River, Cream of the Crop). Each sequence is built once per roster from a
+# combinatorial design, cached, and served by index.
+
+import random
+from functools import lru_cache
+
+# Whist tournaments: every pair partners exactly once and opposes exactly twice.
+# Each design is a base round that is developed cyclically; slots are player positions.
+
+def _whist_5():
+    # Z5: player 0 sits, 1 & 4 vs 2 & 3
+    return [((((1 + k) % 5, (4 + k) % 5)), (((2 + k) % 5, (3 + k) % 5))) for k in range(5)]
+
+def _whist_8():
+    # Z7 plus a fixed player 7
+    def shift(x, k):
+        return x if x == 7 else (x + k) % 7
+    base = [((0, 1), (2, 4)), ((3, 6), (5, 7))]
+    return [((shift(a, k), shift(b, k)), (shift(c, k), shift(d, k)))
+            for k in range(7) for (a, b), (c, d) in base]
+
+def _whist_9():
+    # Z3 x Z3: player (0, 0) sits
+    def slot(p, s):
+        return ((p[0] + s[0]) % 3) * 3 + (p[1] + s[1]) % 3
+    base = [(((0, 1), (0, 2)), ((1, 0), (2, 0))), (((1, 1), (2, 2)), ((1, 2), (2, 1)))]
+    shifts = [(i, j) for i in range(3) for j in range(3)]
+    return [((slot(a, s), slot(b, s)), (slot(c, s), slot(d, s)))
+            for s in shifts for (a, b), (c, d) in base]
+
+def _whist_12():
+    # Z11 plus a fixed player 11
+    def shift(x, k):
+        return x if x == 11 else (x + k) % 11
+    base = [((0, 1), (2, 5)), ((3, 7), (8, 10)), ((4, 9), (6, 11))]
+    return [((shift(a, k), shift(b, k)), (shift(c, k), shift(d, k)))
+            for k in range(11) for (a, b), (c, d) in base]
+
+def _whist_13():
+    # Z13: player 0 sits
+    base = [((1, 4), (2, 7)), ((3, 12), (6, 8)), ((5, 11), (9, 10))]
+    return [(((a + k) % 13, (b + k) % 13), ((c + k) % 13, (d + k) % 13))
+            for k in range(13) for (a, b), (c, d) in base]
+
+WHIST_DESIGNS = {
+    4: lambda: [((0, 1), (2, 3)), ((0, 2), (1, 3)), ((0, 3), (1, 2))],
+    5: _whist_5,
+    8: _whist_8,
+    9: _whist_9,
+    12: _whist_12,
+    13: _whist_13,
+}
+
+# Seeded, so every server process builds the same sequence for a roster size
+DESIGN_SEED = 2025
+# Searched designs: independent tries, and partnership swaps per game in each to even out opponents
+DESIGN_TRIES = 8
+DESIGN_SWAPS_PER_GAME = 50
+# Largest roster whose design is searched; the search takes seconds from about 20 players up,
+# so bigger courts get a cyclic design built directly
+SEARCHED_DESIGN_MAX_PLAYERS = 13
+# Swaps tried in each of DESIGN_TRIES pairings of a cyclic design's base round
+BASE_ROUND_SWAPS = 2000
+# Moves tried when building the base of a double-round design (n = 2 mod 4)
+DOUBLE_ROUND_MOVES = 3000
+
+
+def _partnerships(n):
+    """Partner pairs for a searched design: as many as still lets everyone play equally often.
+
+    Every pair partnering once gives n(n-1)/2 partnerships, which only split into
+    games evenly when n is 0 or 1 mod 4. Otherwise each player skips one partner
+    (a perfect matching, n = 2 mod 4) or two (a cycle, n = 3 mod 4).
+    """
+    pairs = {(a, b) for a in range(n) for b in range(a + 1, n)}
+    if n % 4 == 2:
+        pairs -= {(2 * i, 2 * i + 1) for i in range(n // 2)}
+    elif n % 4 == 3:
+        pairs -= {tuple(sorted((i, (i + 1) % n))) for i in range(n)}
+    return sorted(pairs)
+
+def _opponent_pairs(game):
+    (a, b), (c, d) = game
+    return [(a, c), (a, d), (b, c), (b, d)]
+
+def _match_partnerships(pairs, n, rng):
+    """Pair up disjoint partnerships into games, each against the waiting pair it has met least.
+    Returns None if some partnerships are left without an opponent pair."""
+    order = list(pairs)
+    rng.shuffle(order)
+    opponents = [[0] * n for _ in range(n)]
+    games = []
+    pending = []
+    for pair in order:
+        best = None
+        for i, other in enumerate(pending):
+            if set(pair) & set(other):
+                continue
+            cost = sum(opponents[p][q] for p in pair for q in other)
+            if best is None or cost < best[0]:
+                best = (cost, i)
+        if best is None:
+            pending.append(pair)
+            continue
+        game = (pending.pop(best[1]), pair)
+        for p, q in _opponent_pairs(game):
+            opponents[p][q] += 1
+            opponents[q][p] += 1
+        games.append(game)
+    return None if pending else games
+
+def _even_out_opponents(games, n, rng):
+    """Swap partnerships between two games whenever that spreads opponent counts more evenly"""
+    opponents = [[0] * n for _ in range(n)]
+    def count(game, step):
+        for p, q in _opponent_pairs(game):
+            opponents[p][q] += step
+            opponents[q][p] += step
+    for game in games:
+        count(game, 1)
+    
+    for _ in range(DESIGN_SWAPS_PER_GAME * len(games)):
+        i, j = rng.sample(range(len(games)), 2)
+        (a, b), (c, d) = games[i], games[j]
+        for swapped in (((a, c), (b, d)), ((a, d), (b, c))):
+            if any(set(x) & set(y) for x, y in swapped):
+                continue
+            touched = {(min(p, q), max(p, q)) for g in (games[i], games[j]) + swapped for p, q in _opponent_pairs(g)}
+            before = sum(opponents[p][q] ** 2 for p, q in touched)
+            count(games[i], -1)
+            count(games[j], -1)
+            for game in swapped:
+                count(game, 1)
+            if sum(opponents[p][q] ** 2 for p, q in touched) <= before:
+                games[i], games[j] = swapped
+                break
+            for game in swapped:
+                count(game, -1)
+            count(games[i], 1)
+            count(games[j], 1)
+    return games
+
+def _spread_rests(games, n):
+    """Order games so whoever has played least goes next - nobody plays long runs in a row"""
+    played = [0] * n
+    ordered = []
+    remaining = list(games)
+    while remaining:
+        game = min(remaining, key=lambda g: sum(played[p] for team in g for p in team))
+        remaining.remove(game)
+        for team in game:
+            for p in team:
+                played[p] += 1
+        ordered.append(game)
+    return ordered
+
+def _opponent_spread(games, n):
+    """(max - min opponent count over all pairs, sum of squares) - lower is more even"""
+    opponents = [[0] * n for _ in range(n)]
+    for game in games:
+        for p, q in _opponent_pairs(game):
+            opponents[min(p, q)][max(p, q)] += 1
+    counts = [opponents[p][q] for p in range(n) for q in range(p + 1, n)]
+    return max(counts) - min(counts), sum(c * c for c in counts)
+
+def _searched_design(n):
+    """For sizes with no whist tournament here: no repeat partners, everyone plays the
+    same number of games, and opponent counts as even as a seeded search gets them"""
+    rng = random.Random(DESIGN_SEED + n)
+    pairs = _partnerships(n)
+    best = None
+    for _ in range(DESIGN_TRIES):
+        games = None
+        while games is None:
+            games = _match_partnerships(pairs, n, rng)
+        games = _even_out_opponents(games, n, rng)
+        spread = _opponent_spread(games, n)
+        if best is None or spread < best[0]:
+            best = (spread, games)
+    return _spread_rests(best[1], n)
+
+def _difference(d, modulus):
+    d %= modulus
+    return min(d, modulus - d)
+
+def _base_round_games(items, modulus, rng):
+    """Pair up a cyclic design's base-round partnerships into games.
+
+    Item i stands for the partnership (r + i, r - i) in round r, and None for (fixed player, r).
+    Over all rounds, players whose difference is d meet as opponents twice for every time d
+    turns up in the base games, so the pairing is swapped around to spread differences evenly.
+    Every difference once makes a whist design; the best of a few seeded tries is kept.
+    """
+    def differences(game):
+        i, j = game
+        if i is None or j is None:
+            return [_difference(j if i is None else i, modulus)]
+        return [_difference(i - j, modulus), _difference(i + j, modulus)]
+    
+    best = None
+    for _ in range(DESIGN_TRIES):
+        order = list(items)
+        rng.shuffle(order)
+        games = [(order[k], order[k + 1]) for k in range(0, len(order), 2)]
+        counts = [0] * modulus
+        for game in games:
+            for d in differences(game):
+                counts[d] += 1
+        
+        for _ in range(BASE_ROUND_SWAPS if len(games) > 1 else 0):
+            x, y = rng.sample(range(len(games)), 2)
+            (a, b), (c, d) = games[x], games[y]
+            swapped = ((a, c), (b, d)) if rng.random() < 0.5 else ((a, d), (b, c))
+            old = differences(games[x]) + differences(games[y])
+            new = differences(swapped[0]) + differences(swapped[1])
+            before = sum(counts[v] ** 2 for v in set(old + new))
+            for v in old:
+                counts[v] -= 1
+            for v in new:
+                counts[v] += 1
+            if sum(counts[v] ** 2 for v in set(old + new)) <= before:
+                games[x], games[y] = swapped
+            else:
+                for v in new:
+                    counts[v] -= 1
+                for v in old:
+                    counts[v] += 1
+        
+        spread = sum(c * c for c in counts)
+        if best is None or spread < best[0]:
+            best = (spread, games)
+        if max(counts) <= 1:
+            break
+    return best[1]
+
+def _cyclic_design(n):
+    """Circle-method design for a bigger court with n = 0, 1 or 3 mod 4, built round by round.
+
+    Odd n: in round r of n, player r sits and the rest partner r + i with r - i. Even n:
+    player n-1 partners r and the rest play as for n-1. Every round is the base games (see
+    _base_round_games) shifted by r, so everyone plays once a round. For n = 3 mod 4 the
+    partnerships at difference 2 (a cycle) are skipped so the games come out even.
+    """
+    rng = random.Random(DESIGN_SEED + n)
+    modulus = n if n % 2 else n - 1
+    indices = list(range(1, (modulus - 1) // 2 + 1))
+    if n % 2 == 0:
+        indices = [None] + indices
+    if n % 4 == 3:
+        indices.remove(1)
+    
+    def partners(i, r):
+        if i is None:
+            return (n - 1, r)
+        return ((r + i) % modulus, (r - i) % modulus)
+    
+    base = _base_round_games(indices, modulus, rng)
+    return [(partners(i, r), partners(j, r)) for r in range(modulus) for i, j in base]
+
+def _double_round_design(n, rng):
+    """Design for a bigger court with n = 2 mod 4: players 0..n-3 on a cycle plus two fixed players.
+
+    A round's partnerships can't split into games here, so the base is two rounds' worth
+    (one partnership from every orbit under shifts by 2), developed by shifting 0, 2, 4, ...
+    Each player skips one partner: the one opposite on the cycle, or the other fixed player.
+    A local search slides base partnerships around their orbits and re-pairs them, keeping
+    games disjoint and spreading opponents over every pair orbit. The two fixed players
+    never oppose each other. Returns None if some game still breaks those rules.
+    """
+    m = n - 2
+    items = [(start, start + d) for start in (0, 1) for d in range(1, m // 2)]
+    items += [(fixed, x) for fixed in (m, m + 1) for x in (0, 1)]
+    shifts = [2 * rng.randrange(m // 2) for _ in items]
+    
+    def team(item, shift):
+        return tuple(p if p >= m else (p + shift) % m for p in items[item])
+    
+    def orbit(p, q):
+        # Fixed players stay put under a shift; the rest keep their difference and parity
+        if p >= m or q >= m:
+            return (max(p, q), min(p, q) % 2)
+        d = (q - p) % m
+        if d > m // 2:
+            p, d = q, m - d
+        return (d, p % 2)
+    
+    def orbits(game, moved=None):
+        """Opponent orbits of a game of two base items, once per meeting it makes for each pair.
+        None if the teams share a player, or the fixed players (who'd meet every shift) are opponents."""
+        (a, b), (c, d) = (team(item, moved[1] if moved and moved[0] == item else shifts[item]) for item in game)
+        if len({a, b, c, d}) < 4 or {a, b, c, d} >= {m, m + 1}:
+            return None
+        found = []
+        for p, q in ((a, c), (a, d), (b, c), (b, d)):
+            key = orbit(p, q)
+            # Pairs opposite on the cycle make an orbit half the size, so they meet twice
+            found += [key, key] if key[0] == m // 2 else [key]
+        return found
+    
+    order = list(range(len(items)))
+    rng.shuffle(order)
+    games = [(order[k], order[k + 1]) for k in range(0, len(order), 2)]
+    game_of = {item: g for g, game in enumerate(games) for item in game}
+    counts = {}
+    clashes = 0
+    for game in games:
+        found = orbits(game)
+        clashes += found is None
+        for key in found or ():
+            counts[key] = counts.get(key, 0) + 1
+    
+    for _ in range(DOUBLE_ROUND_MOVES):
+        moved = None
+        if rng.random() < 0.5:
+            item = rng.randrange(len(items))
+            moved = (item, 2 * rng.randrange(m // 2))
+            old = {game_of[item]: games[game_of[item]]}
+            new = dict(old)
+        else:
+            x, y = rng.sample(range(len(games)), 2)
+            (a, b), (c, d) = games[x], games[y]
+            old = {x: games[x], y: games[y]}
+            new = dict(zip((x, y), ((a, c), (b, d)) if rng.random() < 0.5 else ((a, d), (b, c))))
+        old_orbits = [orbits(game) for game in old.values()]
+        new_orbits = [orbits(game, moved) for game in new.values()]
+        old_keys = [key for found in old_orbits for key in found or ()]
+        new_keys = [key for found in new_orbits for key in found or ()]
+        old_clashes = sum(found is None for found in old_orbits)
+        new_clashes = sum(found is None for found in new_orbits)
+        touched = set(old_keys + new_keys)
+        
+        before = clashes * len(items) ** 2 + sum(counts.get(key, 0) ** 2 for key in touched)
+        for key in old_keys:
+            counts[key] -= 1
+        for key in new_keys:
+            counts[key] = counts.get(key, 0) + 1
+        clashes += new_clashes - old_clashes
+        if clashes * len(items) ** 2 + sum(counts[key] ** 2 for key in touched) <= before:
+            if moved:
+                shifts[moved[0]] = moved[1]
+            for g, game in new.items():
+                games[g] = game
+                for item in game:
+                    game_of[item] = g
+        else:
+            for key in new_keys:
+                counts[key] -= 1
+            for key in old_keys:
+                counts[key] += 1
+            clashes += old_clashes - new_clashes
+    
+    if clashes:
+        return None
+    # Ordered once - a shift is the same block with the players renamed
+    base = _spread_rests([(team(i, shifts[i]), team(j, shifts[j])) for i, j in games], n)
+    return [tuple(tuple(p if p >= m else (p + shift) % m for p in t) for t in game)
+            for shift in range(0, m, 2) for game in base]
+
+@lru_cache(maxsize=None)
+def court_game_design(num_players):
+    """Game sequence on player slots 0..num_players-1, as ((a, b), (c, d)) tuples.
+
+    Everyone plays the same number of games and nobody partners twice. Whist sizes
+    (4, 5, 8, 9, 12, 13) also have every pair partner once and oppose exactly twice.
+    Other sizes up to SEARCHED_DESIGN_MAX_PLAYERS skip a few partnerships (see
+    _partnerships) and oppose once or twice. Bigger courts get a design built directly
+    (see _cyclic_design and _double_round_design) in a fraction of a second even at 100
+    players: most pairs oppose twice, a few from none to four times.
+    """
+    if num_players < 4:
+        return ()
+    if num_players in WHIST_DESIGNS:
+        return tuple(WHIST_DESIGNS[num_players]())
+    if num_players <= SEARCHED_DESIGN_MAX_PLAYERS:
+        return tuple(_searched_design(num_players))
+    if num_players % 4 != 2:
+        return tuple(_cyclic_design(num_players))
+    rng = random.Random(DESIGN_SEED + num_players)
+    design = None
+    while design is None:
+        design = _double_round_design(num_players, rng)
+    return tuple(design)
+
+@lru_cache(maxsize=512)
+def court_schedule(court_players, repeats=1):
+    """Named game sequence for a court roster (a tuple). A new roster is a new cache entry."""
+    design = court_game_design(len(court_players))
+    games = []
+    for r in range(repeats):
+        # Each repeat rotates the roster so the extra games bring new opponents
+        order = court_players[r:] + court_players[:r]
+        games.extend(((order[a], order[b]), (order[c], order[d])) for (a, b), (c, d) in design)
+    return tuple(games)
+
+def court_game_count(court_players, repeats=1):
+    return len(court_game_design(len(court_players))) * repeats
+
+def court_game_at(court_players, index, repeats=1):
+    """The index-th game on a court, in the same shape as the rest of the app's games.
+
+    Named straight from the cached design (as court_schedule would), so serving one
+    game doesn't build a new roster's whole schedule.
+    """
+    design = court_game_design(len(court_players))
+    repeat, slot = divmod(index, len(design)) if design else (repeats, 0)
+    if index < 0 or repeat >= repeats:
+        raise IndexError(f"Game {index} is past the end of the court's {len(design) * repeats} games")
+    order = list(court_players[repeat:]) + list(court_players[:repeat])
+    (a, b), (c, d) = design[slot]
+    return {'team1': [order[a], order[b]], 'team2': [order[c], order[d]]}
+
+def generate_court_games(court_players, repeats=1):
+    """Generate the partnership rotation for a court"""
+    return [{'team1': list(team1), 'team2': list(team2)}
+            for team1, team2 in court_schedule(tuple(court_players), repeats)]
@@ -0,0 +1,138 @@
+# Per-court score reports - each court's game can be scored once, from any device, safely retried
+
+from .court_games import court_game_count, court_game_at
+from .dispatch import continuous_play, dispatch_courts
+from .prefetch import depends_on_results, prefetch_next_round
+from .scoring import ScoreError, record_games_batch
+
+# Games played by a fixed-partner court group before it's complete
+FIXED_PAIR_COURT_GAMES = 5
+
+# submit_court_score outcomes
+RECORDED = "recorded"
+DUPLICATE = "duplicate"
+
+
+class ScoreConflict(ScoreError):
+    """A result for a game that was already scored differently, or isn't being played any more"""
+
+
+def group_repeats(state):
+    """Double Header cycles through each court's partner rotation twice"""
+    return 2 if state.format_choice == "Double Header" else 1
+
+def current_court_game(state, court):
+    """(game index, game) being played on a court right now, or None when it has nothing left"""
+    for game in state.current_games:
+        if game['court'] == court:
+            # Continuous play numbers each court's games; a round's games are all game 0
+            return game.get('game', 0), game
+
+    for group in state.court_groups:
+        if group['court'] != court:
+            continue
+        index = state.court_game_index.get(court, 0)
+        if 'players' in group:
+            repeats = group_repeats(state)
+            if index < court_game_count(group['players'], repeats):
+                return index, court_game_at(group['players'], index, repeats)
+        elif 'pairs' in group and index < FIXED_PAIR_COURT_GAMES:
+            pair1, pair2 = group['pairs']
+            return index, {'court': court, 'team1': pair1, 'team2': pair2}
+    return None
+
+def report_key(round_number, court, game_index):
+    # String keys so the reports survive a JSON snapshot
+    return f"{round_number}:{court}:{game_index}"
+
+def court_report(state, court, game_index=0, round_number=None):
+    """The accepted report for one game, or None if it hasn't been scored"""
+    round_number = state.current_round if round_number is None else round_number
+    return state.court_reports.get(report_key(round_number, court, game_index))
+
+def _same_result(report, team1, team2, score1, score2):
+    return report['team1'] == list(team1) and report['team2'] == list(team2) and report['score'] == [score1, score2]
+
+def court_conflict(state, round_number, court, game_index, team1, team2):
+    """Why a result for this game can't be accepted any more, or None if it can"""
+    report = court_report(state, court, game_index, round_number)
+    if report is not None:
+        score1, score2 = report['score']
+        return f"Court {court} was already scored {score1}-{score2}"
+    if round_number != state.current_round:
+        return f"Round {round_number} is over - it's round {state.current_round} now"
+    current = current_court_game(state, court)
+    if current is None or current[0] != game_index:
+        return f"That game isn't being played on court {court} any more"
+    game = current[1]
+    if list(team1) != list(game['team1']) or list(team2) != list(game['team2']):
+        return f"The lineup on court {court} has changed"
+    return None
+
+def record_court_results(state, results, round_number, game_indexes, submission_id, expected_courts=None):
+    """Record results and mark each game as reported. `game_indexes` maps court -> game index."""
+    entries = record_games_batch(state, results, expected_courts=expected_courts, round_number=round_number)
+    for entry in entries:
+        game_index = game_indexes.get(entry['court'], 0)
+        state.court_reports[report_key(round_number, entry['court'], game_index)] = {
+            'submission_id': submission_id,
+            'team1': entry['team1'],
+            'team2': entry['team2'],
+            'score': entry['score'],
+        }
+    return entries
+
+def apply_court_score(state, event):
+    """Reducer for a 'court_score' event: one game reported from a court"""
+    court = event['court']
+    record_court_results(state, [{
+        'court': court,
+        'team1': event['team1'],
+        'team2': event['team2'],
+        'score1': event['score1'],
+        'score2': event['score2']
+    }], event['round'], {court: event['game']}, event['submission_id'])
+    if state.court_groups:
+        state.court_game_index[court] = event['game'] + 1
+
+def submit_court_score(log, state, submission_id, round_number, court, game_index, team1, team2, score1, score2):
+    """Log one court's result. Safe to retry with the same submission_id.
+
+    In continuous play the court's next game is dispatched in the same locked step, so
+    it's on the court (and every screen) as soon as the score is in.
+    Returns RECORDED, or DUPLICATE when this submission (or an identical score from another
+    device) was already accepted. Raises ScoreConflict if the game was scored differently
+    or has moved on, and ScoreError for an invalid score. Checked under the log's lock,
+    so two phones racing on one court can't both win.
+    """
+    with log.exclusive(state):
+        report = court_report(state, court, game_index, round_number)
+        if report is not None and (report['submission_id'] == submission_id or
+                                   _same_result(report, team1, team2, score1, score2)):
+            return DUPLICATE
+        conflict = court_conflict(state, round_number, court, game_index, team1, team2)
+        if conflict:
+            raise ScoreConflict(conflict)
+        log.record(state, 'court_score', submission_id=submission_id, round=round_number, court=court,
+                   game=game_index, team1=list(team1), team2=list(team2), score1=score1, score2=score2)
+        if continuous_play(state):
+            log.record(state, 'court_dispatched', **dispatch_courts(state, court))
+        elif depends_on_results(state):
+            # The next round is seeded by results - rebuild it with this one in
+            prefetch_next_round(state)
+    return RECORDED
+
+def submit_round_scores(log, state, results, expected_courts=None, advance_courts=()):
+    """Log results for several courts at once (the organizer's view), refusing any game a court already reported"""
+    with log.exclusive(state):
+        for result in results:
+            game_index = state.court_game_index.get(result['court'], 0) if result['court'] in advance_courts else 0
+            report = court_report(state, result['court'], game_index)
+            if report is not None:
+                score1, score2 = report['score']
+                raise ScoreConflict(f"Court {result['court']} was already scored {score1}-{score2}")
+        event = log.record(state, 'score_entered', round=state.current_round, results=results,
+                           expected_courts=expected_courts, advance_courts=list(advance_courts))
+        if depends_on_results(state):
+            prefetch_next_round(state)
+        return event
@@ -0,0 +1,108 @@
+# Continuous court dispatch - no rounds: a court that reports its score gets the next foursome from the waiting queue
+
+from itertools import combinations
+
+from .balance import SPLITS
+from .matching import PARTNER_WEIGHT, OPPONENT_WEIGHT, record_round_history
+
+# state.play_mode: whole rounds, or each court refilled as soon as it frees up
+PLAY_MODES = ["Rounds", "Continuous"]
+# Rotating-partner formats that can run continuously
+CONTINUOUS_FORMATS = ["Classic Round Robin", "Popcorn"]
+
+# How far down the queue the dispatcher looks for a fresher foursome
+DISPATCH_WINDOW = 8
+# Cost of calling a player ahead of someone who has waited longer, per queue place skipped,
+# in the same units as matching's partner and opponent weights
+QUEUE_SKIP_WEIGHT = 3
+
+
+def continuous_play(state):
+    """True when courts are refilled one at a time instead of a whole round at once"""
+    return (state.play_mode == "Continuous" and state.format_choice in CONTINUOUS_FORMATS
+            and not state.active_fixed_partners())
+
+def pick_game(candidates, history):
+    """(team1, team2) from the front of the queue, or None if fewer than four are waiting.
+
+    The player at the front always plays; the other three and the team split are chosen
+    to avoid repeat partners and opponents, weighed against how far down the queue we reach.
+    """
+    if len(candidates) < 4:
+        return None
+
+    best = None
+    for rest in combinations(range(1, len(candidates)), 3):
+        four = [candidates[0]] + [candidates[i] for i in rest]
+        # Positions 1, 2, 3 skip nobody
+        skip_cost = QUEUE_SKIP_WEIGHT * (sum(rest) - 6)
+        for a, b, c, d in SPLITS:
+            p, q, r, s = four[a], four[b], four[c], four[d]
+            cost = skip_cost + PARTNER_WEIGHT * (history.partnered(p, q) + history.partnered(r, s))
+            cost += OPPONENT_WEIGHT * sum(history.opponent_count(x, y) for x in (p, q) for y in (r, s))
+            if best is None or cost < best[0]:
+                best = (cost, [p, q], [r, s])
+    return best[1], best[2]
+
+def dispatch_courts(state, court):
+    """Refill a court whose game just finished, then any empty courts, from the waiting queue.
+
+    The queue runs fewest games played first, then longest wait, so newly checked-in players
+    go on quickly. Players coming off the court rest while at least four others are waiting,
+    and otherwise whoever of them has played least goes back on. A court stays empty
+    when too few players are free, and is filled the next time any court finishes.
+    Returns the data for a 'court_dispatched' event - it doesn't change the state.
+    """
+    active = state.active_players()
+    active_set = set(active)
+    games_left = [g for g in state.current_games if g['court'] != court]
+    busy = {p for g in games_left for p in g['team1'] + g['team2']}
+    just_off = [p for g in state.current_games if g['court'] == court for p in g['team1'] + g['team2']
+                if p in active_set]
+
+    queue = []
+    queued = set(just_off) | busy
+    for p in state.sitting_out + active:
+        if p in active_set and p not in queued:
+            queue.append(p)
+            queued.add(p)
+
+    # Fewest games first, longest wait within that - so players on fast courts don't pull ahead
+    games_played = lambda p: state.scores[p]['games_played'] if p in state.scores else 0
+    queue.sort(key=games_played)
+    just_off.sort(key=games_played)
+
+    occupied = {g['court'] for g in games_left}
+    open_courts = [court] if court <= state.num_courts else []
+    open_courts += [c for c in range(1, state.num_courts + 1) if c != court and c not in occupied]
+
+    games = []
+    for c in open_courts:
+        candidates = queue if len(queue) >= 4 else queue + just_off
+        teams = pick_game(candidates[:DISPATCH_WINDOW], state.history)
+        if teams is None:
+            break
+        team1, team2 = teams
+        playing = set(team1 + team2)
+        queue = [p for p in queue if p not in playing]
+        just_off = [p for p in just_off if p not in playing]
+        games.append({
+            'court': c,
+            'team1': team1,
+            'team2': team2,
+            'game': state.court_game_index.get(c, -1) + 1
+        })
+
+    return {'freed': [court], 'games': games, 'waiting': queue + just_off}
+
+def apply_dispatch(state, event):
+    """Reducer for a 'court_dispatched' event: new games on courts, and the queue behind them"""
+    changed = set(event['freed']) | {g['court'] for g in event['games']}
+    games = [g for g in state.current_games if g['court'] not in changed] + event['games']
+    state.current_games = sorted(games, key=lambda g: g['court'])
+    state.sitting_out = list(event['waiting'])
+    for game in event['games']:
+        state.court_game_index[game['court']] = game['game']
+    state.ensure_player_stats([p for g in event['games'] for p in g['team1'] + g['team2']])
+    # Partner and opponent history only - in continuous play nobody is benched for a round
+    record_round_history(event['games'], [], state.history, state.sit_out_counts)
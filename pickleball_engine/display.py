@@ -0,0 +1,109 @@
+# Court and standings view models - what the organizer's play page and the ?view= spectator
+# screen show, built from the state once per event version
+
+from html import escape
+
+from .court_games import court_game_count
+from .court_scores import FIXED_PAIR_COURT_GAMES, current_court_game, court_report, group_repeats
+from .dispatch import continuous_play
+
+# Standings rows shown on the display
+DISPLAY_STANDINGS_ROWS = 10
+
+
+def court_view(state, court):
+    """One court's card: its current game, where it is in the court's games, and the score once reported"""
+    view = {'court': court, 'players': None, 'pairs': None, 'games': None}
+    for group in state.court_groups:
+        if group['court'] == court:
+            if 'players' in group:
+                view['players'] = list(group['players'])
+                view['games'] = court_game_count(group['players'], group_repeats(state))
+            else:
+                view['pairs'] = [list(pair) for pair in group['pairs']]
+                view['games'] = FIXED_PAIR_COURT_GAMES
+
+    current = current_court_game(state, court)
+    if current is None:
+        view.update(done=True, game_index=None, game=None, team1=None, team2=None, score=None)
+        return view
+    game_index, game = current
+    report = court_report(state, court, game_index)
+    view.update(
+        done=False,
+        game_index=game_index,
+        # Only groups and continuous play have more than one game per court
+        game=game_index + 1 if state.court_groups or continuous_play(state) else None,
+        team1=list(game['team1']),
+        team2=list(game['team2']),
+        score=report['score'] if report else None
+    )
+    return view
+
+def bench_view(state):
+    """Who isn't on a court right now, and what to call them"""
+    title = "🪑 Waiting for a Court" if continuous_play(state) else "🪑 Sitting Out This Round"
+    return {'title': title, 'players': list(state.sitting_out) if state.current_games or state.court_groups else []}
+
+def standings_view(state, limit=None):
+    """Standings rows under the chosen tiebreaks, with each player's rating"""
+    rows = state.standings.rows(limit)
+    for row in rows:
+        row['Rating'] = round(state.ratings.rating(row['Player']))
+    return rows
+
+def build_board(state, standings_rows=DISPLAY_STANDINGS_ROWS):
+    """What the display shows: each court's current game (and score, once reported), who's sitting, top standings"""
+    courts = [court_view(state, court)
+              for court in sorted({g['court'] for g in state.current_games or state.court_groups})]
+    return {
+        'round': state.current_round,
+        'format': state.format_choice,
+        'courts': courts,
+        'sitting_out': bench_view(state)['players'],
+        'standings': standings_view(state, standings_rows)
+    }
+
+def render_board_html(board, event_name=""):
+    """The board as one self-contained HTML block (player names escaped)"""
+    parts = [f"<h2 style='margin: 0 0 12px 0;'>{escape(event_name)} - Round {board['round']}</h2>"]
+
+    parts.append("<div style='display: flex; flex-wrap: wrap; gap: 12px;'>")
+    for court in board['courts']:
+        title = f"COURT {court['court']}"
+        if court['done']:
+            body = "<p style='margin: 8px 0 0 0;'>✅ Court complete</p>"
+        else:
+            if court['game']:
+                title += f" · Game {court['game']}"
+            team1 = " &amp; ".join(escape(p) for p in court['team1'])
+            team2 = " &amp; ".join(escape(p) for p in court['team2'])
+            score = f"<b>{court['score'][0]} – {court['score'][1]}</b>" if court['score'] else "vs"
+            body = (f"<p style='margin: 8px 0 0 0; font-size: 18px;'>{team1}</p>"
+                    f"<p style='margin: 4px 0; text-align: center;'>{score}</p>"
+                    f"<p style='margin: 0; font-size: 18px;'>{team2}</p>")
+        parts.append(
+            "<div style='flex: 1 1 260px; background-color: #E3F2FD; padding: 14px; border-radius: 8px; "
+            "border: 2px solid #64B5F6;'>"
+            f"<h3 style='margin: 0; color: #1976D2;'>{title}</h3>{body}</div>"
+        )
+    parts.append("</div>")
+
+    if board['sitting_out']:
+        parts.append(f"<p style='margin-top: 12px;'>🪑 <b>Sitting out:</b> {escape(', '.join(board['sitting_out']))}</p>")
+
+    if board['standings']:
+        parts.append("<h3 style='margin-top: 20px;'>🏆 Standings</h3>")
+        parts.append("<table style='width: 100%; border-collapse: collapse;'>")
+        parts.append("<tr><th align='left'>#</th><th align='left'>Player</th><th>W</th><th>L</th>"
+                     "<th>Win %</th><th>Diff</th><th>Rating</th></tr>")
+        for row in board['standings']:
+            parts.append(
+                f"<tr><td>{row['Rank']}</td><td>{escape(row['Player'])}</td>"
+                f"<td align='center'>{row['Wins']}</td><td align='center'>{row['Losses']}</td>"
+                f"<td align='center'>{row['Win %']}</td><td align='center'>{row['Point Diff']}</td>"
+                f"<td align='center'>{row['Rating']}</td></tr>"
+            )
+        parts.append("</table>")
+
+    return "".join(parts)
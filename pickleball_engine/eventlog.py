@@ -0,0 +1,291 @@
+# Event log - every tournament action is an append-only event, and state is rebuilt by replaying it
+
+import copy
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows - fall back to the in-process lock only
+    fcntl = None
+
+from .rounds import build_round, apply_round
+from .prefetch import prefetch_next_round, take_prefetched_round
+from .court_scores import apply_court_score, record_court_results
+from .dispatch import apply_dispatch
+from .utilization import restart_courts, start_court, track_scored_courts
+from .schedule import SessionSchedule
+from .state import TournamentState
+from .storage import get_data_dir
+
+# Take a snapshot of the state every this many events so recovery doesn't replay from scratch
+SNAPSHOT_INTERVAL = 100
+
+# Settings carried on every round_generated event so replay schedules with the same options
+ROUND_SETTINGS = ('num_courts', 'num_rounds', 'format_choice', 'partner_mode', 'pairing_mode', 'play_mode',
+                  'fixed_partners', 'gender_assignments')
+# Everything the organizer sets, logged by 'settings' events so a rebuilt event keeps it
+SETTINGS = ROUND_SETTINGS + ('players_on_break', 'tiebreaks')
+
+
+def get_setting(state, name):
+    if name == 'tiebreaks':
+        return list(state.standings.tiebreaks)
+    return getattr(state, name)
+
+def current_settings(state):
+    """Every organizer setting, as a 'settings' event carries them"""
+    return {name: get_setting(state, name) for name in SETTINGS}
+
+def apply_settings(state, settings):
+    for name, value in settings.items():
+        if name == 'tiebreaks':
+            if tuple(value) != state.standings.tiebreaks:
+                state.set_tiebreaks(tuple(value))
+        else:
+            setattr(state, name, value)
+
+
+def apply_event(state, event):
+    """Reducer: apply one event to the state"""
+    kind = event['type']
+    
+    if kind == 'check_in':
+        if event['player'] not in state.players:
+            state.players.append(event['player'])
+    
+    elif kind == 'settings':
+        apply_settings(state, event['settings'])
+    
+    elif kind == 'round_generated':
+        apply_settings(state, event['settings'])
+        state.current_round = event['round']
+        round_data = dict(event['round_data'])
+        # JSON turns integer court numbers into strings
+        for name in ('court_game_index', 'court_points'):
+            if name in round_data:
+                round_data[name] = {int(c): v for c, v in round_data[name].items()}
+        apply_round(state, round_data)
+        if 'schedule' in event:
+            state.schedule = SessionSchedule.from_dict(event['schedule'])
+        restart_courts(state, {g['court'] for g in state.current_games or state.court_groups}, event.get('at'))
+    
+    elif kind == 'score_entered':
+        advance_courts = event.get('advance_courts', [])
+        game_indexes = {court: state.court_game_index.get(court, 0) for court in advance_courts}
+        record_court_results(state, event['results'], event['round'], game_indexes, f"event-{event['seq']}",
+                             expected_courts=event.get('expected_courts'))
+        for court in advance_courts:
+            state.court_game_index[court] = state.court_game_index.get(court, 0) + 1
+        track_scored_courts(state, [r['court'] for r in event['results']], event.get('at'))
+    
+    elif kind == 'court_score':
+        apply_court_score(state, event)
+        track_scored_courts(state, [event['court']], event.get('at'))
+    
+    elif kind == 'court_dispatched':
+        apply_dispatch(state, event)
+        for game in event['games']:
+            start_court(state, game['court'], event.get('at'))
+    
+    elif kind == 'replacement':
+        state.rename_player(event['old_name'], event['new_name'])
+    
+    elif kind == 'removal':
+        state.remove_player(event['player'])
+    
+    elif kind == 'reset':
+        state.reset()
+    
+    else:
+        raise ValueError(f"Unknown event type: {kind}")
+
+
+class EventLog:
+    """Append-only tournament log, optionally persisted as JSON lines with a snapshot file"""
+
+    def __init__(self, path=None, snapshot_interval=SNAPSHOT_INTERVAL):
+        self.path = Path(path) if path else None
+        self.snapshot_interval = snapshot_interval
+        self.events = []        # events newer than `loaded_from` (every event for an in-memory log)
+        self.loaded_from = 0
+        self.snapshot = None    # {'seq', 'offset', 'state'}
+        self.seq = 0
+        self.offset = 0         # byte size of the log file
+        # Several sessions (and server processes) may write to one event's log
+        self._lock = threading.RLock()
+        self._lock_file = None
+        self._lock_depth = 0
+        
+        if self.path:
+            self._load()
+
+    @property
+    def snapshot_path(self):
+        return self.path.with_name(self.path.name + '.snapshot')
+
+    @property
+    def lock_path(self):
+        return self.path.with_name(self.path.name + '.lock')
+
+    @contextmanager
+    def exclusive(self, state):
+        """Hold the log for writing, with `state` first caught up on events other processes appended.
+
+        Re-entrant, so record() can be called inside it (e.g. by start_round).
+        """
+        with self._lock:
+            if self._lock_depth == 0 and self.path and fcntl is not None:
+                self._lock_file = open(self.lock_path, 'w')
+                fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+            self._lock_depth += 1
+            try:
+                self.catch_up(state)
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0 and self._lock_file is not None:
+                    fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+                    self._lock_file.close()
+                    self._lock_file = None
+
+    def catch_up(self, state):
+        """Apply events another process appended since we last read the file. Returns how many."""
+        if not self.path:
+            return 0
+        with self._lock:
+            try:
+                if os.path.getsize(self.path) <= self.offset:
+                    return 0
+            except FileNotFoundError:
+                return 0
+            applied = 0
+            with open(self.path, 'rb') as f:
+                f.seek(self.offset)
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break   # still being written
+                    self.offset += len(line)
+                    if not line.strip():
+                        continue
+                    event = json.loads(line)
+                    if event['seq'] <= self.seq:
+                        continue
+                    apply_event(state, event)
+                    self.events.append(event)
+                    self.seq = event['seq']
+                    applied += 1
+            return applied
+
+    def _load(self):
+        """Read the latest snapshot and only the log lines written after it"""
+        if self.snapshot_path.exists():
+            with open(self.snapshot_path, 'r') as f:
+                self.snapshot = json.load(f)
+            self.seq = self.loaded_from = self.snapshot['seq']
+            self.offset = self.snapshot['offset']
+        
+        if self.path.exists():
+            with open(self.path, 'rb') as f:
+                f.seek(self.offset)
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break   # still being written - catch_up reads it once it's complete
+                    self.offset += len(line)
+                    if line.strip():
+                        event = json.loads(line)
+                        self.events.append(event)
+                        self.seq = event['seq']
+
+    def record(self, state, event_type, **data):
+        """Apply an action to the state and append it to the log.
+
+        If applying fails (e.g. a ScoreError), nothing is appended.
+        """
+        with self.exclusive(state):
+            event = {'seq': self.seq + 1, 'type': event_type, 'at': datetime.now().isoformat(), **data}
+            line = (json.dumps(event) + '\n').encode('utf-8')
+            
+            apply_event(state, event)
+            
+            self.seq = event['seq']
+            self.events.append(event)
+            if self.path:
+                with open(self.path, 'ab') as f:
+                    f.write(line)
+                self.offset += len(line)
+            
+            if self.seq % self.snapshot_interval == 0:
+                self.take_snapshot(state)
+        return event
+
+    def take_snapshot(self, state):
+        self.snapshot = {'seq': self.seq, 'offset': self.offset, 'state': state.to_dict()}
+        if self.path:
+            tmp_path = self.snapshot_path.with_name(f"{self.snapshot_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump(self.snapshot, f)
+            os.replace(tmp_path, self.snapshot_path)
+            # Replay starts from the snapshot now, so a long-lived log needn't keep older events
+            self.events = []
+            self.loaded_from = self.seq
+
+    def replay(self):
+        """Rebuild the current state from the latest snapshot plus the events after it"""
+        if self.snapshot:
+            state = TournamentState.from_dict(self.snapshot['state'])
+            start = self.snapshot['seq']
+        else:
+            state = TournamentState()
+            start = 0
+        
+        for event in self.events:
+            if event['seq'] > start:
+                apply_event(state, event)
+        return state
+
+
+def open_event_log(event_code):
+    """The persisted log for an event code"""
+    return EventLog(get_data_dir() / f"{event_code}.log.jsonl")
+
+def start_round(state, log, round_number):
+    """Generate the next round and log it - usually already built in the background - then start on the one after"""
+    with log.exclusive(state):
+        state.current_round = round_number
+        schedule = state.schedule
+        round_data = take_prefetched_round(state, round_number)
+        if round_data is None:
+            round_data = build_round(state)
+        settings = {name: getattr(state, name) for name in ROUND_SETTINGS}
+        plan = {}
+        if state.schedule is not None and state.schedule is not schedule:
+            # A new or re-made session plan goes in the log, so a replay serves the rounds after this one from it too
+            plan['schedule'] = state.schedule.to_dict()
+        event = log.record(state, 'round_generated', round=round_number, settings=settings, round_data=round_data,
+                           **plan)
+        prefetch_next_round(state)
+        return event
+
+def save_settings(state, log, **settings):
+    """Change organizer settings (see SETTINGS) through the log, so a replay gets them back.
+
+    Only values that differ from the state's are logged. Returns the event, or None if nothing changed.
+    """
+    unknown = set(settings) - set(SETTINGS)
+    if unknown:
+        raise ValueError(f"Not a setting: {', '.join(sorted(unknown))}")
+    with log.exclusive(state):
+        changed = {}
+        for name, value in settings.items():
+            if name == 'tiebreaks':
+                value = list(value)
+            if value != get_setting(state, name):
+                changed[name] = copy.deepcopy(value)
+        if not changed:
+            return None
+        return log.record(state, 'settings', settings=changed)
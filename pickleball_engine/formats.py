@@ -0,0 +1,269 @@
+# Scheduling functions for every tournament format
+
+import random
+
+from .seeding import Seeding
+from .sitouts import choose_sitters, pair_sit_out_count
+
+
+def fixed_pairs(players, fixed_partners):
+    """Unique (player, partner) pairs from the two-way fixed_partners map, both present in players"""
+    present = set(players)
+    pairs = []
+    seen = set()
+    for p in players:
+        partner = fixed_partners.get(p)
+        if partner in present and p not in seen:
+            pairs.append((p, partner))
+            seen.update((p, partner))
+    return pairs
+
+def split_into_courts(players, num_courts, sit_out_counts=None, rng=None):
+    """Court groups of at least four, in player order, the last court taking any extra players.
+
+    When there aren't enough players for every court, the few left over sit out by the
+    shared rotation. Returns (groups, sitting).
+    """
+    courts_used = min(num_courts, len(players) // 4)
+    players_per_round = len(players) if courts_used == num_courts else courts_used * 4
+    playing, sitting = choose_sitters(players, players_per_round, sit_out_counts, rng)
+    
+    groups = []
+    players_per_court = len(playing) // courts_used if courts_used else 0
+    for i in range(courts_used):
+        start = i * players_per_court
+        if i == courts_used - 1:
+            court_players = playing[start:]
+        else:
+            court_players = playing[start:start + players_per_court]
+        groups.append({
+            'court': i + 1,
+            'players': court_players
+        })
+    
+    return groups, sitting
+
+def create_classic_round_robin_matchups(players, num_courts, history, sit_out_counts=None, rng=None):
+    """Classic Round Robin"""
+    rng = rng or random
+    def get_unpartnered_pair(available_players):
+        if len(available_players) < 2:
+            return None
+            
+        for i, p1 in enumerate(available_players):
+            for p2 in available_players[i+1:]:
+                if not history.partnered(p1, p2):
+                    return (p1, p2)
+        return (available_players[0], available_players[1])
+    
+    players_per_round = min(num_courts, len(players) // 4) * 4
+    playing, sitting = choose_sitters(players, players_per_round, sit_out_counts, rng)
+    rng.shuffle(playing)
+    
+    games = []
+    used_players = set()
+    
+    for court in range(num_courts):
+        available = [p for p in playing if p not in used_players]
+        if len(available) < 4:
+            break
+            
+        pair1 = get_unpartnered_pair(available)
+        if not pair1:
+            break
+            
+        used_players.add(pair1[0])
+        used_players.add(pair1[1])
+        
+        available = [p for p in playing if p not in used_players]
+        pair2 = get_unpartnered_pair(available)
+        if not pair2:
+            break
+            
+        used_players.add(pair2[0])
+        used_players.add(pair2[1])
+        
+        games.append({
+            'court': court + 1,
+            'team1': [pair1[0], pair1[1]],
+            'team2': [pair2[0], pair2[1]]
+        })
+    
+    return games, sitting
+
+def create_popcorn_matchups(players, num_courts, fixed_partners=None, rng=None, sit_out_counts=None):
+    """Popcorn: Random matchups"""
+    rng = rng or random
+    if fixed_partners:
+        pairs = fixed_pairs(players, fixed_partners)
+        pairs_per_round = min(num_courts, len(pairs) // 2) * 2
+        available_pairs, sitting_pairs = choose_sitters(
+            pairs, pairs_per_round, rng=rng, count_of=pair_sit_out_count(sit_out_counts or {})
+        )
+        rng.shuffle(available_pairs)
+        
+        games = []
+        for i in range(0, len(available_pairs) - 1, 2):
+            if i + 1 < len(available_pairs):
+                pair1 = available_pairs[i]
+                pair2 = available_pairs[i + 1]
+                
+                if len(games) < num_courts:
+                    games.append({
+                        'court': len(games) + 1,
+                        'team1': [pair1[0], pair1[1]],
+                        'team2': [pair2[0], pair2[1]]
+                    })
+        
+        sitting_out = [p for pair in sitting_pairs for p in pair]
+        
+        return games, sitting_out
+    else:
+        players_per_round = min(num_courts, len(players) // 4) * 4
+        playing, sitting = choose_sitters(players, players_per_round, sit_out_counts, rng)
+        rng.shuffle(playing)
+        
+        games = []
+        for i in range(0, len(playing), 4):
+            if i + 3 < len(playing):
+                four = playing[i:i+4]
+                games.append({
+                    'court': (i // 4) + 1,
+                    'team1': [four[0], four[1]],
+                    'team2': [four[2], four[3]]
+                })
+        
+        return games, sitting
+
+def create_gauntlet_matchups(players, num_courts, scores, fixed_partners=None, sit_out_counts=None,
+                             seeding=None, rng=None):
+    """Gauntlet: Winners face harder opponents"""
+    rng = rng or random
+    seeding = seeding or Seeding(players, scores)
+    sorted_players = seeding.ranked
+    
+    if fixed_partners:
+        pair_count = pair_sit_out_count(sit_out_counts or {})
+        pair_rankings = []
+        processed = set()
+        
+        for player in sorted_players:
+            if player not in processed and player in fixed_partners:
+                partner = fixed_partners[player]
+                pair_rankings.append(([player, partner], seeding.pair_strength((player, partner))))
+                processed.add(player)
+                processed.add(partner)
+        
+        pair_rankings.sort(key=lambda x: x[1], reverse=True)
+        
+        # Bench whole pairs by sit-out count; the rest keep their ranking order
+        pairs_per_round = min(num_courts, len(pair_rankings) // 2) * 2
+        pair_rankings, sitting_pairs = choose_sitters(
+            pair_rankings, pairs_per_round, rng=rng, count_of=lambda ranked: pair_count(ranked[0])
+        )
+        
+        games = []
+        for i in range(0, len(pair_rankings) - 1, 2):
+            if i + 1 < len(pair_rankings) and len(games) < num_courts:
+                games.append({
+                    'court': len(games) + 1,
+                    'team1': pair_rankings[i][0],
+                    'team2': pair_rankings[i + 1][0]
+                })
+        
+        sitting_out = [p for pair, _ in sitting_pairs for p in pair]
+        
+        return games, sitting_out
+    else:
+        players_per_round = min(num_courts, len(sorted_players) // 4) * 4
+        playing, sitting = choose_sitters(sorted_players, players_per_round, sit_out_counts, rng)
+        rng.shuffle(playing)
+        
+        games = []
+        for i in range(0, len(playing), 4):
+            if i + 3 < len(playing):
+                four = playing[i:i+4]
+                games.append({
+                    'court': (i // 4) + 1,
+                    'team1': [four[0], four[1]],
+                    'team2': [four[2], four[3]]
+                })
+        
+        return games, sitting
+
+def create_up_down_river_groups(players, num_courts, scores, fixed_partners=None, seeding=None, sit_out_counts=None,
+                                rng=None):
+    """Up & Down: Players seeded to courts"""
+    seeding = seeding or Seeding(players, scores)
+    sorted_players = seeding.ranked
+    
+    if fixed_partners:
+        pair_groups = []
+        processed = set()
+        
+        for player in sorted_players:
+            if player not in processed and player in fixed_partners:
+                partner = fixed_partners[player]
+                pair_groups.append([player, partner])
+                processed.add(player)
+                processed.add(partner)
+        
+        # Bench whole pairs by sit-out count; the rest keep their seeding order
+        pairs_per_round = min(num_courts, len(pair_groups) // 2) * 2
+        pair_groups, sitting_pairs = choose_sitters(
+            pair_groups, pairs_per_round, rng=rng, count_of=pair_sit_out_count(sit_out_counts or {})
+        )
+        
+        court_assignments = []
+        for i in range(0, len(pair_groups), 2):
+            if i + 1 < len(pair_groups) and len(court_assignments) < num_courts:
+                court_assignments.append({
+                    'court': len(court_assignments) + 1,
+                    'pairs': [pair_groups[i], pair_groups[i + 1]]
+                })
+        
+        sitting_out = [p for pair in sitting_pairs for p in pair]
+        
+        return court_assignments, sitting_out
+    else:
+        return split_into_courts(sorted_players, num_courts, sit_out_counts, rng)
+
+def create_scramble_groups(players, num_courts, rng=None, sit_out_counts=None):
+    """Scramble: Random groups stay on court"""
+    rng = rng or random
+    shuffled = players.copy()
+    rng.shuffle(shuffled)
+    
+    return split_into_courts(shuffled, num_courts, sit_out_counts, rng)
+
+def create_mixed_madness_matchups(players, num_courts, gender_dict, sit_out_counts=None, rng=None):
+    """Mixed Madness: Random mixed doubles"""
+    rng = rng or random
+    males = [p for p in players if gender_dict.get(p) == 'M']
+    females = [p for p in players if gender_dict.get(p) == 'F']
+    
+    # Each court takes two men and two women; bench each side by sit-out count
+    pairs_per_round = min(num_courts, min(len(males), len(females)) // 2) * 2
+    males, sitting_males = choose_sitters(males, pairs_per_round, sit_out_counts, rng)
+    females, sitting_females = choose_sitters(females, pairs_per_round, sit_out_counts, rng)
+    
+    rng.shuffle(males)
+    rng.shuffle(females)
+    
+    games = []
+    for i in range(0, pairs_per_round, 2):
+        games.append({
+            'court': len(games) + 1,
+            'team1': [males[i], females[i]],
+            'team2': [males[i + 1], females[i + 1]]
+        })
+    
+    sitting_out = sitting_males + sitting_females
+    
+    return games, sitting_out
+
+def create_cream_crop_groups(players, num_courts, scores, seeding=None, sit_out_counts=None, rng=None):
+    """Cream of the Crop: Rising stars format"""
+    seeding = seeding or Seeding(players, scores)
+    
+    return split_into_courts(seeding.ranked, num_courts, sit_out_counts, rng)
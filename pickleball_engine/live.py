@@ -0,0 +1,135 @@
+# Live events - one shared tournament state per event code, cached for every session on this server
+
+import threading
+import time
+from collections import OrderedDict
+
+from .display import build_board, render_board_html, court_view, bench_view, standings_view
+from .eventlog import open_event_log
+from .storage import load_event_data
+
+# Most events kept in memory at once; the least recently used is dropped first
+LIVE_EVENT_LIMIT = 32
+# Events nobody has touched for this long are dropped too
+LIVE_EVENT_IDLE_SECONDS = 6 * 60 * 60
+
+
+class LiveEvent:
+    """A running tournament shared by every organizer and scorekeeper attached to its code.
+
+    The state is rebuilt from the event log once, then kept current: writes go through
+    the log (which serializes them and catches up on other processes' events first),
+    and refresh() picks up events appended elsewhere.
+    """
+
+    def __init__(self, event_code, state=None, log=None):
+        self.event_code = event_code
+        self.log = log or open_event_log(event_code)
+        self.state = state if state is not None else self.log.replay()
+        self.last_used = time.monotonic()
+        self._views = {}
+        self._view_lock = threading.Lock()
+
+    @property
+    def version(self):
+        """Sequence number of the last applied event - changes whenever the tournament does"""
+        return self.log.seq
+
+    def refresh(self):
+        """Catch up on events other server processes logged; cheap when there are none"""
+        self.last_used = time.monotonic()
+        return self.log.catch_up(self.state)
+
+    def view(self, key, build):
+        """build(state), cached under `key` until the event or its tiebreaks change -
+        so a view nobody asks for again is never rebuilt"""
+        self.last_used = time.monotonic()
+        with self._view_lock:
+            stamp = (self.version, self.state.standings.tiebreaks)
+            cached = self._views.get(key)
+            if cached is None or cached[0] != stamp:
+                cached = (stamp, build(self.state))
+                self._views[key] = cached
+            return cached[1]
+
+    def display_html(self, event_name=""):
+        """Spectator render of the board, built once per event version however many screens are watching"""
+        return self.view(('display', event_name), lambda state: render_board_html(build_board(state), event_name))
+
+    def court_view(self, court):
+        """One court's card for the play page - other courts' cards aren't rebuilt to get it"""
+        return self.view(('court', court), lambda state: court_view(state, court))
+
+    def bench_view(self):
+        return self.view('bench', bench_view)
+
+    def standings_view(self):
+        return self.view('standings', standings_view)
+
+    def record(self, event_type, **data):
+        self.last_used = time.monotonic()
+        return self.log.record(self.state, event_type, **data)
+
+
+class EventCache:
+    """LRU of live events by code, with idle eviction.
+
+    An evicted event is only dropped from the cache; sessions still holding it keep
+    working, and the next lookup rebuilds it from its snapshot and log.
+    """
+
+    def __init__(self, limit=LIVE_EVENT_LIMIT, idle_seconds=LIVE_EVENT_IDLE_SECONDS):
+        self.limit = limit
+        self.idle_seconds = idle_seconds
+        self.events = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, event_code, state=None):
+        """The live event for a code, loading it on first use.
+
+        `state` seeds a brand-new event (one whose log is still empty). Returns None
+        for a code with no saved event.
+        """
+        with self._lock:
+            live = self.events.get(event_code)
+            if live is not None:
+                self.events.move_to_end(event_code)
+
+        if live is None:
+            if load_event_data(event_code) is None:
+                return None
+            # Load outside the cache lock so one slow replay doesn't block other events
+            log = open_event_log(event_code)
+            loaded = LiveEvent(event_code, state if state is not None and log.seq == 0 else None, log)
+            with self._lock:
+                live = self.events.setdefault(event_code, loaded)
+                self.events.move_to_end(event_code)
+                self._evict()
+
+        live.refresh()
+        return live
+
+    def _evict(self):
+        cutoff = time.monotonic() - self.idle_seconds
+        for code in [c for c, live in self.events.items() if live.last_used < cutoff]:
+            del self.events[code]
+        while len(self.events) > self.limit:
+            self.events.popitem(last=False)
+
+    def discard(self, event_code):
+        with self._lock:
+            self.events.pop(event_code, None)
+
+    def clear(self):
+        with self._lock:
+            self.events.clear()
+
+
+_cache = EventCache()
+
+def get_live_event(event_code, state=None):
+    """Attach to an event from the server-wide cache (see EventCache.get)"""
+    return _cache.get(event_code, state)
+
+def get_event_cache():
+    return _cache
@@ -0,0 +1,154 @@
+# Optimizing round builder - local search over a partner/opponent/sit-out cost model
+
+import random
+import time
+
+from .registry import PairHistory, iter_bits
+from .sitouts import choose_sitters
+
+# Cost weights: repeating a partner is much worse than repeating an opponent,
+# and sitting someone who has already sat out is worse than either
+PARTNER_WEIGHT = 10
+OPPONENT_WEIGHT = 1
+SIT_OUT_WEIGHT = 25
+
+
+def build_cost_tables(players, history):
+    """Dense partner/opponent cost matrices indexed by position in players"""
+    ids = history.ids_for(players)
+    position = {player_id: i for i, player_id in enumerate(ids) if player_id is not None}
+    n = len(players)
+    partner_cost = [[0] * n for _ in range(n)]
+    opponent_cost = [[0] * n for _ in range(n)]
+    
+    # Walk only the set bits, so the cost is the number of pairings, not n squared
+    for i, player_id in enumerate(ids):
+        if player_id is None:
+            continue
+        for j in iter_bits(history.partner_bits[player_id]):
+            if j in position:
+                partner_cost[i][position[j]] = PARTNER_WEIGHT
+        counts = history.opponent_counts[player_id]
+        for j in iter_bits(history.opponent_bits[player_id]):
+            if j in position:
+                opponent_cost[i][position[j]] = OPPONENT_WEIGHT * counts[j]
+    
+    return partner_cost, opponent_cost
+
+def court_cost(slots, court, partner_cost, opponent_cost):
+    """Cost of one court: slots[4c:4c+4] is team1 (a, b) vs team2 (c, d)"""
+    base = court * 4
+    a, b, c, d = slots[base], slots[base + 1], slots[base + 2], slots[base + 3]
+    return (
+        partner_cost[a][b] + partner_cost[c][d] +
+        opponent_cost[a][c] + opponent_cost[a][d] +
+        opponent_cost[b][c] + opponent_cost[b][d]
+    )
+
+def create_optimized_round(players, num_courts, history=None, sit_out_counts=None, time_budget=0.2, rng=None):
+    """Build a whole round by local search, minimizing repeat partners, repeat opponents and unfair sit-outs.
+
+    Returns (games, sitting) in the same shape as the other create_* functions.
+    """
+    history = history or PairHistory()
+    sit_out_counts = sit_out_counts or {}
+    rng = rng or random
+    
+    num_players = len(players)
+    courts_used = min(num_courts, num_players // 4)
+    if courts_used == 0:
+        return [], list(players)
+    playing_count = courts_used * 4
+    
+    partner_cost, opponent_cost = build_cost_tables(players, history)
+    sit_cost = [SIT_OUT_WEIGHT * sit_out_counts.get(p, 0) for p in players]
+    
+    # Start with the fewest previous sit-outs on the bench, random within ties
+    playing_idx, sitting_idx = choose_sitters(list(range(num_players)), playing_count, rng=rng,
+                                              count_of=lambda i: sit_cost[i])
+    rng.shuffle(playing_idx)
+    slots = playing_idx + sitting_idx
+    
+    court_costs = [court_cost(slots, c, partner_cost, opponent_cost) for c in range(courts_used)]
+    
+    deadline = time.perf_counter() + time_budget
+    iterations = 0
+    stale = 0
+    # Stop early once many consecutive swaps fail to help
+    stale_limit = 200 + 50 * num_players
+    
+    while stale < stale_limit:
+        iterations += 1
+        if iterations % 256 == 0 and time.perf_counter() > deadline:
+            break
+        
+        i = rng.randrange(playing_count)
+        j = rng.randrange(num_players)
+        ci = i // 4
+        cj = j // 4
+        if ci == cj and (i % 4) // 2 == (j % 4) // 2:
+            # Same team - swapping changes nothing
+            stale += 1
+            continue
+        
+        if j >= playing_count:
+            # Swap a player onto the bench - only for an equal sit-out count,
+            # so the bench stays on the fewest sit-outs and the spread stays at most 1
+            if sit_cost[slots[i]] != sit_cost[slots[j]]:
+                stale += 1
+                continue
+            before = court_costs[ci] + sit_cost[slots[j]]
+            slots[i], slots[j] = slots[j], slots[i]
+            new_ci = court_cost(slots, ci, partner_cost, opponent_cost)
+            after = new_ci + sit_cost[slots[j]]
+            if after <= before:
+                court_costs[ci] = new_ci
+                stale = stale + 1 if after == before else 0
+            else:
+                slots[i], slots[j] = slots[j], slots[i]
+                stale += 1
+        elif ci == cj:
+            before = court_costs[ci]
+            slots[i], slots[j] = slots[j], slots[i]
+            after = court_cost(slots, ci, partner_cost, opponent_cost)
+            if after <= before:
+                court_costs[ci] = after
+                stale = stale + 1 if after == before else 0
+            else:
+                slots[i], slots[j] = slots[j], slots[i]
+                stale += 1
+        else:
+            before = court_costs[ci] + court_costs[cj]
+            slots[i], slots[j] = slots[j], slots[i]
+            new_ci = court_cost(slots, ci, partner_cost, opponent_cost)
+            new_cj = court_cost(slots, cj, partner_cost, opponent_cost)
+            after = new_ci + new_cj
+            if after <= before:
+                court_costs[ci] = new_ci
+                court_costs[cj] = new_cj
+                stale = stale + 1 if after == before else 0
+            else:
+                slots[i], slots[j] = slots[j], slots[i]
+                stale += 1
+    
+    games = []
+    for c in range(courts_used):
+        base = c * 4
+        games.append({
+            'court': c + 1,
+            'team1': [players[slots[base]], players[slots[base + 1]]],
+            'team2': [players[slots[base + 2]], players[slots[base + 3]]]
+        })
+    sitting = [players[i] for i in slots[playing_count:]]
+    
+    return games, sitting
+
+def record_round_history(games, sitting, history, sit_out_counts):
+    """Update partner, opponent and sit-out history after a round is generated"""
+    for game in games:
+        history.record_game(game['team1'], game['team2'])
+        for p in game['team1'] + game['team2']:
+            sit_out_counts.setdefault(p, 0)
+    
+    for p in sitting:
+        sit_out_counts[p] = sit_out_counts.get(p, 0) + 1
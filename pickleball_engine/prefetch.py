@@ -0,0 +1,126 @@
+# Next-round prefetch - build the next round in the background while the current one is played,
+# so "Next Round" only has to check (or patch) work that's already done
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .dispatch import continuous_play
+from .rounds import SEEDED_FORMATS, BALANCED_FORMATS, build_round
+from .sitouts import bench_order, fair_bench
+
+# Background threads building speculative rounds, shared by every event on the server
+PREFETCH_WORKERS = 2
+
+_executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix="round-prefetch")
+
+
+def depends_on_results(state):
+    """True if the next round is built from scores or ratings, so each new result changes it"""
+    if state.format_choice in SEEDED_FORMATS:
+        return True
+    return (state.pairing_mode == "Balanced" and state.format_choice in BALANCED_FORMATS
+            and not state.active_fixed_partners())
+
+def round_inputs(state, round_number):
+    """Everything build_round reads except who's taking a break.
+
+    History and sit-out counts only change when a round is generated, so the round
+    number stands in for them; results count only for formats seeded by results.
+    """
+    return (
+        round_number,
+        tuple(state.players),
+        state.num_courts,
+        state.num_rounds,
+        state.format_choice,
+        state.partner_mode,
+        state.pairing_mode,
+        state.play_mode,
+        tuple(sorted(state.fixed_partners.items())),
+        tuple(sorted(state.gender_assignments.items())),
+        len(state.game_scores) if depends_on_results(state) else None
+    )
+
+def _speculate(snapshot, round_number):
+    snapshot.current_round = round_number
+    round_data = build_round(snapshot)
+    return round_data, snapshot.schedule
+
+def prefetch_next_round(state):
+    """Start building round current_round + 1 from a snapshot of the state.
+
+    Breaks are picked just before each round, so the speculative round has everyone
+    available and take_prefetched_round takes out whoever is on a break by then.
+    Call it with the state quiet (e.g. under the event log's lock); it returns at once.
+    A newer prefetch replaces an older one.
+    """
+    if state.current_round == 0 or state.format_choice is None or continuous_play(state):
+        return
+    round_number = state.current_round + 1
+    snapshot = type(state).from_dict(state.to_dict())
+    snapshot.schedule = state.schedule
+    snapshot.players_on_break = []
+    previous = state.prefetched
+    if previous is not None:
+        previous['future'].cancel()
+    state.prefetched = {
+        'inputs': round_inputs(state, round_number),
+        'future': _executor.submit(_speculate, snapshot, round_number)
+    }
+
+def repair_round(round_data, active_players, num_courts, sit_out_counts):
+    """Fit a round built for the whole roster to the players who aren't on a break.
+
+    Their spots go to benched players in bench_order, the same rule planned rounds use.
+    Returns None when that isn't enough - court groups, too few on the bench, enough
+    extra players to open another court, or a bench that's no longer fair_bench.
+    """
+    if round_data.get('court_groups') or 'sitting_out' not in round_data:
+        return None
+    active = set(active_players)
+    bench = bench_order([p for p in round_data['sitting_out'] if p in active], sit_out_counts)
+
+    games = []
+    for game in round_data['current_games']:
+        teams = []
+        for team in (game['team1'], game['team2']):
+            filled = []
+            for player in team:
+                if player not in active:
+                    if not bench:
+                        return None
+                    player = bench.pop(0)
+                filled.append(player)
+            teams.append(filled)
+        games.append(dict(game, team1=teams[0], team2=teams[1]))
+
+    placed = {p for g in games for p in g['team1'] + g['team2']} | set(bench)
+    sitting = bench + [p for p in active_players if p not in placed]
+    if len(sitting) >= 4 and len(games) < num_courts:
+        return None
+    if not fair_bench(placed - set(bench), sitting, sit_out_counts):
+        return None
+    return dict(round_data, current_games=games, sitting_out=sitting)
+
+def take_prefetched_round(state, round_number):
+    """The prefetched round if it still fits the state, repaired for players on a break if need be.
+
+    Waits for a prefetch that's still running (it's ahead of a fresh build). Returns None
+    when there's nothing usable, and the caller builds the round itself.
+    """
+    prefetched, state.prefetched = state.prefetched, None
+    if prefetched is None or prefetched['inputs'] != round_inputs(state, round_number):
+        if prefetched is not None:
+            prefetched['future'].cancel()
+        return None
+    try:
+        round_data, schedule = prefetched['future'].result()
+    except Exception:
+        # The speculative build failed or was cancelled - build it for real
+        return None
+
+    if state.players_on_break:
+        round_data = repair_round(round_data, state.active_players(), state.num_courts, state.sit_out_counts)
+        if round_data is None:
+            return None
+    state.schedule = schedule
+    return round_data
@@ -0,0 +1,72 @@
+# QR code rendering for the check-in link - cached per URL so each event's code is drawn once.
+# qrcode and Pillow are only imported when a code is actually rendered.
+
+from functools import lru_cache
+from io import BytesIO
+
+QR_FILL_COLOR = "#4A5568"
+QR_BACK_COLOR = "white"
+
+# Printable sheet: US Letter at 150 dpi, one page per QR size (in inches)
+PRINT_DPI = 150
+PRINT_PAGE_INCHES = (8.5, 11)
+PRINT_SIZES_INCHES = (2, 4, 7)
+
+
+def _make_qr(url, border, box_size=10):
+    import qrcode
+    
+    qr = qrcode.QRCode(version=1, box_size=box_size, border=border)
+    qr.add_data(url)
+    qr.make(fit=True)
+    return qr
+
+@lru_cache(maxsize=256)
+def render_qr_png(url, box_size=10, border=4):
+    """PNG bytes for a check-in URL"""
+    qr = _make_qr(url, border, box_size)
+    img = qr.make_image(fill_color=QR_FILL_COLOR, back_color=QR_BACK_COLOR)
+    
+    buf = BytesIO()
+    img.save(buf, format='PNG')
+    return buf.getvalue()
+
+@lru_cache(maxsize=256)
+def render_qr_svg(url, border=4):
+    """Scalable SVG for a check-in URL - sharp at any print size"""
+    from qrcode.image.svg import SvgPathImage
+    
+    img = _make_qr(url, border).make_image(image_factory=SvgPathImage)
+    buf = BytesIO()
+    img.save(buf)
+    return buf.getvalue().decode('utf-8')
+
+@lru_cache(maxsize=64)
+def render_qr_print_sheet(url, caption="Scan to Check In", sizes=PRINT_SIZES_INCHES):
+    """Multi-page PDF with the QR code at several sizes, for printing and posting at the courts"""
+    from PIL import Image, ImageDraw
+    
+    qr = _make_qr(url, border=4)
+    modules = qr.get_matrix()
+    base = Image.new('1', (len(modules), len(modules)), 1)
+    base.putdata([0 if cell else 1 for row in modules for cell in row])
+    
+    page_w = int(PRINT_PAGE_INCHES[0] * PRINT_DPI)
+    page_h = int(PRINT_PAGE_INCHES[1] * PRINT_DPI)
+    pages = []
+    for inches in sizes:
+        side = int(inches * PRINT_DPI)
+        page = Image.new('RGB', (page_w, page_h), QR_BACK_COLOR)
+        # Nearest-neighbour keeps module edges crisp
+        code = base.resize((side, side), Image.NEAREST).convert('RGB')
+        top = max((page_h - side) // 2 - PRINT_DPI // 2, PRINT_DPI // 2)
+        page.paste(code, ((page_w - side) // 2, top))
+        
+        draw = ImageDraw.Draw(page)
+        draw.text((page_w // 2, top + side + PRINT_DPI // 4), caption, fill="black", anchor="mt")
+        draw.text((page_w // 2, top + side + PRINT_DPI // 2), url, fill="#4A5568", anchor="mt")
+        pages.append(page)
+    
+    buf = BytesIO()
+    pages[0].save(buf, format='PDF', save_all=True, append_images=pages[1:], resolution=PRINT_DPI)
+    return buf.getvalue()
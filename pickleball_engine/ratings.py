@@ -0,0 +1,89 @@
+# Skill ratings - Elo for doubles, with a provisional period so new players settle quickly
+
+INITIAL_RATING = 1500.0
+
+# Adjustment per game: new players move by up to K_PROVISIONAL, settling towards K_ESTABLISHED
+# as they play, like a Glicko rating deviation shrinking with games
+K_PROVISIONAL = 64.0
+K_ESTABLISHED = 16.0
+PROVISIONAL_GAMES = 10
+
+
+def expected_score(rating, opponent_rating):
+    """Chance that a side rated `rating` beats one rated `opponent_rating`"""
+    return 1.0 / (1.0 + 10 ** ((opponent_rating - rating) / 400.0))
+
+
+class RatingTable:
+    """Per-player ratings, updated one game at a time.
+
+    A team's strength is the mean of its players' ratings, so a strong partner raises
+    the bar: beating a team with a weak player earns less. Each player's change is their
+    own K times (result - expected), so provisional players move faster than established ones.
+    """
+
+    def __init__(self, ratings=None, games=None):
+        self.ratings = dict(ratings or {})   # player -> rating
+        self.games = dict(games or {})       # player -> rated games played
+
+    def rating(self, player):
+        return self.ratings.get(player, INITIAL_RATING)
+
+    def k_factor(self, player):
+        played = self.games.get(player, 0)
+        if played >= PROVISIONAL_GAMES:
+            return K_ESTABLISHED
+        share = played / PROVISIONAL_GAMES
+        return K_PROVISIONAL + (K_ESTABLISHED - K_PROVISIONAL) * share
+
+    def team_rating(self, team):
+        return sum(self.rating(p) for p in team) / len(team)
+
+    def win_probability(self, team1, team2):
+        """Predicted chance that team1 beats team2"""
+        return expected_score(self.team_rating(team1), self.team_rating(team2))
+
+    def record(self, team1, team2, score1, score2):
+        """Update all four players from one game"""
+        expected1 = self.win_probability(team1, team2)
+        result1 = 1.0 if score1 > score2 else 0.0
+        changes = {}
+        for team, delta in ((team1, result1 - expected1), (team2, expected1 - result1)):
+            for player in team:
+                changes[player] = self.k_factor(player) * delta
+        for player, change in changes.items():
+            self.ratings[player] = self.rating(player) + change
+            self.games[player] = self.games.get(player, 0) + 1
+
+    def record_entries(self, entries):
+        """Apply game_scores entries in order"""
+        for entry in entries:
+            self.record(entry['team1'], entry['team2'], *entry['score'])
+
+    @classmethod
+    def from_game_scores(cls, game_scores, ratings=None, games=None):
+        """Batch-compute ratings over a historic log, optionally starting from earlier ratings"""
+        table = cls(ratings, games)
+        table.record_entries(game_scores)
+        return table
+
+    def rename(self, old_name, new_name):
+        if old_name in self.ratings:
+            self.ratings[new_name] = self.ratings.pop(old_name)
+        if old_name in self.games:
+            self.games[new_name] = self.games.pop(old_name)
+
+    def remove(self, player):
+        self.ratings.pop(player, None)
+        self.games.pop(player, None)
+
+    def ranked(self, players):
+        """Players best first by rating; ties keep the given order"""
+        return sorted(players, key=self.rating, reverse=True)
+
+    def to_dict(self):
+        return {'ratings': dict(self.ratings), 'games': dict(self.games)}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get('ratings'), data.get('games'))
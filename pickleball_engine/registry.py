@@ -0,0 +1,210 @@
+# Player registry - names interned to dense integer IDs, with partner/opponent history as bitsets
+
+from array import array
+
+
+def iter_bits(bits):
+    """Indexes of the set bits in an int, lowest first"""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+def grow(row, index):
+    """Zero-extend an array row so row[index] exists"""
+    if len(row) <= index:
+        row.extend([0] * (index + 1 - len(row)))
+
+
+class PlayerRegistry:
+    """Maps each player name to a dense integer ID for as long as the tournament runs.
+
+    A rename re-points one entry; every structure keyed by ID is untouched.
+    """
+
+    def __init__(self, names=()):
+        self.names = []    # id -> name (None once removed)
+        self.ids = {}      # name -> id
+        for name in names:
+            self.intern(name)
+
+    def intern(self, name):
+        """ID for a name, assigning the next free one the first time it's seen"""
+        player_id = self.ids.get(name)
+        if player_id is None:
+            player_id = len(self.names)
+            self.names.append(name)
+            self.ids[name] = player_id
+        return player_id
+
+    def id_of(self, name):
+        """ID for a known name, or None"""
+        return self.ids.get(name)
+
+    def name_of(self, player_id):
+        return self.names[player_id]
+
+    def rename(self, old_name, new_name):
+        player_id = self.ids.pop(old_name, None)
+        if player_id is not None:
+            self.ids[new_name] = player_id
+            self.names[player_id] = new_name
+
+    def remove(self, name):
+        """Retire a name; its ID is not reused. Returns the old ID or None."""
+        player_id = self.ids.pop(name, None)
+        if player_id is not None:
+            self.names[player_id] = None
+        return player_id
+
+    def __contains__(self, name):
+        return name in self.ids
+
+    def __len__(self):
+        return len(self.ids)
+
+
+class PairHistory:
+    """Who has partnered and opposed whom, keyed by registry ID.
+
+    Partners and opponents are one int bitset per player, so "have a and b partnered?"
+    is a shift and a mask. Opponent counts sit in one compact array('H') row per player.
+    """
+
+    def __init__(self, registry=None):
+        self.registry = registry or PlayerRegistry()
+        self.partner_bits = []      # id -> bitset of partner ids
+        self.opponent_bits = []     # id -> bitset of opponent ids
+        self.opponent_counts = []   # id -> array('H') of games against each id
+
+    def _id(self, name):
+        player_id = self.registry.intern(name)
+        while len(self.partner_bits) <= player_id:
+            self.partner_bits.append(0)
+            self.opponent_bits.append(0)
+            self.opponent_counts.append(array('H'))
+        return player_id
+
+    def ids_for(self, players):
+        """Registry IDs for players (None for anyone with no history yet)"""
+        id_of = self.registry.ids.get
+        return [id_of(p) for p in players]
+
+    def record_game(self, team1, team2):
+        """Add one game's partners and opponents"""
+        ids1 = [self._id(p) for p in team1]
+        ids2 = [self._id(p) for p in team2]
+        for team, other in ((ids1, ids2), (ids2, ids1)):
+            for i in team:
+                for j in team:
+                    if i != j:
+                        self.partner_bits[i] |= 1 << j
+                row = self.opponent_counts[i]
+                for j in other:
+                    self.opponent_bits[i] |= 1 << j
+                    grow(row, j)
+                    row[j] += 1
+
+    def partnered(self, a, b):
+        i, j = self.registry.id_of(a), self.registry.id_of(b)
+        if i is None or j is None:
+            return False
+        return bool(self.partner_bits[i] >> j & 1)
+
+    def opponent_count(self, a, b):
+        i, j = self.registry.id_of(a), self.registry.id_of(b)
+        if i is None or j is None:
+            return 0
+        row = self.opponent_counts[i]
+        return row[j] if j < len(row) else 0
+
+    def partners_of(self, name):
+        i = self.registry.id_of(name)
+        if i is None:
+            return set()
+        return {self.registry.names[j] for j in iter_bits(self.partner_bits[i])}
+
+    def rename(self, old_name, new_name):
+        self.registry.rename(old_name, new_name)
+
+    def remove(self, name):
+        """Forget a player who left; clears their row and their bit in everyone else's"""
+        i = self.registry.remove(name)
+        if i is None:
+            return
+        for j in iter_bits(self.partner_bits[i] | self.opponent_bits[i]):
+            self.partner_bits[j] &= ~(1 << i)
+            self.opponent_bits[j] &= ~(1 << i)
+            row = self.opponent_counts[j]
+            if i < len(row):
+                row[i] = 0
+        self.partner_bits[i] = 0
+        self.opponent_bits[i] = 0
+        self.opponent_counts[i] = array('H')
+
+    def remapped(self, players):
+        """A new history for just these players, keyed by their position in players (schedule slots)"""
+        history = PairHistory(PlayerRegistry(range(len(players))))
+        ids = self.ids_for(players)
+        position = {i: slot for slot, i in enumerate(ids) if i is not None}
+        for slot, i in enumerate(ids):
+            history._id(slot)
+            if i is None:
+                continue
+            row = self.opponent_counts[i]
+            for j in iter_bits(self.partner_bits[i]):
+                if j in position:
+                    history.partner_bits[slot] |= 1 << position[j]
+            counts = history.opponent_counts[slot]
+            counts.extend([0] * len(players))
+            for j in iter_bits(self.opponent_bits[i]):
+                if j in position:
+                    history.opponent_bits[slot] |= 1 << position[j]
+                    counts[position[j]] = row[j]
+        return history
+
+    def to_dict(self):
+        """JSON-safe form: bitsets as hex strings, opponent counts as {id: count} per player"""
+        return {
+            'names': list(self.registry.names),
+            'partners': [format(bits, 'x') for bits in self.partner_bits],
+            'opponents': [{str(j): row[j] for j in iter_bits(bits)}
+                          for bits, row in zip(self.opponent_bits, self.opponent_counts)],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        history = cls()
+        registry = history.registry
+        registry.names = list(data['names'])
+        registry.ids = {name: i for i, name in enumerate(registry.names) if name is not None}
+        history.partner_bits = [int(bits, 16) for bits in data['partners']]
+        for opponents in data['opponents']:
+            bits = 0
+            row = array('H')
+            for j, count in opponents.items():
+                j = int(j)
+                bits |= 1 << j
+                grow(row, j)
+                row[j] = count
+            history.opponent_bits.append(bits)
+            history.opponent_counts.append(row)
+        return history
+
+    @classmethod
+    def from_legacy(cls, partner_history, opponent_history):
+        """Convert the old name-keyed dict-of-sets / dict-of-dicts history"""
+        history = cls()
+        for p, partners in partner_history.items():
+            i = history._id(p)
+            for q in partners:
+                history.partner_bits[i] |= 1 << history._id(q)
+        for p, opponents in opponent_history.items():
+            i = history._id(p)
+            for q, count in opponents.items():
+                j = history._id(q)
+                history.opponent_bits[i] |= 1 << j
+                row = history.opponent_counts[i]
+                grow(row, j)
+                row[j] = count
+        return history
@@ -0,0 +1,177 @@
+# Round generation - dispatches to the right scheduler for the chosen format
+
+from .formats import (
+    create_popcorn_matchups,
+    create_gauntlet_matchups,
+    create_up_down_river_groups,
+    create_scramble_groups,
+    create_mixed_madness_matchups,
+    create_cream_crop_groups,
+)
+from .matching import record_round_history
+from .search import optimize_round
+from .balance import create_balanced_round
+from .dispatch import continuous_play
+from .sitouts import choose_sitters
+from .schedule import get_planned_round
+from .seeding import Seeding
+
+FORMAT_NAMES = [
+    "Classic Round Robin",
+    "Gauntlet",
+    "Popcorn",
+    "Up and Down the River",
+    "Claim the Throne",
+    "Cream of the Crop",
+    "Double Header",
+    "Scramble",
+    "Mixed Madness",
+]
+
+# Formats that place players by results; they share one Seeding per round
+SEEDED_FORMATS = ["Gauntlet", "Claim the Throne", "Up and Down the River", "Cream of the Crop"]
+
+# Rotating-partner formats that can pair by skill instead of at random (state.pairing_mode)
+PAIRING_MODES = ["Random", "Balanced"]
+BALANCED_FORMATS = ["Classic Round Robin", "Popcorn"]
+
+
+# Time budget for the optimizing Classic Round Robin search, in seconds
+CLASSIC_TIME_BUDGET = 0.2
+
+
+def build_round(state, rng=None):
+    """Work out the next round's matchups without changing the state.
+
+    Returns the state fields the round sets, e.g. current_games and sitting_out. Random
+    choices come from `rng` (the `random` module by default).
+    """
+    players = state.active_players()
+    num_courts = state.num_courts
+    format_choice = state.format_choice
+    fixed_partners = state.active_fixed_partners()
+    balanced = state.pairing_mode == "Balanced" and format_choice in BALANCED_FORMATS and not fixed_partners
+    
+    if continuous_play(state):
+        # Opening fill only - after this each court is refilled from the queue as it reports
+        games, waiting = optimize_round(
+            players, num_courts, state.history, state.sit_out_counts, time_budget=CLASSIC_TIME_BUDGET, rng=rng
+        )
+        for game in games:
+            game['game'] = 0
+        return {
+            'current_games': games,
+            'sitting_out': waiting,
+            'court_groups': [],
+            'court_game_index': {g['court']: 0 for g in games}
+        }
+    
+    # Formats planned up front are a table lookup; seeded and balanced rounds are generated live
+    planned = None if balanced else get_planned_round(state, rng)
+    if planned is not None:
+        if 'groups' in planned:
+            return {
+                'court_groups': planned['groups'],
+                'sitting_out': planned['sitting'],
+                'current_games': [],
+                'court_game_index': {g['court']: 0 for g in planned['groups']}
+            }
+        return {'current_games': planned['games'], 'sitting_out': planned['sitting'], 'court_groups': []}
+    
+    seeding = Seeding(players, state.scores, state.ratings) if format_choice in SEEDED_FORMATS else None
+    
+    if balanced:
+        players_per_round = min(num_courts, len(players) // 4) * 4
+        playing, sitting = choose_sitters(players, players_per_round, state.sit_out_counts, rng)
+        games, _ = create_balanced_round(playing, num_courts, state.ratings, state.history, rng=rng)
+        return {'current_games': games, 'sitting_out': sitting, 'court_groups': []}
+    
+    elif format_choice == "Classic Round Robin":
+        games, sitting = optimize_round(
+            players, num_courts, state.history, state.sit_out_counts, time_budget=CLASSIC_TIME_BUDGET, rng=rng
+        )
+        return {'current_games': games, 'sitting_out': sitting, 'court_groups': []}
+        
+    elif format_choice == "Popcorn":
+        games, sitting = create_popcorn_matchups(players, num_courts, fixed_partners, rng,
+                                                sit_out_counts=state.sit_out_counts)
+        return {'current_games': games, 'sitting_out': sitting, 'court_groups': []}
+        
+    elif format_choice == "Gauntlet":
+        games, sitting = create_gauntlet_matchups(players, num_courts, state.scores, fixed_partners,
+                                                  state.sit_out_counts, seeding, rng)
+        return {'current_games': games, 'sitting_out': sitting, 'court_groups': []}
+        
+    elif format_choice == "Up and Down the River":
+        groups, sitting = create_up_down_river_groups(players, num_courts, state.scores, fixed_partners, seeding,
+                                                      state.sit_out_counts, rng)
+        # Set court points
+        return {
+            'court_groups': groups,
+            'sitting_out': sitting,
+            'current_games': [],
+            'court_game_index': {g['court']: 0 for g in groups},
+            'court_points': {group['court']: num_courts - i for i, group in enumerate(groups)}
+        }
+    
+    elif format_choice == "Claim the Throne":
+        games, sitting = create_gauntlet_matchups(players, num_courts, state.scores, fixed_partners,
+                                                  state.sit_out_counts, seeding, rng)
+        # Weighted points
+        return {
+            'current_games': games,
+            'sitting_out': sitting,
+            'court_points': {game['court']: num_courts - game['court'] + 1 for game in games}
+        }
+    
+    elif format_choice in ["Double Header", "Scramble"]:
+        groups, sitting = create_scramble_groups(players, num_courts, rng, state.sit_out_counts)
+        return {
+            'court_groups': groups,
+            'sitting_out': sitting,
+            'current_games': [],
+            'court_game_index': {g['court']: 0 for g in groups}
+        }
+    
+    elif format_choice == "Cream of the Crop":
+        groups, sitting = create_cream_crop_groups(players, num_courts, state.scores, seeding, state.sit_out_counts, rng)
+        # Set court points
+        return {
+            'court_groups': groups,
+            'sitting_out': sitting,
+            'current_games': [],
+            'court_game_index': {g['court']: 0 for g in groups},
+            'court_points': {group['court']: num_courts - i for i, group in enumerate(groups)}
+        }
+    
+    elif format_choice == "Mixed Madness":
+        games, sitting = create_mixed_madness_matchups(players, num_courts, state.gender_assignments,
+                                                      state.sit_out_counts, rng)
+        return {'current_games': games, 'sitting_out': sitting, 'court_groups': []}
+    
+    return {}
+
+def apply_round(state, round_data):
+    """Install a round built by build_round and update partner/opponent/sit-out history"""
+    players = [p for g in round_data.get('current_games', []) for p in g['team1'] + g['team2']]
+    players += round_data.get('sitting_out', [])
+    players += [p for g in round_data.get('court_groups', []) for p in g.get('players', [])]
+    state.ensure_player_stats(players)
+    
+    for field_name, value in round_data.items():
+        if field_name == 'court_points':
+            state.court_points.update(value)
+        else:
+            setattr(state, field_name, value)
+    
+    # Every format feeds the shared sit-out rotation; court groups only add their bench
+    if 'sitting_out' in round_data:
+        record_round_history(round_data['current_games'], round_data['sitting_out'], state.history,
+                             state.sit_out_counts)
+
+def generate_new_round(state, rng=None):
+    """Generate matchups for a new round"""
+    state.ensure_player_stats(state.active_players())
+    round_data = build_round(state, rng)
+    apply_round(state, round_data)
+    return round_data
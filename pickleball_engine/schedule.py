@@ -0,0 +1,195 @@
+# Whole-session schedules - computed once per (players, courts, rounds, format) and served by lookup
+
+import random
+from functools import lru_cache
+
+from .formats import create_popcorn_matchups, create_scramble_groups
+from .matching import record_round_history
+from .search import optimize_round
+from .registry import PairHistory
+from .sitouts import bench_order, fair_bench
+
+# Formats whose rounds don't depend on results, so the whole session can be planned up front
+PRECOMPUTABLE_FORMATS = ["Classic Round Robin", "Popcorn", "Double Header", "Scramble"]
+
+# Fixed seed so the same parameters always produce the same cached table
+SCHEDULE_SEED = 2025
+
+
+def _plan_rounds(slots, num_courts, num_rounds, format_choice, history, sit_out_counts, rng):
+    """Plan num_rounds rounds on top of `history` and `sit_out_counts`, updating both as it goes"""
+    table = []
+    for _ in range(num_rounds):
+        if format_choice == "Classic Round Robin":
+            games, sitting = optimize_round(
+                slots, num_courts, history, sit_out_counts, rng=rng
+            )
+            record_round_history(games, sitting, history, sit_out_counts)
+            table.append({'games': games, 'sitting': sitting})
+        elif format_choice == "Popcorn":
+            games, sitting = create_popcorn_matchups(slots, num_courts, rng=rng, sit_out_counts=sit_out_counts)
+            record_round_history(games, sitting, history, sit_out_counts)
+            table.append({'games': games, 'sitting': sitting})
+        elif format_choice in ["Double Header", "Scramble"]:
+            groups, sitting = create_scramble_groups(slots, num_courts, rng=rng, sit_out_counts=sit_out_counts)
+            record_round_history([], sitting, history, sit_out_counts)
+            table.append({'groups': groups, 'sitting': sitting})
+        else:
+            raise ValueError(f"{format_choice} can't be planned ahead")
+    return table
+
+@lru_cache(maxsize=64)
+def build_schedule_table(num_players, num_courts, num_rounds, format_choice, seed=SCHEDULE_SEED):
+    """Plan every round for player slots 0..num_players-1.
+
+    Each round is {'games': [...], 'sitting': [...]} or {'groups': [...], 'sitting': [...]}, using slot numbers
+    instead of names. The result is cached, so treat it as read-only. Classic rounds for big
+    events are searched against the clock (see optimize_round), so those can differ between runs.
+    """
+    return tuple(_plan_rounds(list(range(num_players)), num_courts, num_rounds, format_choice,
+                              PairHistory(), {}, random.Random(seed)))
+
+
+class SessionSchedule:
+    """A planned session for one roster; rounds are served by index"""
+
+    def __init__(self, players, num_courts, num_rounds, format_choice, rng=None, table=None, first_round=1):
+        rng = rng or random
+        self.players = list(players)
+        if table is None:
+            # Shuffle who gets which slot so events of the same size don't all see the same pairings
+            rng.shuffle(self.players)
+            table = build_schedule_table(len(self.players), num_courts, num_rounds, format_choice)
+        self.num_courts = num_courts
+        self.num_rounds = num_rounds
+        self.format_choice = format_choice
+        self.table = table
+        self.first_round = first_round
+
+    @classmethod
+    def replan(cls, state, first_round, rng=None):
+        """Incremental repair after a late arrival or departure, a break, or a lost plan: plan only
+        the rounds still to come, continuing from the real partner/opponent/sit-out history"""
+        players = list(state.players)
+        index = {p: i for i, p in enumerate(players)}
+        history = state.history.remapped(players)
+        sit_out_counts = {index[p]: n for p, n in state.sit_out_counts.items() if p in index}
+        
+        table = _plan_rounds(list(range(len(players))), state.num_courts, state.num_rounds - first_round + 1,
+                             state.format_choice, history, sit_out_counts, rng or random)
+        return cls(players, state.num_courts, state.num_rounds, state.format_choice,
+                   table=tuple(table), first_round=first_round)
+
+    def to_dict(self):
+        """JSON-safe form, logged with the round that started using the plan so a replay serves the same rounds"""
+        return {
+            'players': list(self.players),
+            'num_courts': self.num_courts,
+            'num_rounds': self.num_rounds,
+            'format_choice': self.format_choice,
+            'table': list(self.table),
+            'first_round': self.first_round
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['players'], data['num_courts'], data['num_rounds'], data['format_choice'],
+                   table=tuple(data['table']), first_round=data['first_round'])
+
+    def matches(self, players, num_courts, format_choice):
+        """True if this plan was built for the same roster and settings"""
+        return (
+            num_courts == self.num_courts and
+            format_choice == self.format_choice and
+            len(players) == len(self.players) and
+            set(players) == set(self.players)
+        )
+
+    def get_round(self, round_number, active_players, sit_out_counts=None):
+        """Named matchups for a 1-based round, repaired for players on a break.
+
+        A planned player who is on a break is covered by the planned sitter who has sat
+        out most (see bench_order). Returns None when the round is past the plan or
+        can't be repaired.
+        """
+        offset = round_number - self.first_round
+        if offset < 0 or offset >= len(self.table):
+            return None
+        planned = self.table[offset]
+        active = set(active_players)
+        
+        # Fill gaps left by absent players with planned sitters who are here
+        bench = bench_order([self.players[i] for i in planned.get('sitting', []) if self.players[i] in active],
+                            sit_out_counts)
+        
+        if 'groups' in planned:
+            groups = []
+            for group in planned['groups']:
+                court_players = []
+                for i in group['players']:
+                    player = self.players[i]
+                    if player not in active:
+                        if not bench:
+                            continue
+                        player = bench.pop(0)
+                    court_players.append(player)
+                if len(court_players) < 4:
+                    return None
+                groups.append({'court': group['court'], 'players': court_players})
+            return {'groups': groups, 'sitting': bench}
+        
+        games = []
+        for game in planned['games']:
+            teams = []
+            for team in (game['team1'], game['team2']):
+                filled = []
+                for i in team:
+                    player = self.players[i]
+                    if player not in active:
+                        if not bench:
+                            return None
+                        player = bench.pop(0)
+                    filled.append(player)
+                teams.append(filled)
+            games.append({'court': game['court'], 'team1': teams[0], 'team2': teams[1]})
+        
+        return {'games': games, 'sitting': bench}
+
+
+def planned_fairly(planned, sit_out_counts):
+    """True if a planned round benches nobody who has sat out more than someone it puts on court"""
+    playing = [p for g in planned.get('games', []) for p in g['team1'] + g['team2']]
+    playing += [p for g in planned.get('groups', []) for p in g['players']]
+    return fair_bench(playing, planned.get('sitting', []), sit_out_counts)
+
+def get_planned_round(state, rng=None):
+    """Serve the current round from the session plan.
+
+    The plan is replaced by one continuing from the real history when it no longer
+    fits: the roster changed, or its round would bench someone who has sat out more
+    than a player it puts on court (after a break, say). Returns None for formats that
+    depend on results, or when no plan can cover this round.
+    """
+    if state.format_choice not in PRECOMPUTABLE_FORMATS:
+        return None
+    if state.format_choice == "Popcorn" and state.active_fixed_partners():
+        return None
+    if state.current_round > state.num_rounds:
+        return None
+    
+    schedule = state.schedule
+    fresh = schedule is None or not schedule.matches(state.players, state.num_courts, state.format_choice)
+    if fresh:
+        if state.current_round > 1:
+            schedule = SessionSchedule.replan(state, state.current_round, rng)
+        else:
+            schedule = SessionSchedule(state.players, state.num_courts, state.num_rounds, state.format_choice, rng)
+    
+    planned = schedule.get_round(state.current_round, state.active_players(), state.sit_out_counts)
+    if (planned is None or not planned_fairly(planned, state.sit_out_counts)) and \
+            not (fresh and schedule.first_round == state.current_round):
+        schedule = SessionSchedule.replan(state, state.current_round, rng)
+        planned = schedule.get_round(state.current_round, state.active_players(), state.sit_out_counts)
+    
+    state.schedule = schedule
+    return planned
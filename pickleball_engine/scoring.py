@@ -0,0 +1,99 @@
+# Score recording - the one place game results are applied to player stats
+
+class ScoreError(ValueError):
+    """A game result that can't be recorded"""
+
+
+def validate_result(team1, team2, score1, score2):
+    """Raise ScoreError if a single game result is unusable"""
+    # An empty score box is None - not a zero to record
+    if score1 is None or score2 is None or (score1 == 0 and score2 == 0):
+        raise ScoreError("Please enter both scores!")
+    if score1 < 0 or score2 < 0:
+        raise ScoreError("Scores can't be negative")
+    if score1 == score2:
+        raise ScoreError("Scores can't be tied")
+    if len(set(team1) | set(team2)) != len(team1) + len(team2):
+        raise ScoreError("A player can't be on both teams")
+
+def record_games_batch(state, results, expected_courts=None, round_number=None):
+    """Apply a whole round of results at once.
+
+    Each result is a dict with 'court', 'team1', 'team2', 'score1' and 'score2'.
+    Everything is validated before anything is changed, so a bad or missing
+    court leaves the state untouched. Returns the new game_scores entries.
+    """
+    round_number = state.current_round if round_number is None else round_number
+    
+    if expected_courts is not None:
+        missing = set(expected_courts) - {r['court'] for r in results}
+        if missing:
+            raise ScoreError(f"Missing scores for court {', '.join(str(c) for c in sorted(missing))}")
+    
+    seen = set()
+    for result in results:
+        try:
+            validate_result(result['team1'], result['team2'], result['score1'], result['score2'])
+        except ScoreError as e:
+            raise ScoreError(f"Court {result['court']}: {e}") from None
+        players = set(result['team1']) | set(result['team2'])
+        if seen & players:
+            raise ScoreError(f"Court {result['court']}: a player is already in another game")
+        seen |= players
+    
+    # Sum each player's changes first so their stats are touched once per batch
+    deltas = {}
+    entries = []
+    for result in results:
+        score1 = result['score1']
+        score2 = result['score2']
+        team1_won = score1 > score2
+        for team, points_for, points_against, won in (
+            (result['team1'], score1, score2, team1_won),
+            (result['team2'], score2, score1, not team1_won),
+        ):
+            for player in team:
+                delta = deltas.setdefault(player, [0, 0, 0, 0, 0])
+                delta[0] += 1
+                delta[1] += points_for
+                delta[2] += points_against
+                delta[3] += 1 if won else 0
+                delta[4] += 0 if won else 1
+        entries.append({
+            'round': round_number,
+            'court': result['court'],
+            'team1': list(result['team1']),
+            'team2': list(result['team2']),
+            'score': [score1, score2]
+        })
+    
+    state.ensure_player_stats(deltas)
+    for player, (games, points_for, points_against, wins, losses) in deltas.items():
+        stats = state.scores[player]
+        stats['games_played'] += games
+        stats['points_for'] += points_for
+        stats['points_against'] += points_against
+        stats['point_diff'] = stats['points_for'] - stats['points_against']
+        stats['wins'] += wins
+        stats['losses'] += losses
+    
+    state.game_scores.extend(entries)
+    state.ratings.record_entries(entries)
+    for entry in entries:
+        score1, score2 = entry['score']
+        if score1 > score2:
+            state.update_standings(entry['team1'], entry['team2'])
+        else:
+            state.update_standings(entry['team2'], entry['team1'])
+    
+    return entries
+
+def record_game(state, court, team1, team2, score1, score2, round_number=None):
+    """Apply a single game result"""
+    return record_games_batch(state, [{
+        'court': court,
+        'team1': team1,
+        'team2': team2,
+        'score1': score1,
+        'score2': score2
+    }], round_number=round_number)[0]
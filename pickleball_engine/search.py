@@ -0,0 +1,236 @@
+# Parallel schedule search - seeded restarts of the round optimizer across a process pool,
+# keeping the cheapest round found before a wall-clock deadline
+
+import multiprocessing
+import os
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from contextlib import contextmanager
+
+from .matching import PARTNER_WEIGHT, OPPONENT_WEIGHT, SIT_OUT_WEIGHT, create_optimized_round
+from .registry import PairHistory
+
+# Rounds this size and up search in parallel; smaller ones settle in a few milliseconds anyway
+PARALLEL_SEARCH_MIN_PLAYERS = 64
+# Wall-clock budget for one round's search, in seconds
+SEARCH_DEADLINE = 0.2
+# How long past the deadline to wait for a worker's answer before going without it
+SEARCH_GRACE = 0.05
+# Searches that can run at once (different events, or a prefetch and a "Generate round"),
+# each with its own best-cost slot; a search beyond that waits for a slot to free up
+SEARCH_SLOTS = 8
+
+# [search generation, best cost found so far] per slot, shared with every worker; the
+# generation keeps a straggler from an earlier search from posting its cost to the next one
+_best_cost = None
+_free_slots = None
+_pool = None
+_pool_size = 0
+# Workers known to be up, and the thread starting them
+_warm_size = 0
+_warming = None
+_setup_lock = threading.Lock()
+_serial = threading.local()
+
+
+def process_context():
+    """Start method for worker processes. The server has threads running (sessions, the round
+    prefetcher, store locks), and forking while one of them holds a lock can hang the child."""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+def _shared_costs():
+    """The best-cost array and the queue of free slots in it, created once per server process"""
+    global _best_cost, _free_slots
+    with _setup_lock:
+        if _best_cost is None:
+            _best_cost = process_context().Array('d', 2 * SEARCH_SLOTS)
+            _free_slots = queue.Queue()
+            for slot in range(SEARCH_SLOTS):
+                _free_slots.put(slot)
+    return _best_cost, _free_slots
+
+def round_cost(games, sitting, history, sit_out_counts):
+    """The optimizer's cost for a finished round: repeat partners, repeat opponents and sit-outs"""
+    cost = 0
+    for game in games:
+        (a, b), (c, d) = game['team1'], game['team2']
+        cost += PARTNER_WEIGHT * (history.partnered(a, b) + history.partnered(c, d))
+        cost += OPPONENT_WEIGHT * sum(history.opponent_count(p, q) for p in (a, b) for q in (c, d))
+    cost += SIT_OUT_WEIGHT * sum(sit_out_counts.get(p, 0) for p in sitting)
+    return cost
+
+def cost_floor(players, num_courts, sit_out_counts):
+    """No round costs less than benching the players with the fewest sit-outs and repeating nobody"""
+    num_sitting = len(players) - min(num_courts, len(players) // 4) * 4
+    counts = sorted(sit_out_counts.get(p, 0) for p in players)
+    return SIT_OUT_WEIGHT * sum(counts[:num_sitting])
+
+def _init_worker(best_cost):
+    global _best_cost
+    _best_cost = best_cost
+
+def _run_restarts(task):
+    """Restart the optimizer with fresh seeds until the deadline.
+
+    Returns (best, restarts), where best is (cost, games, sitting) for this worker's
+    cheapest round if it beat the shared best when found, else None - so only
+    improvements come back through the pool.
+    """
+    players, num_courts, history, sit_out_counts, deadline, slot, generation, floor, seed, stride = task
+    best = None
+    restarts = 0
+    gen, cost_at = 2 * slot, 2 * slot + 1
+    # Stop once some worker has reached the floor - nothing can beat it
+    while _best_cost[gen] == generation and _best_cost[cost_at] > floor:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            break
+        rng = random.Random(seed + restarts * stride)
+        games, sitting = create_optimized_round(players, num_courts, history, sit_out_counts,
+                                                time_budget=remaining, rng=rng)
+        restarts += 1
+        cost = round_cost(games, sitting, history, sit_out_counts)
+        with _best_cost.get_lock():
+            improved = _best_cost[gen] == generation and cost < _best_cost[cost_at]
+            if improved:
+                _best_cost[cost_at] = cost
+        if improved:
+            best = (cost, games, sitting)
+    return best, restarts
+
+def get_search_pool(processes=None):
+    """The shared worker pool, started on first use - one worker per core besides this process.
+    Returns None on a single core."""
+    global _pool, _pool_size
+    workers = (processes or os.cpu_count() or 1) - 1
+    if workers < 1:
+        return None
+    best_cost, _ = _shared_costs()
+    with _setup_lock:
+        if _pool is None or _pool_size != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=process_context(),
+                                        initializer=_init_worker, initargs=(best_cost,))
+            _pool_size = workers
+        return _pool
+
+def _worker_ready():
+    return os.getpid()
+
+def warm_search_pool(processes=None):
+    """Start the worker pool and wait until every worker is up, so no search pays for start-up.
+    Blocks for as long as that takes - call it off the request path. Returns the pool, or None on one core."""
+    global _warm_size
+    pool = get_search_pool(processes)
+    if pool is not None and _warm_size != _pool_size:
+        size = _pool_size
+        wait([pool.submit(_worker_ready) for _ in range(size)])
+        _warm_size = size
+    return pool
+
+def _warm_pool(processes=None):
+    """The pool if its workers are up. Otherwise None, with the pool warming in the background
+    for the next search - starting processes would blow this one's deadline."""
+    global _warming
+    workers = (processes or os.cpu_count() or 1) - 1
+    if workers < 1:
+        return None
+    if _pool is not None and _pool_size == workers == _warm_size:
+        return _pool
+    with _setup_lock:
+        if _warming is None or not _warming.is_alive():
+            _warming = threading.Thread(target=warm_search_pool, args=(processes,), daemon=True,
+                                        name="search-pool-warmup")
+            _warming.start()
+    return None
+
+@contextmanager
+def serial_search():
+    """Search in this process only - for callers that are already one of many worker processes"""
+    _serial.active = True
+    try:
+        yield
+    finally:
+        _serial.active = False
+
+def multi_start_search(players, num_courts, history=None, sit_out_counts=None, deadline=SEARCH_DEADLINE,
+                       processes=None, rng=None):
+    """Independent seeded restarts of create_optimized_round, in parallel, until `deadline` seconds pass.
+
+    Every worker (and this process, which always completes at least one restart so
+    there's an answer) shares the best cost found so far, and all stop early once a
+    round with no repeats and the fairest possible bench turns up. The pool is only
+    used once it's warm (see warm_search_pool). Returns {'games', 'sitting', 'cost', 'restarts'}.
+    """
+    history = history or PairHistory()
+    sit_out_counts = sit_out_counts or {}
+    rng = rng or random
+    seed = rng.randrange(2 ** 31)
+    ends_at = time.time() + deadline
+    floor = cost_floor(players, num_courts, sit_out_counts)
+
+    # This process's first restart comes before anything goes to the pool: when it already reaches
+    # the floor (most rounds, even at 100+ players) there's nothing for the workers to beat
+    games, sitting = create_optimized_round(players, num_courts, history, sit_out_counts,
+                                            time_budget=deadline, rng=random.Random(seed))
+    best = (round_cost(games, sitting, history, sit_out_counts), games, sitting)
+    restarts = 1
+    if best[0] <= floor:
+        return {'games': games, 'sitting': sitting, 'cost': best[0], 'restarts': restarts}
+
+    pool = None if getattr(_serial, 'active', False) else _warm_pool(processes)
+    best_cost, free_slots = _shared_costs()
+    slot = free_slots.get()
+    try:
+        gen, cost_at = 2 * slot, 2 * slot + 1
+        with best_cost.get_lock():
+            best_cost[gen] += 1
+            best_cost[cost_at] = best[0]
+            generation = best_cost[gen]
+
+        # Worker w tries seeds seed + w, seed + w + stride, ...; this process is worker 0
+        stride = _pool_size + 1 if pool is not None else 1
+        futures = []
+        if pool is not None:
+            task = (list(players), num_courts, history, dict(sit_out_counts), ends_at, slot, generation, floor)
+            futures = [pool.submit(_run_restarts, task + (seed + worker, stride)) for worker in range(1, stride)]
+
+        # Then more of this process's share while time allows
+        local, more = _run_restarts((players, num_courts, history, sit_out_counts, ends_at, slot, generation,
+                                     floor, seed + stride, stride))
+        restarts += more
+        if local is not None and local[0] < best[0]:
+            best = local
+
+        done, _ = wait(futures, timeout=max(ends_at - time.time(), 0) + SEARCH_GRACE)
+        for future in done:
+            found, more = future.result()
+            restarts += more
+            if found is not None and found[0] < best[0]:
+                best = found
+    finally:
+        # Bump the generation so stragglers still running for this search stop posting to the slot
+        with best_cost.get_lock():
+            best_cost[2 * slot] += 1
+        free_slots.put(slot)
+
+    cost, games, sitting = best
+    return {'games': games, 'sitting': sitting, 'cost': cost, 'restarts': restarts}
+
+def search_optimized_round(players, num_courts, history=None, sit_out_counts=None, deadline=SEARCH_DEADLINE,
+                           processes=None, rng=None):
+    """multi_start_search, returning (games, sitting) like create_optimized_round"""
+    result = multi_start_search(players, num_courts, history, sit_out_counts, deadline, processes, rng)
+    return result['games'], result['sitting']
+
+def optimize_round(players, num_courts, history=None, sit_out_counts=None, time_budget=SEARCH_DEADLINE, rng=None):
+    """The Classic Round Robin round builder: one local search for ordinary events, the
+    parallel multi-start search for big ones where a single run leaves repeats on the table"""
+    if len(players) >= PARALLEL_SEARCH_MIN_PLAYERS:
+        return search_optimized_round(players, num_courts, history, sit_out_counts, time_budget, rng=rng)
+    return create_optimized_round(players, num_courts, history, sit_out_counts, time_budget=time_budget, rng=rng)
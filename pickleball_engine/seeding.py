@@ -0,0 +1,39 @@
+# Seeding - one ranking pass per round, shared by every format that seeds players by results
+
+from .stats import calculate_win_percentage
+
+
+class Seeding:
+    """Win %, point diff and composite rating for each player, computed once, plus the ranked order.
+
+    The rating is (win %, point diff), so point diff breaks ties between equal records.
+    Given a RatingTable, the skill rating leads: (skill, win %, point diff).
+    Players with no games yet rate 0 on results. `ranked` is best first; ties keep roster order.
+    """
+
+    def __init__(self, players, scores, skill=None):
+        self.players = list(players)
+        self.skill = skill
+        self.win_pct = {}
+        self.point_diff = {}
+        for player in self.players:
+            stats = scores.get(player)
+            if stats:
+                self.win_pct[player] = calculate_win_percentage(stats['wins'], stats['games_played'])
+                self.point_diff[player] = stats.get('point_diff', 0)
+            else:
+                self.win_pct[player] = 0
+                self.point_diff[player] = 0
+        self.ratings = {p: (self.win_pct[p], self.point_diff[p]) for p in self.players}
+        if skill is not None:
+            self.ratings = {p: (skill.rating(p),) + r for p, r in self.ratings.items()}
+        self.ranked = sorted(self.players, key=self.ratings.__getitem__, reverse=True)
+
+    def rating(self, player):
+        return self.ratings[player]
+
+    def pair_strength(self, pair):
+        """Strength of a fixed pair: team skill rating, or average win % without ratings"""
+        if self.skill is not None:
+            return self.skill.team_rating(pair)
+        return sum(self.win_pct.get(p, 0) for p in pair) / len(pair)
@@ -0,0 +1,229 @@
+# Session simulator - Monte Carlo runs of whole sessions through the real schedulers, to compare
+# formats, court counts and round counts before the event
+
+import heapq
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+
+from .court_games import court_game_count, court_game_at
+from .court_scores import FIXED_PAIR_COURT_GAMES, group_repeats
+from .dispatch import continuous_play, dispatch_courts, apply_dispatch
+from .rounds import generate_new_round
+from .scoring import record_games_batch
+from .search import process_context, serial_search
+from .state import TournamentState
+
+# Minutes between games on a court (players swap, balls collected)
+CHANGEOVER_MINUTES = 1
+# Minutes between rounds: scores entered, next round generated, players find their courts
+ROUND_BREAK_MINUTES = 3
+# Sessions simulated per configuration by default
+SIMULATED_SESSIONS = 200
+
+
+class GameDurations:
+    """Game length in minutes: normal around `mean`, never shorter than `minimum`.
+
+    Any picklable callable taking an rng and returning minutes can stand in for it.
+    """
+
+    def __init__(self, mean=12, sd=3, minimum=5):
+        self.mean = mean
+        self.sd = sd
+        self.minimum = minimum
+
+    def __call__(self, rng):
+        return max(rng.gauss(self.mean, self.sd), self.minimum)
+
+
+def _random_results(games, rng):
+    results = []
+    for game in games:
+        winner = rng.randint(0, 1)
+        results.append({
+            'court': game['court'],
+            'team1': game['team1'],
+            'team2': game['team2'],
+            'score1': 11 if winner else rng.randint(0, 9),
+            'score2': rng.randint(0, 9) if winner else 11
+        })
+    return results
+
+def _new_state(config):
+    players = [f"P{i}" for i in range(config['players'])]
+    state = TournamentState(
+        players=players,
+        num_courts=config['courts'],
+        num_rounds=config['rounds'],
+        format_choice=config['format'],
+        pairing_mode=config.get('pairing_mode', 'Random'),
+        play_mode=config.get('play_mode', 'Rounds'),
+        gender_assignments={p: 'MF'[i % 2] for i, p in enumerate(players)}
+    )
+    if config.get('partner_mode') == "Fixed Partners":
+        state.partner_mode = "Fixed Partners"
+        for a, b in zip(players[::2], players[1::2]):
+            state.fixed_partners[a] = b
+            state.fixed_partners[b] = a
+    state.ensure_player_stats(players)
+    return state
+
+def _group_games(state, group):
+    """Every game a court group plays in its round, in order"""
+    if 'pairs' in group:
+        pair1, pair2 = group['pairs']
+        return [{'court': group['court'], 'team1': pair1, 'team2': pair2}] * FIXED_PAIR_COURT_GAMES
+    repeats = group_repeats(state)
+    return [dict(court_game_at(group['players'], i, repeats), court=group['court'])
+            for i in range(court_game_count(group['players'], repeats))]
+
+def _simulate_rounds(state, durations, rng, busy, sat_out):
+    """Round-based play: every court starts together and the round ends with the slowest court"""
+    clock = 0.0
+    for round_number in range(1, state.num_rounds + 1):
+        state.current_round = round_number
+        generate_new_round(state, rng)
+
+        court_minutes = []
+        for game in state.current_games:
+            minutes = durations(rng)
+            court_minutes.append(minutes)
+            busy[game['court']] = busy.get(game['court'], 0) + minutes
+        if state.current_games:
+            record_games_batch(state, _random_results(state.current_games, rng))
+
+        for group in state.court_groups:
+            games = _group_games(state, group)
+            minutes = sum(durations(rng) for _ in games)
+            court_minutes.append(minutes + CHANGEOVER_MINUTES * (len(games) - 1))
+            busy[group['court']] = busy.get(group['court'], 0) + minutes
+            for game in games:
+                record_games_batch(state, _random_results([game], rng))
+
+        on_court = {p for g in state.current_games for p in g['team1'] + g['team2']}
+        on_court |= {p for g in state.court_groups for p in g.get('players', [])}
+        on_court |= {p for g in state.court_groups for pair in g.get('pairs', []) for p in pair}
+        for player in state.players:
+            if player not in on_court:
+                sat_out[player] += 1
+
+        clock += max(court_minutes, default=0)
+        if round_number < state.num_rounds:
+            clock += ROUND_BREAK_MINUTES
+    return clock
+
+def _simulate_continuous(state, durations, rng, busy):
+    """Continuous play: each court takes the next foursome from the queue as soon as it finishes.
+
+    Plays as many games as round-based play would (rounds x courts in use), so session
+    lengths compare directly.
+    """
+    state.current_round = 1
+    generate_new_round(state, rng)
+    target = state.num_rounds * min(state.num_courts, len(state.players) // 4)
+
+    finishing = []
+    for game in state.current_games:
+        heapq.heappush(finishing, (durations(rng), game['court'], game['game']))
+
+    clock = 0.0
+    games_played = 0
+    started = {game['court']: 0.0 for game in state.current_games}
+    while finishing and games_played < target:
+        clock, court, _ = heapq.heappop(finishing)
+        game = next(g for g in state.current_games if g['court'] == court)
+        record_games_batch(state, _random_results([game], rng))
+        busy[court] = busy.get(court, 0) + clock - started[court]
+        games_played += 1
+
+        dispatch = dispatch_courts(state, court)
+        apply_dispatch(state, dispatch)
+        if games_played + len(finishing) >= target:
+            continue    # enough games are already under way
+        for new_game in dispatch['games']:
+            started[new_game['court']] = clock + CHANGEOVER_MINUTES
+            heapq.heappush(finishing, (started[new_game['court']] + durations(rng), new_game['court'],
+                                       new_game['game']))
+    return clock
+
+def simulate_session(config, seed, durations=None):
+    """One session with random game lengths and results. Returns its metrics.
+
+    `config` has 'format', 'players', 'courts' and 'rounds', and optionally 'play_mode',
+    'pairing_mode' and 'partner_mode' as on the state.
+    """
+    durations = durations or GameDurations()
+    # A private generator, threaded into the schedulers - reseeding the module-level one
+    # would make everything else in the process (event codes, say) predictable
+    rng = random.Random(seed)
+    state = _new_state(config)
+
+    busy = {}
+    sat_out = {p: 0 for p in state.players}
+    continuous = continuous_play(state)
+    if continuous:
+        minutes = _simulate_continuous(state, durations, rng, busy)
+    else:
+        minutes = _simulate_rounds(state, durations, rng, busy, sat_out)
+
+    court_minutes = minutes * state.num_courts
+    games = sum(stats['games_played'] for stats in state.scores.values()) / 4
+    game_counts = [stats['games_played'] for stats in state.scores.values()]
+    return {
+        'session_minutes': minutes,
+        'court_idle_minutes': court_minutes - sum(busy.values()),
+        'court_idle_share': 1 - sum(busy.values()) / court_minutes if court_minutes else 0,
+        'games': games,
+        'games_per_hour': games * 60 / minutes if minutes else 0,
+        'games_per_player': statistics.mean(game_counts),
+        'games_per_player_spread': max(game_counts) - min(game_counts),
+        # Continuous play has no rounds to sit out of
+        'sit_out_spread': None if continuous else max(sat_out.values()) - min(sat_out.values())
+    }
+
+def _simulate_batch(task):
+    config, seeds, durations = task
+    # The sessions are already spread across cores; big rounds search within this process
+    with serial_search():
+        return [simulate_session(config, seed, durations) for seed in seeds]
+
+def summarize(config, runs):
+    """Averages over a configuration's sessions, plus the 90th-percentile session length"""
+    lengths = sorted(r['session_minutes'] for r in runs)
+    summary = dict(config, sessions=len(runs))
+    for key in ('session_minutes', 'court_idle_minutes', 'court_idle_share', 'games', 'games_per_hour',
+                'games_per_player', 'games_per_player_spread'):
+        summary[key] = statistics.mean(r[key] for r in runs)
+    summary['session_minutes_p90'] = lengths[int(0.9 * (len(lengths) - 1))]
+    sit_out_spreads = [r['sit_out_spread'] for r in runs if r['sit_out_spread'] is not None]
+    summary['sit_out_spread'] = statistics.mean(sit_out_spreads) if sit_out_spreads else None
+    # How much each player gets to play per hour of session - the number to maximize
+    summary['games_per_player_hour'] = summary['games_per_player'] * 60 / summary['session_minutes']
+    return summary
+
+def simulate_configs(configs, sessions=SIMULATED_SESSIONS, processes=None, durations=None, seed=0, batch_size=25):
+    """Simulate `sessions` sessions of every configuration, spread across processes.
+
+    Sessions are independent, so they're farmed out in batches to a process pool
+    (processes=None uses every core; processes=1 runs in this process). Seeds are fixed per
+    session, so results don't depend on the number of processes. Returns one summary per config.
+    """
+    durations = durations or GameDurations()
+    tasks = []
+    for i, config in enumerate(configs):
+        seeds = [seed + i * sessions + s for s in range(sessions)]
+        for start in range(0, sessions, batch_size):
+            tasks.append((i, (config, seeds[start:start + batch_size], durations)))
+
+    runs = [[] for _ in configs]
+    if processes == 1:
+        results = map(_simulate_batch, [task for _, task in tasks])
+        for (i, _), batch in zip(tasks, results):
+            runs[i].extend(batch)
+    else:
+        with ProcessPoolExecutor(max_workers=processes, mp_context=process_context()) as pool:
+            for (i, _), batch in zip(tasks, pool.map(_simulate_batch, [task for _, task in tasks])):
+                runs[i].extend(batch)
+
+    return [summarize(config, config_runs) for config, config_runs in zip(configs, runs)]
@@ -0,0 +1,48 @@
+# Sit-out rotation shared by every format: whoever has sat out least sits next
+
+import heapq
+import random
+
+
+def choose_sitters(players, num_playing, sit_out_counts=None, rng=None, count_of=None):
+    """Split players into (playing, sitting), benching those with the fewest sit-outs so far.
+
+    Ties are broken randomly. Picking the k lowest counts every round keeps the
+    max-minus-min sit-out spread at most 1 for a steady roster. Building the heap
+    is O(n) and each sitter is one O(log n) pop.
+    `count_of` lets fixed-partner formats rotate whole pairs (e.g. by the pair's
+    higher count). Playing players keep their input order.
+    """
+    rng = rng or random
+    sit_out_counts = sit_out_counts or {}
+    count_of = count_of or (lambda p: sit_out_counts.get(p, 0))
+    
+    num_sitting = max(len(players) - num_playing, 0)
+    if num_sitting == 0:
+        return list(players), []
+    
+    heap = [(count_of(p), rng.random(), i) for i, p in enumerate(players)]
+    heapq.heapify(heap)
+    sitting_idx = [heapq.heappop(heap)[2] for _ in range(num_sitting)]
+    
+    benched = set(sitting_idx)
+    playing = [p for i, p in enumerate(players) if i not in benched]
+    sitting = [players[i] for i in sitting_idx]
+    return playing, sitting
+
+def pair_sit_out_count(sit_out_counts):
+    """Count for a fixed pair: the partner who has sat out more decides"""
+    return lambda pair: max(sit_out_counts.get(pair[0], 0), sit_out_counts.get(pair[1], 0))
+
+def bench_order(bench, sit_out_counts=None):
+    """Benched players in the order they come on to cover for someone on a break: most sit-outs first.
+    Ties keep bench order."""
+    sit_out_counts = sit_out_counts or {}
+    return sorted(bench, key=lambda p: sit_out_counts.get(p, 0), reverse=True)
+
+def fair_bench(playing, sitting, sit_out_counts=None):
+    """True if nobody sits who has sat out more than someone playing - the choose_sitters rule"""
+    if not playing or not sitting:
+        return True
+    sit_out_counts = sit_out_counts or {}
+    return max(sit_out_counts.get(p, 0) for p in sitting) <= min(sit_out_counts.get(p, 0) for p in playing)
@@ -0,0 +1,138 @@
+# Standings index - kept sorted as games are recorded instead of rebuilt on every render
+
+from bisect import bisect_left, insort
+
+from .stats import calculate_win_percentage
+
+# Sort keys, all "higher is better"
+TIEBREAK_KEYS = {
+    'points_for': lambda stats: stats.get('points_for', 0),
+    'point_diff': lambda stats: stats.get('point_diff', 0),
+    'wins': lambda stats: stats['wins'],
+    'win_pct': lambda stats: calculate_win_percentage(stats['wins'], stats['games_played']),
+}
+
+# Resolved between tied players from their games against each other
+HEAD_TO_HEAD = 'head_to_head'
+
+DEFAULT_TIEBREAKS = ('points_for', 'point_diff', 'wins')
+
+TIEBREAK_PRESETS = {
+    "Points For": DEFAULT_TIEBREAKS,
+    "Win %": ('win_pct', HEAD_TO_HEAD, 'point_diff', 'points_for'),
+    "Point Diff": ('point_diff', 'wins', 'points_for'),
+}
+
+
+class StandingsIndex:
+    """Players kept in rank order; an update is a bisect remove + insert"""
+
+    def __init__(self, tiebreaks=DEFAULT_TIEBREAKS):
+        for key in tiebreaks:
+            if key != HEAD_TO_HEAD and key not in TIEBREAK_KEYS:
+                raise ValueError(f"Unknown tiebreak: {key}")
+        self.tiebreaks = tuple(tiebreaks)
+        if HEAD_TO_HEAD in self.tiebreaks:
+            split = self.tiebreaks.index(HEAD_TO_HEAD)
+            self.sort_keys = self.tiebreaks[:split]
+            self.after_h2h_keys = self.tiebreaks[split + 1:]
+        else:
+            self.sort_keys = self.tiebreaks
+            self.after_h2h_keys = ()
+        self.entries = []      # sorted (negated key tuple, player)
+        self.keys = {}         # player -> entry currently in self.entries
+        self.stats = {}        # player -> stats dict (shared with the scores table)
+        self.head_to_head = {} # (winner, loser) -> games won
+
+    def _sort_key(self, stats):
+        return tuple(-TIEBREAK_KEYS[k](stats) for k in self.sort_keys)
+
+    def update(self, player, stats):
+        """Re-position one player after their stats changed"""
+        self.remove(player)
+        entry = (self._sort_key(stats), player)
+        insort(self.entries, entry)
+        self.keys[player] = entry
+        self.stats[player] = stats
+
+    def remove(self, player):
+        entry = self.keys.pop(player, None)
+        if entry is not None:
+            del self.entries[bisect_left(self.entries, entry)]
+            self.stats.pop(player, None)
+
+    def rename(self, old_name, new_name):
+        stats = self.stats.get(old_name)
+        self.remove(old_name)
+        if stats is not None:
+            self.update(new_name, stats)
+        for (winner, loser), wins in list(self.head_to_head.items()):
+            if old_name in (winner, loser):
+                del self.head_to_head[(winner, loser)]
+                key = (new_name if winner == old_name else winner, new_name if loser == old_name else loser)
+                self.head_to_head[key] = wins
+
+    def record_head_to_head(self, winners, losers):
+        for w in winners:
+            for l in losers:
+                self.head_to_head[(w, l)] = self.head_to_head.get((w, l), 0) + 1
+
+    def rebuild(self, scores, game_scores=()):
+        """Index an existing scores table from scratch"""
+        self.entries = sorted((self._sort_key(stats), player) for player, stats in scores.items())
+        self.keys = {entry[1]: entry for entry in self.entries}
+        self.stats = dict(scores)
+        self.head_to_head = {}
+        for game in game_scores:
+            score1, score2 = game['score']
+            if score1 > score2:
+                self.record_head_to_head(game['team1'], game['team2'])
+            else:
+                self.record_head_to_head(game['team2'], game['team1'])
+
+    def _resolve_ties(self, group):
+        """Order players tied on the sort keys by head-to-head wins within the group"""
+        members = set(group)
+        def h2h_key(player):
+            h2h_wins = sum(self.head_to_head.get((player, other), 0) for other in members if other != player)
+            rest = tuple(TIEBREAK_KEYS[k](self.stats[player]) for k in self.after_h2h_keys)
+            return (h2h_wins,) + rest
+        return sorted(group, key=h2h_key, reverse=True)
+
+    def top(self, k=None):
+        """Players in rank order; only the first k are resolved when k is given"""
+        if HEAD_TO_HEAD not in self.tiebreaks:
+            return [player for _, player in (self.entries if k is None else self.entries[:k])]
+        
+        ranked = []
+        i = 0
+        while i < len(self.entries) and (k is None or len(ranked) < k):
+            j = i + 1
+            while j < len(self.entries) and self.entries[j][0] == self.entries[i][0]:
+                j += 1
+            group = [player for _, player in self.entries[i:j]]
+            ranked.extend(self._resolve_ties(group) if len(group) > 1 else group)
+            i = j
+        return ranked if k is None else ranked[:k]
+
+    def rows(self, k=None):
+        """Standings table rows, as shown on the standings page"""
+        rows = []
+        for i, player in enumerate(self.top(k)):
+            stats = self.stats[player]
+            win_pct = calculate_win_percentage(stats['wins'], stats['games_played'])
+            rows.append({
+                'Rank': i + 1,
+                'Player': player,
+                'Wins': stats['wins'],
+                'Losses': stats['losses'],
+                'Games': stats['games_played'],
+                'Win %': f"{win_pct:.1f}%",
+                'Points For': stats.get('points_for', 0),
+                'Points Against': stats.get('points_against', 0),
+                'Point Diff': stats.get('point_diff', 0)
+            })
+        return rows
+
+    def __len__(self):
+        return len(self.entries)
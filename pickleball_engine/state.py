@@ -0,0 +1,175 @@
+# Tournament state - everything a running tournament needs, with no Streamlit dependency
+
+import copy
+from dataclasses import dataclass, field, fields
+
+from .stats import new_player_stats
+from .standings import StandingsIndex
+from .registry import PairHistory
+from .ratings import RatingTable
+from .schedule import SessionSchedule
+
+
+@dataclass
+class TournamentState:
+    """Explicit tournament state, passed to every scheduler instead of a session"""
+    players: list = field(default_factory=list)
+    num_courts: int = 2
+    num_rounds: int = 1
+    format_choice: str = None
+    partner_mode: str = 'Singles'
+    pairing_mode: str = 'Random'
+    play_mode: str = 'Rounds'
+    fixed_partners: dict = field(default_factory=dict)
+    gender_assignments: dict = field(default_factory=dict)
+    current_round: int = 0
+    scores: dict = field(default_factory=dict)
+    game_scores: list = field(default_factory=list)
+    players_on_break: list = field(default_factory=list)
+    current_games: list = field(default_factory=list)
+    sitting_out: list = field(default_factory=list)
+    court_groups: list = field(default_factory=list)
+    court_game_index: dict = field(default_factory=dict)
+    court_points: dict = field(default_factory=dict)
+    # "round:court:game" -> accepted score report, so each game is scored once
+    court_reports: dict = field(default_factory=dict)
+    # Court clocks for the utilization report: court -> ISO start of its game, and finished [court, start, end]
+    court_started: dict = field(default_factory=dict)
+    court_time: list = field(default_factory=list)
+    # Partner/opponent history keyed by interned player ID
+    history: PairHistory = field(default_factory=PairHistory)
+    sit_out_counts: dict = field(default_factory=dict)
+    # Precomputed SessionSchedule for formats that can be planned ahead
+    schedule: object = None
+    # Next round being built in the background (see prefetch); never saved
+    prefetched: object = None
+    standings: StandingsIndex = field(default_factory=StandingsIndex)
+    ratings: RatingTable = field(default_factory=RatingTable)
+
+    def to_dict(self):
+        """JSON-safe copy of the state (the standings index is rebuilt on load)"""
+        data = {}
+        for f in fields(self):
+            if f.name in ('schedule', 'prefetched', 'standings', 'history', 'ratings'):
+                continue
+            data[f.name] = copy.deepcopy(getattr(self, f.name))
+        data['history'] = self.history.to_dict()
+        data['schedule'] = copy.deepcopy(self.schedule.to_dict()) if self.schedule is not None else None
+        data['ratings'] = self.ratings.to_dict()
+        data['tiebreaks'] = list(self.standings.tiebreaks)
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        data = copy.deepcopy(data)
+        tiebreaks = data.pop('tiebreaks', None)
+        if 'history' in data:
+            data['history'] = PairHistory.from_dict(data['history'])
+        else:
+            # Snapshots written before the player registry kept name-keyed dicts
+            data['history'] = PairHistory.from_legacy(data.pop('partner_history', {}),
+                                                      data.pop('opponent_history', {}))
+        ratings = data.pop('ratings', None)
+        schedule = data.pop('schedule', None)
+        state = cls(**data)
+        if schedule is not None:
+            state.schedule = SessionSchedule.from_dict(schedule)
+        if ratings is not None:
+            state.ratings = RatingTable.from_dict(ratings)
+        else:
+            state.ratings = RatingTable.from_game_scores(state.game_scores)
+        # JSON turns integer court numbers into strings
+        state.court_game_index = {int(c): i for c, i in state.court_game_index.items()}
+        state.court_points = {int(c): pts for c, pts in state.court_points.items()}
+        state.court_started = {int(c): at for c, at in state.court_started.items()}
+        if tiebreaks:
+            state.standings = StandingsIndex(tuple(tiebreaks))
+        state.standings.rebuild(state.scores, state.game_scores)
+        return state
+
+    def active_players(self):
+        """Players who are not on a break this round"""
+        return [p for p in self.players if p not in self.players_on_break]
+
+    def active_fixed_partners(self):
+        """Fixed partner map, or None when partners rotate"""
+        return self.fixed_partners if self.partner_mode == "Fixed Partners" else None
+
+    def ensure_player_stats(self, players):
+        for player in players:
+            if player not in self.scores:
+                self.scores[player] = new_player_stats()
+                self.standings.update(player, self.scores[player])
+
+    def update_standings(self, winners, losers):
+        """Re-rank the four players from a game that was just recorded"""
+        for player in winners + losers:
+            self.standings.update(player, self.scores[player])
+        self.standings.record_head_to_head(winners, losers)
+
+    def set_tiebreaks(self, tiebreaks):
+        """Switch the standings to a different tiebreak chain"""
+        self.standings = StandingsIndex(tiebreaks)
+        self.standings.rebuild(self.scores, self.game_scores)
+
+    def reset(self):
+        """Clear results but keep the roster and settings"""
+        self.current_round = 0
+        self.scores = {}
+        self.game_scores = []
+        self.current_games = []
+        self.sitting_out = []
+        self.court_groups = []
+        self.court_reports = {}
+        self.court_started = {}
+        self.court_time = []
+        self.history = PairHistory()
+        self.ratings = RatingTable()
+        self.sit_out_counts = {}
+        self.schedule = None
+        self.prefetched = None
+        self.standings = StandingsIndex(self.standings.tiebreaks)
+
+    def rename_player(self, old_name, new_name):
+        """Replace a player everywhere they are referenced"""
+        self.players = [new_name if p == old_name else p for p in self.players]
+        if self.schedule is not None:
+            self.schedule.players = [new_name if p == old_name else p for p in self.schedule.players]
+        
+        if old_name in self.scores:
+            self.scores[new_name] = self.scores.pop(old_name)
+        self.standings.rename(old_name, new_name)
+        self.ratings.rename(old_name, new_name)
+
+        # Past games too: a snapshot or reload rebuilds head-to-head from them
+        for game in self.game_scores:
+            for team in ('team1', 'team2'):
+                if old_name in game[team]:
+                    game[team] = [new_name if p == old_name else p for p in game[team]]
+        
+        if old_name in self.fixed_partners:
+            partner = self.fixed_partners.pop(old_name)
+            self.fixed_partners[new_name] = partner
+            if partner in self.fixed_partners:
+                self.fixed_partners[partner] = new_name
+        
+        if old_name in self.sit_out_counts:
+            self.sit_out_counts[new_name] = self.sit_out_counts.pop(old_name)
+        
+        # History is keyed by ID, so only the registry entry changes
+        self.history.rename(old_name, new_name)
+
+    def remove_player(self, player):
+        """Drop a player who left early"""
+        if player in self.players:
+            self.players.remove(player)
+        self.scores.pop(player, None)
+        self.standings.remove(player)
+        self.ratings.remove(player)
+        self.sit_out_counts.pop(player, None)
+        
+        if player in self.fixed_partners:
+            partner = self.fixed_partners.pop(player)
+            self.fixed_partners.pop(partner, None)
+        
+        self.history.remove(player)
@@ -0,0 +1,20 @@
+# Per-player stats entries
+
+
+def new_player_stats():
+    """Empty stats entry for a player who hasn't played yet"""
+    return {
+        'wins': 0,
+        'losses': 0,
+        'games_played': 0,
+        'points': 0,
+        'points_for': 0,
+        'points_against': 0,
+        'point_diff': 0
+    }
+
+
+def calculate_win_percentage(wins, games):
+    if games == 0:
+        return 0
+    return (wins / games) * 100
@@ -0,0 +1,307 @@
+# Event storage - rosters persisted by event code so players can check in from their phones.
+# The backend is pluggable: SQLite (default) or the original one-JSON-file-per-event store.
+
+import json
+import os
+import random
+import sqlite3
+import string
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows - fall back to in-process locking only
+    fcntl = None
+
+# Results of a check-in attempt
+CHECKED_IN = 'checked_in'
+ALREADY_CHECKED_IN = 'already_checked_in'
+EVENT_FULL = 'event_full'
+EVENT_NOT_FOUND = 'event_not_found'
+
+
+def get_data_dir():
+    """Get or create the data directory for storing events"""
+    data_dir = Path(os.environ.get("PICKLEBALL_DATA_DIR", Path.home() / ".pickleball_events"))
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir
+
+def generate_event_code():
+    """Generate a unique 6-character event code"""
+    return ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
+
+
+class JsonFileStore:
+    """One JSON document per event, rewritten on every change.
+
+    Read-modify-write updates hold an exclusive lock file, and documents are
+    replaced by atomic rename so readers never see a half-written file.
+    """
+
+    def __init__(self, data_dir=None):
+        self.data_dir = Path(data_dir) if data_dir else get_data_dir()
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self._thread_lock = threading.Lock()
+
+    def _path(self, event_code):
+        return self.data_dir / f"{event_code}.json"
+
+    @contextmanager
+    def _locked(self, event_code):
+        with self._thread_lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.data_dir / f"{event_code}.lock", 'w') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _write(self, event_code, data):
+        file_path = self._path(event_code)
+        tmp_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, file_path)
+
+    def save_event(self, event_code, data):
+        with self._locked(event_code):
+            self._write(event_code, data)
+
+    def load_event(self, event_code):
+        file_path = self._path(event_code)
+        if file_path.exists():
+            with open(file_path, 'r') as f:
+                return json.load(f)
+        return None
+
+    def get_version(self, event_code):
+        """Changes whenever the event is rewritten (the file's mtime); None if it doesn't exist"""
+        try:
+            return self._path(event_code).stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def check_in(self, event_code, player_name):
+        with self._locked(event_code):
+            data = self.load_event(event_code)
+            if not data:
+                return EVENT_NOT_FOUND
+            if player_name in data['players']:
+                return ALREADY_CHECKED_IN
+            if len(data['players']) >= data.get('player_cap', float('inf')):
+                return EVENT_FULL
+            data['players'].append(player_name)
+            self._write(event_code, data)
+            return CHECKED_IN
+
+    def remove_player(self, event_code, player_name):
+        with self._locked(event_code):
+            data = self.load_event(event_code)
+            if data and player_name in data['players']:
+                data['players'].remove(player_name)
+                self._write(event_code, data)
+
+    def rename_player(self, event_code, old_name, new_name):
+        with self._locked(event_code):
+            data = self.load_event(event_code)
+            if data and old_name in data['players']:
+                data['players'] = [new_name if p == old_name else p for p in data['players']]
+                self._write(event_code, data)
+
+
+class SQLiteEventStore:
+    """Events and check-ins as rows in one SQLite database (WAL mode).
+
+    A check-in is a single INSERT; nothing rewrites a whole event.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS events (
+            event_code TEXT PRIMARY KEY,
+            data TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS players (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_code TEXT NOT NULL,
+            name TEXT NOT NULL,
+            UNIQUE (event_code, name)
+        );
+        CREATE INDEX IF NOT EXISTS players_by_event ON players (event_code, id);
+        CREATE TABLE IF NOT EXISTS event_versions (
+            event_code TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE TRIGGER IF NOT EXISTS bump_version_on_insert AFTER INSERT ON players BEGIN
+            INSERT INTO event_versions (event_code, version) VALUES (NEW.event_code, 1)
+            ON CONFLICT (event_code) DO UPDATE SET version = version + 1;
+        END;
+        CREATE TRIGGER IF NOT EXISTS bump_version_on_update AFTER UPDATE ON players BEGIN
+            INSERT INTO event_versions (event_code, version) VALUES (NEW.event_code, 1)
+            ON CONFLICT (event_code) DO UPDATE SET version = version + 1;
+        END;
+        CREATE TRIGGER IF NOT EXISTS bump_version_on_delete AFTER DELETE ON players BEGIN
+            INSERT INTO event_versions (event_code, version) VALUES (OLD.event_code, 1)
+            ON CONFLICT (event_code) DO UPDATE SET version = version + 1;
+        END;
+        CREATE TRIGGER IF NOT EXISTS bump_version_on_event_insert AFTER INSERT ON events BEGIN
+            INSERT INTO event_versions (event_code, version) VALUES (NEW.event_code, 1)
+            ON CONFLICT (event_code) DO UPDATE SET version = version + 1;
+        END;
+        CREATE TRIGGER IF NOT EXISTS bump_version_on_event_update AFTER UPDATE ON events BEGIN
+            INSERT INTO event_versions (event_code, version) VALUES (NEW.event_code, 1)
+            ON CONFLICT (event_code) DO UPDATE SET version = version + 1;
+        END;
+    """
+
+    def __init__(self, path=None):
+        self.path = str(path or get_data_dir() / "events.db")
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+
+    @property
+    def conn(self):
+        """One connection per process, shared by Streamlit's script threads"""
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(self.SCHEMA)
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def save_event(self, event_code, data):
+        data = dict(data)
+        players = data.pop('players', [])
+        with self._lock:
+            conn = self.conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT INTO events (event_code, data) VALUES (?, ?) "
+                    "ON CONFLICT (event_code) DO UPDATE SET data = excluded.data",
+                    (event_code, json.dumps(data))
+                )
+                conn.execute("DELETE FROM players WHERE event_code = ?", (event_code,))
+                conn.executemany(
+                    "INSERT OR IGNORE INTO players (event_code, name) VALUES (?, ?)",
+                    [(event_code, p) for p in players]
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def load_event(self, event_code):
+        with self._lock:
+            row = self.conn.execute("SELECT data FROM events WHERE event_code = ?", (event_code,)).fetchone()
+            if row is None:
+                return None
+            players = self.conn.execute(
+                "SELECT name FROM players WHERE event_code = ? ORDER BY id", (event_code,)
+            ).fetchall()
+        data = json.loads(row[0])
+        data['players'] = [name for (name,) in players]
+        return data
+
+    def get_version(self, event_code):
+        """Counter bumped by triggers on every roster or event change; None if the event doesn't exist"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT version FROM event_versions WHERE event_code = ?", (event_code,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def check_in(self, event_code, player_name):
+        with self._lock:
+            conn = self.conn
+            # The cap check and the insert are one statement, so concurrent writers can't overshoot
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO players (event_code, name) "
+                "SELECT e.event_code, ? FROM events e WHERE e.event_code = ? "
+                "AND (SELECT COUNT(*) FROM players p WHERE p.event_code = e.event_code) "
+                "    < COALESCE(json_extract(e.data, '$.player_cap'), 9223372036854775807)",
+                (player_name, event_code)
+            )
+            if cursor.rowcount == 1:
+                return CHECKED_IN
+            if conn.execute("SELECT 1 FROM events WHERE event_code = ?", (event_code,)).fetchone() is None:
+                return EVENT_NOT_FOUND
+            if conn.execute(
+                "SELECT 1 FROM players WHERE event_code = ? AND name = ?", (event_code, player_name)
+            ).fetchone():
+                return ALREADY_CHECKED_IN
+            return EVENT_FULL
+
+    def remove_player(self, event_code, player_name):
+        with self._lock:
+            self.conn.execute("DELETE FROM players WHERE event_code = ? AND name = ?", (event_code, player_name))
+
+    def rename_player(self, event_code, old_name, new_name):
+        with self._lock:
+            self.conn.execute(
+                "UPDATE OR IGNORE players SET name = ? WHERE event_code = ? AND name = ?",
+                (new_name, event_code, old_name)
+            )
+
+
+STORE_BACKENDS = {
+    'sqlite': SQLiteEventStore,
+    'json': JsonFileStore,
+}
+
+_store = None
+
+def get_store():
+    """The process-wide event store, chosen by the PICKLEBALL_STORE environment variable"""
+    global _store
+    if _store is None:
+        backend = os.environ.get("PICKLEBALL_STORE", "sqlite")
+        if backend not in STORE_BACKENDS:
+            raise ValueError(f"Unknown PICKLEBALL_STORE backend: {backend}")
+        _store = STORE_BACKENDS[backend]()
+    return _store
+
+def set_store(store):
+    """Use a specific store instance (e.g. one pointing at another database)"""
+    global _store
+    _store = store
+
+def save_event_data(event_code, data):
+    """Save event data"""
+    get_store().save_event(event_code, data)
+
+def load_event_data(event_code):
+    """Load event data"""
+    return get_store().load_event(event_code)
+
+def get_event_version(event_code):
+    """Cheap change marker for an event: compare it to a previous value before reloading the roster"""
+    return get_store().get_version(event_code)
+
+def check_in_player(event_code, player_name):
+    """Atomically add a player to an event, respecting its player cap.
+
+    Returns CHECKED_IN, ALREADY_CHECKED_IN, EVENT_FULL or EVENT_NOT_FOUND.
+    """
+    return get_store().check_in(event_code, player_name.strip())
+
+def add_player_to_event(event_code, player_name):
+    """Add a player to an event"""
+    if player_name and player_name.strip():
+        return check_in_player(event_code, player_name) == CHECKED_IN
+    return False
+
+def remove_player_from_event(event_code, player_name):
+    """Remove a player from an event's roster"""
+    get_store().remove_player(event_code, player_name)
+
+def rename_player_in_event(event_code, old_name, new_name):
+    """Replace a player on an event's roster, keeping their check-in position"""
+    get_store().rename_player(event_code, old_name, new_name)
@@ -0,0 +1,77 @@
+# Court utilization - how much of the session each court spent with a game on it
+
+from datetime import datetime
+
+from .court_scores import current_court_game
+
+
+def start_court(state, court, at):
+    """A game just went on a court at time `at` (ISO timestamp from the event)"""
+    if at is not None:
+        state.court_started[court] = at
+
+def finish_court(state, court, at):
+    """A court's game just ended; its busy interval moves to court_time"""
+    started = state.court_started.pop(court, None)
+    if started is not None and at is not None:
+        state.court_time.append([court, started, at])
+
+def restart_courts(state, courts, at):
+    """A new round: close whatever was still open and start the round's courts"""
+    for court in list(state.court_started):
+        finish_court(state, court, at)
+    for court in courts:
+        start_court(state, court, at)
+
+def track_scored_courts(state, courts, at):
+    """Courts that just reported: stop their clocks, restarting those whose group plays on"""
+    for court in courts:
+        finish_court(state, court, at)
+        if state.court_groups and current_court_game(state, court) is not None:
+            start_court(state, court, at)
+
+def court_utilization(state, now=None):
+    """Share of the session each court was in use, or None before any game has started.
+
+    The session runs from the first game starting to `now` while courts are still busy,
+    otherwise to the last game finishing. A court only counts as free once its score is
+    in, so a round whose courts wait for Submit All shows their wait as busy time - score
+    from the courts' phones to measure round-based play fairly.
+    """
+    now = now or datetime.now()
+    intervals = [(court, datetime.fromisoformat(start), datetime.fromisoformat(end))
+                 for court, start, end in state.court_time]
+    intervals += [(court, datetime.fromisoformat(start), now) for court, start in state.court_started.items()]
+    if not intervals:
+        return None
+
+    session_start = min(start for _, start, _ in intervals)
+    session_end = now if state.court_started else max(end for _, _, end in intervals)
+    span = max((session_end - session_start).total_seconds(), 1)
+
+    by_court = {}
+    for court, start, end in sorted(intervals, key=lambda interval: interval[1]):
+        by_court.setdefault(court, []).append((start, end))
+
+    courts = []
+    changeovers = []
+    for court, spans in sorted(by_court.items()):
+        busy = sum((end - start).total_seconds() for start, end in spans)
+        # Idle time between one game ending on this court and the next starting
+        changeovers += [max((spans[i + 1][0] - spans[i][1]).total_seconds(), 0) for i in range(len(spans) - 1)]
+        courts.append({
+            'court': court,
+            'games': sum(1 for c, _, _ in state.court_time if c == court),
+            'busy_minutes': busy / 60,
+            'utilization': busy / span
+        })
+
+    games = len(state.court_time)
+    return {
+        'courts': courts,
+        'utilization': sum(c['busy_minutes'] * 60 for c in courts) / (span * len(courts)),
+        'games': games,
+        'games_per_hour': games * 3600 / span,
+        'span_minutes': span / 60,
+        'avg_changeover_seconds': sum(changeovers) / len(changeovers) if changeovers else 0
+    }
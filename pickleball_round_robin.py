@@ -2,15 +2,41 @@
 # Home → Format Selection → Player Check-in (QR Code) → Play
 
 import streamlit as st
-import random
-from itertools import combinations
+import uuid
 from datetime import datetime
-import qrcode
-from io import BytesIO
-import json
-from pathlib import Path
-import string
-import time
+
+from pickleball_engine import (
+    TournamentState,
+    TIEBREAK_PRESETS,
+    ScoreError,
+    current_court_game,
+    court_report,
+    submit_court_score,
+    submit_round_scores,
+    continuous_play,
+    court_utilization,
+    FORMAT_NAMES,
+    CONTINUOUS_FORMATS,
+    simulate_configs,
+    EventLog,
+    get_live_event,
+    start_round,
+    current_settings,
+    save_settings,
+    generate_event_code,
+    save_event_data,
+    load_event_data,
+    get_event_version,
+    check_in_player,
+    CHECKED_IN,
+    ALREADY_CHECKED_IN,
+    EVENT_FULL,
+    remove_player_from_event,
+    rename_player_in_event,
+    render_qr_png,
+    render_qr_svg,
+    render_qr_print_sheet,
+)
 
 # ============================================
 # PAGE CONFIGURATION
@@ -21,45 +47,8 @@ st.set_page_config(
     layout="wide"
 )
 
-# ============================================
-# EVENT STORAGE FUNCTIONS
-# ============================================
-
-def get_data_dir():
-    """Get or create the data directory for storing events"""
-    data_dir = Path("/tmp/pickleball_events")
-    data_dir.mkdir(exist_ok=True)
-    return data_dir
-
-def generate_event_code():
-    """Generate a unique 6-character event code"""
-    return ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
-
-def save_event_data(event_code, data):
-    """Save event data to JSON file"""
-    data_dir = get_data_dir()
-    file_path = data_dir / f"{event_code}.json"
-    with open(file_path, 'w') as f:
-        json.dump(data, f)
-
-def load_event_data(event_code):
-    """Load event data from JSON file"""
-    data_dir = get_data_dir()
-    file_path = data_dir / f"{event_code}.json"
-    if file_path.exists():
-        with open(file_path, 'r') as f:
-            return json.load(f)
-    return None
-
-def add_player_to_event(event_code, player_name):
-    """Add a player to an event"""
-    data = load_event_data(event_code)
-    if data and player_name and player_name.strip():
-        if player_name not in data['players']:
-            data['players'].append(player_name.strip())
-            save_event_data(event_code, data)
-            return True
-    return False
+# Public address of the app, used in check-in and court score links
+APP_URL = "https://pickleball-round-robin-generator-gdye9ixyhszt29qbtmsufy.streamlit.app"
 
 # ============================================
 # SESSION STATE INITIALIZATION
@@ -73,551 +62,61 @@ if 'event_name' not in st.session_state:
 if 'event_code' not in st.session_state:
     st.session_state.event_code = None
 
-if 'format_choice' not in st.session_state:
-    st.session_state.format_choice = None
-
 if 'game_score' not in st.session_state:
     st.session_state.game_score = 11
 
 if 'player_cap' not in st.session_state:
     st.session_state.player_cap = 16
 
-if 'num_courts' not in st.session_state:
-    st.session_state.num_courts = 2
-
-if 'num_rounds' not in st.session_state:
-    st.session_state.num_rounds = 1
-
-if 'players' not in st.session_state:
-    st.session_state.players = []
-
-if 'current_round' not in st.session_state:
-    st.session_state.current_round = 0
-
-if 'scores' not in st.session_state:
-    st.session_state.scores = {}
-
-if 'game_scores' not in st.session_state:
-    st.session_state.game_scores = []
-
-if 'players_on_break' not in st.session_state:
-    st.session_state.players_on_break = []
-
-if 'current_games' not in st.session_state:
-    st.session_state.current_games = []
-
-if 'sitting_out' not in st.session_state:
-    st.session_state.sitting_out = []
-
-if 'court_groups' not in st.session_state:
-    st.session_state.court_groups = []
-
-if 'court_game_index' not in st.session_state:
-    st.session_state.court_game_index = {}
-
-if 'court_points' not in st.session_state:
-    st.session_state.court_points = {}
-
-if 'partner_mode' not in st.session_state:
-    st.session_state.partner_mode = 'Singles'
-
-if 'fixed_partners' not in st.session_state:
-    st.session_state.fixed_partners = {}
-
-if 'gender_assignments' not in st.session_state:
-    st.session_state.gender_assignments = {}
+if 'tournament' not in st.session_state:
+    st.session_state.tournament = TournamentState()
 
-if 'partner_history' not in st.session_state:
-    st.session_state.partner_history = {}
+# Every tournament action is logged, so the state can be rebuilt after a refresh
+if 'event_log' not in st.session_state:
+    st.session_state.event_log = EventLog()
 
 # ============================================
 # HELPER FUNCTIONS
 # ============================================
 
-def calculate_win_percentage(wins, games):
-    if games == 0:
-        return 0
-    return (wins / games) * 100
-
-def create_classic_round_robin_matchups(players, num_courts):
-    """Classic Round Robin"""
-    if 'partner_history' not in st.session_state:
-        st.session_state.partner_history = {}
-    
-    for player in players:
-        if player not in st.session_state.partner_history:
-            st.session_state.partner_history[player] = set()
-    
-    def get_unpartnered_pair(available_players):
-        if len(available_players) < 2:
-            return None
-            
-        for i, p1 in enumerate(available_players):
-            for p2 in available_players[i+1:]:
-                if p2 not in st.session_state.partner_history.get(p1, set()):
-                    return (p1, p2)
-        return (available_players[0], available_players[1])
-    
-    shuffled = players.copy()
-    random.shuffle(shuffled)
-    
-    players_per_round = num_courts * 4
-    playing = shuffled[:players_per_round]
-    sitting = shuffled[players_per_round:]
-    
-    games = []
-    used_players = set()
-    
-    for court in range(num_courts):
-        available = [p for p in playing if p not in used_players]
-        if len(available) < 4:
-            break
-            
-        pair1 = get_unpartnered_pair(available)
-        if not pair1:
-            break
-            
-        used_players.add(pair1[0])
-        used_players.add(pair1[1])
-        
-        available = [p for p in playing if p not in used_players]
-        pair2 = get_unpartnered_pair(available)
-        if not pair2:
-            break
-            
-        used_players.add(pair2[0])
-        used_players.add(pair2[1])
-        
-        games.append({
-            'court': court + 1,
-            'team1': [pair1[0], pair1[1]],
-            'team2': [pair2[0], pair2[1]]
-        })
-        
-        for p in [pair1[0], pair1[1], pair2[0], pair2[1]]:
-            if p not in st.session_state.partner_history:
-                st.session_state.partner_history[p] = set()
-                
-        st.session_state.partner_history[pair1[0]].add(pair1[1])
-        st.session_state.partner_history[pair1[1]].add(pair1[0])
-        st.session_state.partner_history[pair2[0]].add(pair2[1])
-        st.session_state.partner_history[pair2[1]].add(pair2[0])
-    
-    return games, sitting
-
-def create_popcorn_matchups(players, num_courts, fixed_partners=None):
-    """Popcorn: Random matchups"""
-    if fixed_partners:
-        available_pairs = list(fixed_partners.items())
-        random.shuffle(available_pairs)
-        
-        games = []
-        for i in range(0, len(available_pairs) - 1, 2):
-            if i + 1 < len(available_pairs):
-                pair1 = available_pairs[i]
-                pair2 = available_pairs[i + 1]
-                
-                if len(games) < num_courts:
-                    games.append({
-                        'court': len(games) + 1,
-                        'team1': [pair1[0], pair1[1]],
-                        'team2': [pair2[0], pair2[1]]
-                    })
-        
-        sitting_out = []
-        if len(available_pairs) % 2 == 1:
-            last_pair = available_pairs[-1]
-            sitting_out = [last_pair[0], last_pair[1]]
-        
-        return games, sitting_out
-    else:
-        shuffled = players.copy()
-        random.shuffle(shuffled)
-        
-        players_per_round = num_courts * 4
-        playing = shuffled[:players_per_round]
-        sitting = shuffled[players_per_round:]
-        
-        games = []
-        for i in range(0, len(playing), 4):
-            if i + 3 < len(playing):
-                four = playing[i:i+4]
-                games.append({
-                    'court': (i // 4) + 1,
-                    'team1': [four[0], four[1]],
-                    'team2': [four[2], four[3]]
-                })
-        
-        return games, sitting
-
-def create_popcorn_matchups(players, num_courts, fixed_partners=None):
-    """Popcorn: Random matchups"""
-    if fixed_partners:
-        available_pairs = list(fixed_partners.items())
-        random.shuffle(available_pairs)
-        
-        games = []
-        for i in range(0, len(available_pairs) - 1, 2):
-            if i + 1 < len(available_pairs):
-                pair1 = available_pairs[i]
-                pair2 = available_pairs[i + 1]
-                
-                if len(games) < num_courts:
-                    games.append({
-                        'court': len(games) + 1,
-                        'team1': [pair1[0], pair1[1]],
-                        'team2': [pair2[0], pair2[1]]
-                    })
-        
-        sitting_out = []
-        if len(available_pairs) % 2 == 1:
-            last_pair = available_pairs[-1]
-            sitting_out = [last_pair[0], last_pair[1]]
-        
-        return games, sitting_out
-    else:
-        shuffled = players.copy()
-        random.shuffle(shuffled)
-        
-        players_per_round = num_courts * 4
-        playing = shuffled[:players_per_round]
-        sitting = shuffled[players_per_round:]
-        
-        games = []
-        for i in range(0, len(playing), 4):
-            if i + 3 < len(playing):
-                four = playing[i:i+4]
-                games.append({
-                    'court': (i // 4) + 1,
-                    'team1': [four[0], four[1]],
-                    'team2': [four[2], four[3]]
-                })
-        
-        return games, sitting
-
-def create_gauntlet_matchups(players, num_courts, scores, fixed_partners=None):
-    """Gauntlet: Winners face harder opponents"""
-    player_rankings = []
-    for player in players:
-        if player in scores:
-            wins = scores[player]['wins']
-            games = scores[player]['games_played']
-            win_pct = calculate_win_percentage(wins, games)
-        else:
-            win_pct = 0
-        player_rankings.append((player, win_pct))
-    
-    player_rankings.sort(key=lambda x: x[1], reverse=True)
-    sorted_players = [p[0] for p in player_rankings]
-    
-    if fixed_partners:
-        pair_rankings = []
-        processed = set()
-        
-        for player in sorted_players:
-            if player not in processed and player in fixed_partners:
-                partner = fixed_partners[player]
-                if partner in scores and player in scores:
-                    avg_win_pct = (
-                        calculate_win_percentage(scores[player]['wins'], scores[player]['games_played']) +
-                        calculate_win_percentage(scores[partner]['wins'], scores[partner]['games_played'])
-                    ) / 2
-                else:
-                    avg_win_pct = 0
-                
-                pair_rankings.append(([player, partner], avg_win_pct))
-                processed.add(player)
-                processed.add(partner)
-        
-        pair_rankings.sort(key=lambda x: x[1], reverse=True)
-        
-        games = []
-        for i in range(0, len(pair_rankings) - 1, 2):
-            if i + 1 < len(pair_rankings) and len(games) < num_courts:
-                games.append({
-                    'court': len(games) + 1,
-                    'team1': pair_rankings[i][0],
-                    'team2': pair_rankings[i + 1][0]
-                })
-        
-        sitting_out = []
-        if len(pair_rankings) % 2 == 1:
-            sitting_out = pair_rankings[-1][0]
-        
-        return games, sitting_out
-    else:
-        shuffled = sorted_players.copy()
-        random.shuffle(shuffled)
-        
-        players_per_round = num_courts * 4
-        playing = shuffled[:players_per_round]
-        sitting = shuffled[players_per_round:]
-        
-        games = []
-        for i in range(0, len(playing), 4):
-            if i + 3 < len(playing):
-                four = playing[i:i+4]
-                games.append({
-                    'court': (i // 4) + 1,
-                    'team1': [four[0], four[1]],
-                    'team2': [four[2], four[3]]
-                })
-        
-        return games, sitting
-
-def create_up_down_river_groups(players, num_courts, scores, fixed_partners=None):
-    """Up & Down: Players seeded to courts"""
-    player_rankings = []
-    for player in players:
-        if player in scores:
-            win_pct = calculate_win_percentage(scores[player]['wins'], scores[player]['games_played'])
-        else:
-            win_pct = 0
-        player_rankings.append((player, win_pct))
-    
-    player_rankings.sort(key=lambda x: x[1], reverse=True)
-    sorted_players = [p[0] for p in player_rankings]
-    
-    if fixed_partners:
-        pair_groups = []
-        processed = set()
-        
-        for player in sorted_players:
-            if player not in processed and player in fixed_partners:
-                partner = fixed_partners[player]
-                pair_groups.append([player, partner])
-                processed.add(player)
-                processed.add(partner)
-        
-        court_assignments = []
-        for i in range(0, len(pair_groups), 2):
-            if i + 1 < len(pair_groups) and len(court_assignments) < num_courts:
-                court_assignments.append({
-                    'court': len(court_assignments) + 1,
-                    'pairs': [pair_groups[i], pair_groups[i + 1]]
-                })
-        
-        return court_assignments
-    else:
-        players_per_court = max(4, len(sorted_players) // num_courts)
-        
-        court_assignments = []
-        for i in range(num_courts):
-            start = i * players_per_court
-            if i == num_courts - 1:
-                court_players = sorted_players[start:]
-            else:
-                court_players = sorted_players[start:start + players_per_court]
-            
-            if len(court_players) >= 4:
-                court_assignments.append({
-                    'court': i + 1,
-                    'players': court_players
-                })
-        
-        return court_assignments
-
-def generate_court_games(court_players):
-    """Generate all partnership combinations for a court"""
-    games = []
-    all_pairs = list(combinations(court_players, 2))
-    
-    used_games = set()
-    for i, pair1 in enumerate(all_pairs):
-        for pair2 in all_pairs[i+1:]:
-            if len(set(pair1 + pair2)) == 4:
-                game_id = tuple(sorted(pair1 + pair2))
-                if game_id not in used_games:
-                    games.append({
-                        'team1': list(pair1),
-                        'team2': list(pair2)
-                    })
-                    used_games.add(game_id)
-    
-    return games
-
-def create_scramble_groups(players, num_courts):
-    """Scramble: Random groups stay on court"""
-    shuffled = players.copy()
-    random.shuffle(shuffled)
-    
-    players_per_court = max(4, len(shuffled) // num_courts)
-    
-    groups = []
-    for i in range(num_courts):
-        start = i * players_per_court
-        if i == num_courts - 1:
-            court_players = shuffled[start:]
-        else:
-            court_players = shuffled[start:start + players_per_court]
-        
-        if len(court_players) >= 4:
-            groups.append({
-                'court': i + 1,
-                'players': court_players
-            })
-    
-    return groups
-
-def create_mixed_madness_matchups(players, num_courts, gender_dict):
-    """Mixed Madness: Random mixed doubles"""
-    males = [p for p in players if gender_dict.get(p) == 'M']
-    females = [p for p in players if gender_dict.get(p) == 'F']
-    
-    random.shuffle(males)
-    random.shuffle(females)
-    
-    games = []
-    sitting_out = []
-    
-    min_pairs = min(len(males), len(females))
-    
-    for i in range(0, min_pairs - 1, 2):
-        if i + 1 < min_pairs and len(games) < num_courts:
-            games.append({
-                'court': len(games) + 1,
-                'team1': [males[i], females[i]],
-                'team2': [males[i + 1], females[i + 1]]
-            })
-    
-    if min_pairs % 2 == 1:
-        sitting_out.extend([males[min_pairs - 1], females[min_pairs - 1]])
-    
-    for i in range(min_pairs, len(males)):
-        sitting_out.append(males[i])
-    for i in range(min_pairs, len(females)):
-        sitting_out.append(females[i])
-    
-    return games, sitting_out
-
-def create_cream_crop_groups(players, num_courts, scores):
-    """Cream of the Crop: Rising stars format"""
-    player_rankings = []
-    for player in players:
-        if player in scores:
-            win_pct = calculate_win_percentage(scores[player]['wins'], scores[player]['games_played'])
-        else:
-            win_pct = 0
-        player_rankings.append((player, win_pct))
-    
-    player_rankings.sort(key=lambda x: x[1], reverse=True)
-    sorted_players = [p[0] for p in player_rankings]
-    
-    players_per_court = max(4, len(sorted_players) // num_courts)
-    
-    court_assignments = []
-    for i in range(num_courts):
-        start = i * players_per_court
-        if i == num_courts - 1:
-            court_players = sorted_players[start:]
-        else:
-            court_players = sorted_players[start:start + players_per_court]
-        
-        if len(court_players) >= 4:
-            court_assignments.append({
-                'court': i + 1,
-                'players': court_players
-            })
-    
-    return court_assignments
-
 # Shortened helper functions for brevity - keeping only essential ones
 def go_to_page(page_name):
     st.session_state.page = page_name
     st.rerun()
 
-def reset_tournament():
-    st.session_state.current_round = 0
-    st.session_state.scores = {}
-    st.session_state.game_scores = []
-    st.session_state.current_games = []
-    st.session_state.sitting_out = []
-    st.session_state.court_groups = []
-    st.session_state.partner_history = {}
+def attach_event(event_code, state=None):
+    """Point this session at the server-wide live copy of an event, shared with every other device"""
+    live = get_live_event(event_code, state)
+    if live is None:
+        return None
+    st.session_state.event_log = live.log
+    st.session_state.tournament = live.state
+    st.session_state.event_code = event_code
+    return live
 
-def generate_new_round():
-    """Generate matchups for a new round"""
-    players = [p for p in st.session_state.players if p not in st.session_state.players_on_break]
-    num_courts = st.session_state.num_courts
-    format_choice = st.session_state.format_choice
-    fixed_partners = st.session_state.fixed_partners if st.session_state.partner_mode == "Fixed Partners" else None
-    
-    for player in players:
-        if player not in st.session_state.scores:
-            st.session_state.scores[player] = {
-                'wins': 0,
-                'losses': 0,
-                'games_played': 0,
-                'points': 0,
-                'points_for': 0,
-                'points_against': 0,
-                'point_diff': 0
-            }
+def resume_event(event_code):
+    """Join an event's live state from another device, or after a browser refresh"""
+    event_data = load_event_data(event_code)
+    if not event_data:
+        return
     
-    if format_choice == "Classic Round Robin":
-        games, sitting = create_classic_round_robin_matchups(players, num_courts)
-        st.session_state.current_games = games
-        st.session_state.sitting_out = sitting
-        st.session_state.court_groups = []
-        
-    elif format_choice == "Popcorn":
-        games, sitting = create_popcorn_matchups(players, num_courts, fixed_partners)
-        st.session_state.current_games = games
-        st.session_state.sitting_out = sitting
-        st.session_state.court_groups = []
-        
-    elif format_choice == "Gauntlet":
-        games, sitting = create_gauntlet_matchups(players, num_courts, st.session_state.scores, fixed_partners)
-        st.session_state.current_games = games
-        st.session_state.sitting_out = sitting
-        st.session_state.court_groups = []
-        
-    elif format_choice == "Up and Down the River":
-        groups = create_up_down_river_groups(players, num_courts, st.session_state.scores, fixed_partners)
-        st.session_state.court_groups = groups
-        st.session_state.current_games = []
-        st.session_state.court_game_index = {g['court']: 0 for g in groups}
-        
-        # Set court points
-        for i, group in enumerate(groups):
-            st.session_state.court_points[group['court']] = num_courts - i
-    
-    elif format_choice == "Claim the Throne":
-        games, sitting = create_gauntlet_matchups(players, num_courts, st.session_state.scores, fixed_partners)
-        st.session_state.current_games = games
-        st.session_state.sitting_out = sitting
-        
-        # Weighted points
-        for game in games:
-            st.session_state.court_points[game['court']] = num_courts - game['court'] + 1
-    
-    elif format_choice in ["Double Header", "Scramble"]:
-        groups = create_scramble_groups(players, num_courts)
-        st.session_state.court_groups = groups
-        st.session_state.current_games = []
-        st.session_state.court_game_index = {g['court']: 0 for g in groups}
-    
-    elif format_choice == "Cream of the Crop":
-        groups = create_cream_crop_groups(players, num_courts, st.session_state.scores)
-        st.session_state.court_groups = groups
-        st.session_state.current_games = []
-        st.session_state.court_game_index = {g['court']: 0 for g in groups}
-        
-        # Set court points
-        for i, group in enumerate(groups):
-            st.session_state.court_points[group['court']] = num_courts - i
-    
-    elif format_choice == "Mixed Madness":
-        games, sitting = create_mixed_madness_matchups(players, num_courts, st.session_state.gender_assignments)
-        st.session_state.current_games = games
-        st.session_state.sitting_out = sitting
-        st.session_state.court_groups = []
+    state = attach_event(event_code).state
+    st.session_state.event_name = event_data['event_name']
+    st.session_state.player_cap = event_data.get('player_cap', st.session_state.player_cap)
+    
+    if state.current_round:
+        st.session_state.page = 'play'
+    elif state.format_choice:
+        st.session_state.page = 'player_checkin'
+    else:
+        st.session_state.page = 'format_selection'
 
 # ============================================
 # PAGE 1: HOME / EVENT SETUP
 # ============================================
 
 def show_home_page():
+    state = st.session_state.tournament
     st.title("🏓 Round Robin Generator")
     
     st.markdown("---")
@@ -656,10 +155,25 @@ def show_home_page():
         "How many courts are available?",
         min_value=1,
         max_value=20,
-        value=st.session_state.num_courts,
+        value=state.num_courts,
         step=1
     )
-    st.session_state.num_courts = num_courts
+    
+    num_rounds = st.number_input(
+        "How many rounds will you play?",
+        min_value=1,
+        max_value=30,
+        value=state.num_rounds,
+        step=1,
+        help="Rounds are planned up front for formats that don't depend on results"
+    )
+    
+    continuous = st.checkbox(
+        "Continuous play (no rounds)",
+        value=state.play_mode == "Continuous",
+        help="Classic Round Robin and Popcorn with rotating partners: each court gets its next game "
+             "from the waiting queue as soon as it reports a score, instead of waiting for the whole round"
+    )
     
     st.markdown("")
     
@@ -667,16 +181,33 @@ def show_home_page():
     st.markdown("#### 4. Partners")
     partner_type = st.checkbox(
         "Fixed Partners",
-        value=st.session_state.partner_mode == "Fixed Partners",
+        value=state.partner_mode == "Fixed Partners",
         help="Check for fixed partners, uncheck for random partners"
     )
     
+    pairing_mode = state.pairing_mode
     if partner_type:
-        st.session_state.partner_mode = "Fixed Partners"
         st.success("✅ Partners will stay together throughout the tournament")
     else:
-        st.session_state.partner_mode = "Singles"
         st.success("✅ Partners will be randomly assigned each round")
+        
+        balance_teams = st.checkbox(
+            "Balance teams by skill",
+            value=state.pairing_mode == "Balanced",
+            help="Classic Round Robin and Popcorn: put similar players on each court and split teams "
+                 "so games are as close as possible, using ratings from this session's results"
+        )
+        pairing_mode = "Balanced" if balance_teams else "Random"
+    
+    # Logged, so the event is rebuilt with these settings after a restart or on another server
+    save_settings(
+        state, st.session_state.event_log,
+        num_courts=num_courts,
+        num_rounds=num_rounds,
+        play_mode="Continuous" if continuous else "Rounds",
+        partner_mode="Fixed Partners" if partner_type else "Singles",
+        pairing_mode=pairing_mode
+    )
     
     st.markdown("---")
     
@@ -697,11 +228,18 @@ def show_home_page():
                     'event_code': event_code,
                     'player_cap': player_cap,
                     'num_courts': num_courts,
-                    'partner_mode': st.session_state.partner_mode,
+                    'partner_mode': state.partner_mode,
                     'players': [],
                     'created_at': datetime.now().isoformat()
                 }
                 save_event_data(event_code, event_data)
+                # A fresh state, never the previous event's - only the settings chosen above carry over
+                live = attach_event(event_code, TournamentState())
+                # The event's log starts with its settings, so it can always be rebuilt with them.
+                # Breaks and partner/gender assignments name the last event's players, so they start empty
+                settings = dict(current_settings(state), players_on_break=[], fixed_partners={}, gender_assignments={})
+                live.record('settings', settings=settings)
+                st.query_params['event'] = event_code
                 
                 go_to_page('format_selection')
 
@@ -709,7 +247,21 @@ def show_home_page():
 # PAGE 2: FORMAT SELECTION
 # ============================================
 
+# Simulated sessions per format in the format comparison
+FORMAT_SIMULATION_SESSIONS = 100
+
+@st.cache_data(show_spinner=False)
+def simulate_formats(num_players, num_courts, num_rounds, play_mode):
+    """Expected session length and play time for every format - cached, it's the same for every event this size"""
+    configs = [
+        {'format': name, 'players': num_players, 'courts': num_courts, 'rounds': num_rounds,
+         'play_mode': play_mode if name in CONTINUOUS_FORMATS else "Rounds"}
+        for name in FORMAT_NAMES
+    ]
+    return simulate_configs(configs, FORMAT_SIMULATION_SESSIONS)
+
 def show_format_selection_page():
+    state = st.session_state.tournament
     st.title("🏓 " + st.session_state.event_name)
     
     if st.button("← Back"):
@@ -785,8 +337,35 @@ def show_format_selection_page():
                 
                 st.markdown("")
     
+    # Monte Carlo estimate for this event's courts and rounds, run on request
+    with st.expander("⏱️ Compare formats - simulated session length and play time"):
+        st.caption(f"{FORMAT_SIMULATION_SESSIONS} simulated sessions per format with {state.num_courts} courts "
+                   f"and {state.num_rounds} rounds, ~12 minute games")
+        expected_players = st.number_input(
+            "Expected players",
+            min_value=4,
+            max_value=max(st.session_state.player_cap, 4),
+            value=max(st.session_state.player_cap, 4),
+            step=1
+        )
+        if st.button("▶️ Simulate", key="simulate_formats"):
+            with st.spinner("Simulating sessions..."):
+                summaries = simulate_formats(expected_players, state.num_courts, state.num_rounds, state.play_mode)
+            st.dataframe([
+                {
+                    'Format': r['format'] + (" (continuous)" if r['play_mode'] == "Continuous" else ""),
+                    'Session (min)': round(r['session_minutes']),
+                    'Longest 10% (min)': round(r['session_minutes_p90']),
+                    'Court idle': f"{r['court_idle_share']:.0%}",
+                    'Games per player': round(r['games_per_player'], 1),
+                    'Games per player per hour': round(r['games_per_player_hour'], 2),
+                    'Sit-out spread': '-' if r['sit_out_spread'] is None else round(r['sit_out_spread'], 1)
+                }
+                for r in sorted(summaries, key=lambda r: r['games_per_player_hour'], reverse=True)
+            ], use_container_width=True, hide_index=True)
+    
     if selected_format:
-        st.session_state.format_choice = selected_format
+        save_settings(state, st.session_state.event_log, format_choice=selected_format)
         go_to_page('player_checkin')
 
 # ============================================
@@ -809,23 +388,28 @@ def show_player_checkin_page():
     with col1:
         st.markdown("### QR Code for Players")
         
-        # Get the current app URL
-        base_url = "https://pickleball-round-robin-generator-gdye9ixyhszt29qbtmsufy.streamlit.app"
-        check_in_url = f"{base_url}/?join={st.session_state.event_code}"
-        
-        # Generate QR code
-        qr = qrcode.QRCode(version=1, box_size=10, border=4)
-        qr.add_data(check_in_url)
-        qr.make(fit=True)
+        check_in_url = f"{APP_URL}/?join={st.session_state.event_code}"
         
-        img = qr.make_image(fill_color="#4A5568", back_color="white")
+        # QR code - rendered once per check-in URL and cached for the whole server
+        st.image(render_qr_png(check_in_url), caption="Scan to Check In", width=300)
         
-        # Convert to bytes
-        buf = BytesIO()
-        img.save(buf, format='PNG')
-        buf.seek(0)
-        
-        st.image(buf, caption="Scan to Check In", width=300)
+        col_svg, col_print = st.columns(2)
+        with col_svg:
+            st.download_button(
+                "⬇️ SVG",
+                data=render_qr_svg(check_in_url),
+                file_name=f"checkin_{st.session_state.event_code}.svg",
+                mime="image/svg+xml",
+                use_container_width=True
+            )
+        with col_print:
+            st.download_button(
+                "🖨️ Printable PDF",
+                data=render_qr_print_sheet(check_in_url, caption=f"{st.session_state.event_name} - Scan to Check In"),
+                file_name=f"checkin_{st.session_state.event_code}.pdf",
+                mime="application/pdf",
+                use_container_width=True
+            )
         
         st.markdown("---")
         st.markdown("### Share This Link")
@@ -833,59 +417,73 @@ def show_player_checkin_page():
         st.caption(f"Event Code: **{st.session_state.event_code}**")
     
     with col2:
-        # Load current players from event data
+        show_checked_in_players()
+
+# How often the roster panel checks the event store for new check-ins
+ROSTER_POLL_SECONDS = 2
+
+@st.fragment(run_every=ROSTER_POLL_SECONDS)
+def show_checked_in_players():
+    """Roster panel - reruns on its own, and only reloads the roster when the event store's version changes"""
+    state = st.session_state.tournament
+    
+    # Load current players from event data, but only when someone checked in or left
+    version = get_event_version(st.session_state.event_code)
+    if version != st.session_state.get('roster_version'):
         event_data = load_event_data(st.session_state.event_code)
         if event_data:
-            st.session_state.players = event_data['players']
-        
-        st.markdown(f"### Checked In Players ({len(st.session_state.players)}/{st.session_state.player_cap})")
-        
-        # Add player manually
-        manual_name = st.text_input("Add player manually:", placeholder="Player name", key="manual_add")
-        if st.button("➕ Add", key="add_manual"):
-            if manual_name and manual_name.strip():
-                if add_player_to_event(st.session_state.event_code, manual_name):
-                    st.success(f"Added {manual_name}")
-                    st.rerun()
-        
-        st.markdown("")
-        
-        # Show player list
-        if st.session_state.players:
-            for i, player in enumerate(st.session_state.players):
-                col_a, col_b = st.columns([3, 1])
-                with col_a:
-                    st.markdown(f"**{i+1}.** {player}")
-                with col_b:
-                    if st.button("❌", key=f"remove_{i}"):
-                        st.session_state.players.remove(player)
-                        event_data = load_event_data(st.session_state.event_code)
-                        event_data['players'] = st.session_state.players
-                        save_event_data(st.session_state.event_code, event_data)
-                        st.rerun()
-        else:
-            st.info("No players checked in yet")
+            for player in event_data['players']:
+                if player not in state.players:
+                    st.session_state.event_log.record(state, 'check_in', player=player)
+        st.session_state.roster_version = version
+    
+    st.markdown(f"### Checked In Players ({len(state.players)}/{st.session_state.player_cap})")
+    
+    # Add player manually
+    manual_name = st.text_input("Add player manually:", placeholder="Player name", key="manual_add")
+    if st.button("➕ Add", key="add_manual"):
+        if manual_name and manual_name.strip():
+            result = check_in_player(st.session_state.event_code, manual_name)
+            if result == CHECKED_IN:
+                st.success(f"Added {manual_name}")
+                st.rerun(scope="fragment")
+            elif result == ALREADY_CHECKED_IN:
+                st.warning(f"{manual_name} is already checked in")
+            elif result == EVENT_FULL:
+                st.warning(f"Event is full ({st.session_state.player_cap} players)")
+    
+    st.markdown("")
+    
+    # Show player list
+    if state.players:
+        for i, player in enumerate(state.players):
+            col_a, col_b = st.columns([3, 1])
+            with col_a:
+                st.markdown(f"**{i+1}.** {player}")
+            with col_b:
+                if st.button("❌", key=f"remove_{i}"):
+                    st.session_state.event_log.record(state, 'removal', player=player)
+                    remove_player_from_event(st.session_state.event_code, player)
+                    st.rerun(scope="fragment")
+    else:
+        st.info("No players checked in yet")
     
     st.markdown("---")
     
     # Start tournament button
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        if len(st.session_state.players) >= 4:
-            if st.button("🎮 Start Tournament", type="primary", use_container_width=True):
-                go_to_page('play')
-        else:
-            st.warning("⚠️ Need at least 4 players to start")
-    
-    # Automatic refresh every 5 seconds to show new players checking in
-    time.sleep(5)
-    st.rerun()
+    if len(state.players) >= 4:
+        if st.button("🎮 Start Tournament", type="primary", use_container_width=True):
+            go_to_page('play')
+    else:
+        st.warning("⚠️ Need at least 4 players to start")
 
 # ============================================
 # PAGE 4: PLAY TOURNAMENT  
 # ============================================
 
 def show_play_page():
+    state = st.session_state.tournament
+    continuous = continuous_play(state)
     col_nav1, col_nav2, col_nav3 = st.columns([1, 2, 1])
     
     with col_nav1:
@@ -893,7 +491,8 @@ def show_play_page():
             go_to_page('player_checkin')
     
     with col_nav2:
-        st.markdown(f"<h2 style='text-align: center;'>{st.session_state.event_name} - Round {st.session_state.current_round}</h2>", unsafe_allow_html=True)
+        heading = "Continuous Play" if continuous and state.current_round else f"Round {state.current_round}"
+        st.markdown(f"<h2 style='text-align: center;'>{st.session_state.event_name} - {heading}</h2>", unsafe_allow_html=True)
     
     with col_nav3:
         if st.button("🏆 Standings"):
@@ -901,401 +500,317 @@ def show_play_page():
     
     st.markdown("---")
     
-    players = st.session_state.players
-    num_courts = st.session_state.num_courts
+    players = state.players
+    num_courts = state.num_courts
     
-    games_in_progress = st.session_state.current_games or st.session_state.court_groups
+    games_in_progress = state.current_games or state.court_groups
     
     if not games_in_progress:
         st.info("⚠️ No games generated. Click below to start Round 1.")
         if st.button("🎲 Generate Round 1", type="primary", use_container_width=True):
-            st.session_state.current_round = 1
-            generate_new_round()
+            start_round(state, st.session_state.event_log, 1)
             # Reset sit-out selections for the next round
-            st.session_state.players_on_break = []
+            save_settings(state, st.session_state.event_log, players_on_break=[])
             st.rerun()
         return
     
+    # Each court can report its own scores from a phone
+    with st.expander("📱 Court score links"):
+        st.caption("Players on each court open their link to enter scores - courts report in parallel")
+        for court_num in sorted({g['court'] for g in state.current_games or state.court_groups}):
+            court_url = f"{APP_URL}/?join={st.session_state.event_code}&court={court_num}"
+            col_link, col_qr = st.columns([3, 1])
+            with col_link:
+                st.markdown(f"**Court {court_num}**")
+                st.code(court_url, language=None)
+            with col_qr:
+                st.image(render_qr_png(court_url, box_size=4), width=120)
+        st.markdown("**📺 Display screen** (courts and standings, read-only)")
+        st.code(f"{APP_URL}/?view={st.session_state.event_code}", language=None)
+    
     if 'pending_scores' not in st.session_state:
         st.session_state.pending_scores = {}
     
+    live = get_live_event(st.session_state.event_code)
+    # Typing or submitting a score reruns only that court's card; the whole page reruns when
+    # another device moves the event on
+    st.session_state.play_version = live.version
+    watch_play_page(live)
+    
     # DISPLAY GAMES
-    if st.session_state.current_games:
-        for game in st.session_state.current_games:
-            court_num = game['court']
-            
-            # Court header with neutral blue
-            st.markdown(f"""
-            <div style='background-color: #4A90E2; padding: 12px; border-radius: 8px; margin-bottom: 15px;'>
-                <h3 style='margin: 0; color: white;'>COURT {court_num}</h3>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            col1, col2, col3 = st.columns([3, 1, 1])
-            
-            with col1:
-                # Team 1 - Soft blue
-                st.markdown(f"""
-                <div style='background-color: #E3F2FD; padding: 18px; border-radius: 8px; margin-bottom: 8px; border: 2px solid #64B5F6;'>
-                    <span style='font-size: 22px; font-weight: bold; color: #1976D2;'>{game['team1'][0]}</span>
-                    <span style='font-size: 22px; font-weight: bold; color: #1976D2; margin-left: 50px;'>{game['team1'][1]}</span>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                st.markdown("<div style='height: 12px;'></div>", unsafe_allow_html=True)
-                
-                # Team 2 - Soft gray
-                st.markdown(f"""
-                <div style='background-color: #F5F5F5; padding: 18px; border-radius: 8px; border: 2px solid #9E9E9E;'>
-                    <span style='font-size: 22px; font-weight: bold; color: #424242;'>{game['team2'][0]}</span>
-                    <span style='font-size: 22px; font-weight: bold; color: #424242; margin-left: 50px;'>{game['team2'][1]}</span>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown("##")
-                st.markdown("<h3 style='text-align: center;'>VS</h3>", unsafe_allow_html=True)
-            
-            with col3:
-                team1_score = st.number_input(
-                    "Score",
-                    min_value=0,
-                    max_value=30,
-                    value=None,
-                    key=f"single_t1_c{court_num}_r{st.session_state.current_round}",
-                    label_visibility="collapsed",
-                    placeholder="Enter score"
-                )
-                
-                st.markdown("---")
-                
-                team2_score = st.number_input(
-                    "Score",
-                    min_value=0,
-                    max_value=30,
-                    value=None,
-                    key=f"single_t2_c{court_num}_r{st.session_state.current_round}",
-                    label_visibility="collapsed",
-                    placeholder="Enter score"
-                )
-                
-                st.session_state.pending_scores[court_num] = {
-                    'team1': game['team1'],
-                    'team2': game['team2'],
-                    'score1': team1_score,
-                    'score2': team2_score
-                }
-            
-            st.markdown("<br>", unsafe_allow_html=True)
+    if state.current_games:
+        for game in state.current_games:
+            show_court_card(live, game['court'])
         
-        if st.session_state.sitting_out:
-            st.markdown("---")
-            st.markdown(f"""
-            <div style='background-color: #f5f5f5; padding: 18px; border-radius: 8px; border-left: 4px solid #9e9e9e;'>
-                <h4 style='margin: 0; color: #616161;'>🪑 Sitting Out This Round</h4>
-                <p style='margin: 8px 0 0 0; font-size: 20px; font-weight: 500; color: #424242;'>{', '.join(st.session_state.sitting_out)}</p>
-            </div>
-            """, unsafe_allow_html=True)
+        show_bench(live)
         
         st.markdown("")
         st.markdown("")
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
-            if st.button("✅ SUBMIT ALL SCORES", type="primary", use_container_width=True, key="submit_all"):
-                all_valid = True
-                for court_num, score_data in st.session_state.pending_scores.items():
-                    if (score_data['score1'] is None or score_data['score1'] == 0) and (score_data['score2'] is None or score_data['score2'] == 0):
-                        all_valid = False
-                        break
-                
-                if not all_valid:
-                    st.error("⚠️ Please enter scores for all courts!")
+            unreported = [g['court'] for g in state.current_games if not court_report(state, g['court'])]
+            if continuous:
+                # No round to close - courts keep refilling until the organizer stops
+                if st.button("🏆 See standings", type="primary", use_container_width=True):
+                    go_to_page('standings')
+            elif not unreported:
+                if st.button("🏆 All courts reported - see standings", type="primary", use_container_width=True):
+                    go_to_page('standings')
+            elif st.button("✅ SUBMIT ALL SCORES", type="primary", use_container_width=True, key="submit_all"):
+                results = [
+                    dict(score_data, court=court_num)
+                    for court_num, score_data in st.session_state.pending_scores.items()
+                    if court_num in unreported
+                ]
+                try:
+                    submit_round_scores(st.session_state.event_log, state, results, expected_courts=unreported)
+                except ScoreError as e:
+                    st.error(f"⚠️ {e}")
                 else:
-                    for court_num, score_data in st.session_state.pending_scores.items():
-                        team1_score = score_data['score1']
-                        team2_score = score_data['score2']
-                        team1 = score_data['team1']
-                        team2 = score_data['team2']
-                        
-                        team1_won = team1_score > team2_score
-                        
-                        for player in team1:
-                            st.session_state.scores[player]['games_played'] += 1
-                            st.session_state.scores[player]['points_for'] += team1_score
-                            st.session_state.scores[player]['points_against'] += team2_score
-                            st.session_state.scores[player]['point_diff'] = (
-                                st.session_state.scores[player]['points_for'] - 
-                                st.session_state.scores[player]['points_against']
-                            )
-                            if team1_won:
-                                st.session_state.scores[player]['wins'] += 1
-                            else:
-                                st.session_state.scores[player]['losses'] += 1
-                        
-                        for player in team2:
-                            st.session_state.scores[player]['games_played'] += 1
-                            st.session_state.scores[player]['points_for'] += team2_score
-                            st.session_state.scores[player]['points_against'] += team1_score
-                            st.session_state.scores[player]['point_diff'] = (
-                                st.session_state.scores[player]['points_for'] - 
-                                st.session_state.scores[player]['points_against']
-                            )
-                            if not team1_won:
-                                st.session_state.scores[player]['wins'] += 1
-                            else:
-                                st.session_state.scores[player]['losses'] += 1
-                        
-                        st.session_state.game_scores.append({
-                            'round': st.session_state.current_round,
-                            'court': court_num,
-                            'team1': team1,
-                            'team2': team2,
-                            'score': [team1_score, team2_score]
-                        })
-                    
                     st.session_state.pending_scores = {}
                     go_to_page('standings')
     
     # DISPLAY GROUPS - Multi-game formats (Up/Down River, Scramble, Double Header, Cream of Crop)
-    elif st.session_state.court_groups:
+    elif state.court_groups:
         st.markdown("### Complete games one at a time")
         
-        all_complete = True
+        for group in state.court_groups:
+            show_group_court(live, group['court'])
         
-        for group in st.session_state.court_groups:
-            court_num = group['court']
-            
-            if 'players' in group:
-                players_list = group['players']
-                all_games = generate_court_games(players_list)
-                current_idx = st.session_state.court_game_index.get(court_num, 0)
-                
-                court_complete = current_idx >= len(all_games)
-                if not court_complete:
-                    all_complete = False
-                
-                with st.expander(
-                    f"🏟️ Court {court_num} — {', '.join(players_list)}" + 
-                    (" ✅ COMPLETE" if court_complete else f" — Game {current_idx + 1}/{len(all_games)}"),
-                    expanded=not court_complete
-                ):
-                    if not court_complete:
-                        game = all_games[current_idx]
-                        
-                        st.markdown(f"**Game {current_idx + 1} of {len(all_games)}**")
-                        st.markdown("")
-                        
-                        col_team1, col_score, col_team2 = st.columns([2, 1.5, 2])
-                        
-                        with col_team1:
-                            st.markdown("### 🔵 Team 1")
-                            st.markdown(f"**{game['team1'][0]}**")
-                            st.markdown(f"**{game['team1'][1]}**")
-                        
-                        with col_score:
-                            st.markdown("### Score")
-                            
-                            col_s1, col_vs, col_s2 = st.columns([1, 0.3, 1])
-                            
-                            with col_s1:
-                                team1_score = st.number_input(
-                                    "Team 1",
-                                    min_value=0,
-                                    max_value=30,
-                                    value=None,
-                                    key=f"mg_t1_c{court_num}_g{current_idx}_r{st.session_state.current_round}",
-                                    label_visibility="collapsed",
-                                    placeholder="Score"
-                                )
-                            
-                            with col_vs:
-                                st.markdown("## -")
-                            
-                            with col_s2:
-                                team2_score = st.number_input(
-                                    "Team 2",
-                                    min_value=0,
-                                    max_value=30,
-                                    value=None,
-                                    key=f"mg_t2_c{court_num}_g{current_idx}_r{st.session_state.current_round}",
-                                    label_visibility="collapsed",
-                                    placeholder="Score"
-                                )
-                            
-                            st.markdown("")
-                            
-                            if st.button("✅ Submit", key=f"mg_submit_c{court_num}_g{current_idx}_r{st.session_state.current_round}", type="primary", use_container_width=True):
-                                if (team1_score is None or team1_score == 0) and (team2_score is None or team2_score == 0):
-                                    st.error("Please enter scores!")
-                                else:
-                                    team1_won = team1_score > team2_score
-                                    
-                                    for player in game['team1']:
-                                        st.session_state.scores[player]['games_played'] += 1
-                                        st.session_state.scores[player]['points_for'] += team1_score
-                                        st.session_state.scores[player]['points_against'] += team2_score
-                                        st.session_state.scores[player]['point_diff'] = (
-                                            st.session_state.scores[player]['points_for'] - 
-                                            st.session_state.scores[player]['points_against']
-                                        )
-                                        if team1_won:
-                                            st.session_state.scores[player]['wins'] += 1
-                                        else:
-                                            st.session_state.scores[player]['losses'] += 1
-                                    
-                                    for player in game['team2']:
-                                        st.session_state.scores[player]['games_played'] += 1
-                                        st.session_state.scores[player]['points_for'] += team2_score
-                                        st.session_state.scores[player]['points_against'] += team1_score
-                                        st.session_state.scores[player]['point_diff'] = (
-                                            st.session_state.scores[player]['points_for'] - 
-                                            st.session_state.scores[player]['points_against']
-                                        )
-                                        if not team1_won:
-                                            st.session_state.scores[player]['wins'] += 1
-                                        else:
-                                            st.session_state.scores[player]['losses'] += 1
-                                    
-                                    st.session_state.game_scores.append({
-                                        'round': st.session_state.current_round,
-                                        'court': court_num,
-                                        'team1': game['team1'],
-                                        'team2': game['team2'],
-                                        'score': [team1_score, team2_score]
-                                    })
-                                    
-                                    st.session_state.court_game_index[court_num] += 1
-                                    st.rerun()
-                        
-                        with col_team2:
-                            st.markdown("### 🔴 Team 2")
-                            st.markdown(f"**{game['team2'][0]}**")
-                            st.markdown(f"**{game['team2'][1]}**")
-                    else:
-                        st.success("✅ All games completed!")
-            
-            elif 'pairs' in group:
-                pair1, pair2 = group['pairs']
-                current_idx = st.session_state.court_game_index.get(court_num, 0)
-                max_games = 5
-                
-                court_complete = current_idx >= max_games
-                if not court_complete:
-                    all_complete = False
-                
-                with st.expander(
-                    f"🏟️ Court {court_num}" + 
-                    (" ✅ COMPLETE" if court_complete else f" — Game {current_idx + 1}/{max_games}"),
-                    expanded=not court_complete
-                ):
-                    st.markdown(f"**{pair1[0]} & {pair1[1]}** vs **{pair2[0]} & {pair2[1]}**")
-                    st.markdown("")
-                    
-                    if not court_complete:
-                        st.markdown(f"**Game {current_idx + 1} of {max_games}**")
-                        
-                        col_team1, col_score, col_team2 = st.columns([2, 1.5, 2])
-                        
-                        with col_team1:
-                            st.markdown("### 🔵 Team 1")
-                            st.markdown(f"**{pair1[0]}**")
-                            st.markdown(f"**{pair1[1]}**")
-                        
-                        with col_score:
-                            st.markdown("### Score")
-                            
-                            col_s1, col_vs, col_s2 = st.columns([1, 0.3, 1])
-                            
-                            with col_s1:
-                                team1_score = st.number_input(
-                                    "Team 1",
-                                    min_value=0,
-                                    max_value=30,
-                                    value=None,
-                                    key=f"fp_t1_c{court_num}_g{current_idx}_r{st.session_state.current_round}",
-                                    label_visibility="collapsed",
-                                    placeholder="Score"
-                                )
-                            
-                            with col_vs:
-                                st.markdown("## -")
-                            
-                            with col_s2:
-                                team2_score = st.number_input(
-                                    "Team 2",
-                                    min_value=0,
-                                    max_value=30,
-                                    value=None,
-                                    key=f"fp_t2_c{court_num}_g{current_idx}_r{st.session_state.current_round}",
-                                    label_visibility="collapsed",
-                                    placeholder="Score"
-                                )
-                            
-                            st.markdown("")
-                            
-                            if st.button("✅ Submit", key=f"fp_submit_c{court_num}_g{current_idx}_r{st.session_state.current_round}", type="primary", use_container_width=True):
-                                if (team1_score is None or team1_score == 0) and (team2_score is None or team2_score == 0):
-                                    st.error("Please enter scores!")
-                                else:
-                                    team1_won = team1_score > team2_score
-                                    
-                                    for player in pair1:
-                                        st.session_state.scores[player]['games_played'] += 1
-                                        st.session_state.scores[player]['points_for'] += team1_score
-                                        st.session_state.scores[player]['points_against'] += team2_score
-                                        st.session_state.scores[player]['point_diff'] = (
-                                            st.session_state.scores[player]['points_for'] - 
-                                            st.session_state.scores[player]['points_against']
-                                        )
-                                        if team1_won:
-                                            st.session_state.scores[player]['wins'] += 1
-                                        else:
-                                            st.session_state.scores[player]['losses'] += 1
-                                    
-                                    for player in pair2:
-                                        st.session_state.scores[player]['games_played'] += 1
-                                        st.session_state.scores[player]['points_for'] += team2_score
-                                        st.session_state.scores[player]['points_against'] += team1_score
-                                        st.session_state.scores[player]['point_diff'] = (
-                                            st.session_state.scores[player]['points_for'] - 
-                                            st.session_state.scores[player]['points_against']
-                                        )
-                                        if not team1_won:
-                                            st.session_state.scores[player]['wins'] += 1
-                                        else:
-                                            st.session_state.scores[player]['losses'] += 1
-                                    
-                                    st.session_state.game_scores.append({
-                                        'round': st.session_state.current_round,
-                                        'court': court_num,
-                                        'team1': pair1,
-                                        'team2': pair2,
-                                        'score': [team1_score, team2_score]
-                                    })
-                                    
-                                    st.session_state.court_game_index[court_num] += 1
-                                    st.rerun()
-                        
-                        with col_team2:
-                            st.markdown("### 🔴 Team 2")
-                            st.markdown(f"**{pair2[0]}**")
-                            st.markdown(f"**{pair2[1]}**")
-                    else:
-                        st.success("✅ All games completed on this court!")
+        show_bench(live)
         
         # All courts complete
-        if all_complete:
+        if all(live.court_view(group['court'])['done'] for group in state.court_groups):
             st.markdown("")
             col1, col2, col3 = st.columns([1, 2, 1])
             with col2:
                 if st.button("📊 Go to Standings", type="primary", use_container_width=True):
                     go_to_page('standings')
 
+# How often the play page checks for scores and rounds from other devices
+PLAY_POLL_SECONDS = 5
+
+@st.fragment(run_every=PLAY_POLL_SECONDS)
+def watch_play_page(live):
+    """Reruns the whole play page when a court's phone reports or another organizer starts a round"""
+    live.refresh()
+    if live.version != st.session_state.play_version:
+        st.rerun()
+
+def court_score_submitted(live, courts_before):
+    """After this page scores a court: rerun just that card, or the whole page if the
+    score changed which courts are in play (continuous play filling an empty court)"""
+    st.session_state.play_version = live.version
+    state = live.state
+    if {g['court'] for g in state.current_games} != courts_before or (
+            state.court_groups and all(live.court_view(g['court'])['done'] for g in state.court_groups)):
+        st.rerun()
+    st.rerun(scope="fragment")
+
+@st.fragment
+def show_court_card(live, court_num):
+    """One court's teams and score entry, drawn from its cached view model"""
+    state = live.state
+    continuous = continuous_play(state)
+    view = live.court_view(court_num)
+    title = f"COURT {court_num}" + (f" · Game {view['game']}" if continuous and view['game'] else "")
+    
+    # Court header with neutral blue
+    st.markdown(f"""
+    <div style='background-color: #4A90E2; padding: 12px; border-radius: 8px; margin-bottom: 15px;'>
+        <h3 style='margin: 0; color: white;'>{title}</h3>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    if view['done']:
+        # Continuous play leaves a court empty until four players are free
+        st.info("⏳ Waiting for four free players")
+        st.session_state.pending_scores.pop(court_num, None)
+        return
+    
+    game_index = view['game_index']
+    col1, col2, col3 = st.columns([3, 1, 1])
+    
+    with col1:
+        # Team 1 - Soft blue
+        st.markdown(f"""
+        <div style='background-color: #E3F2FD; padding: 18px; border-radius: 8px; margin-bottom: 8px; border: 2px solid #64B5F6;'>
+            <span style='font-size: 22px; font-weight: bold; color: #1976D2;'>{view['team1'][0]}</span>
+            <span style='font-size: 22px; font-weight: bold; color: #1976D2; margin-left: 50px;'>{view['team1'][1]}</span>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("<div style='height: 12px;'></div>", unsafe_allow_html=True)
+        
+        # Team 2 - Soft gray
+        st.markdown(f"""
+        <div style='background-color: #F5F5F5; padding: 18px; border-radius: 8px; border: 2px solid #9E9E9E;'>
+            <span style='font-size: 22px; font-weight: bold; color: #424242;'>{view['team2'][0]}</span>
+            <span style='font-size: 22px; font-weight: bold; color: #424242; margin-left: 50px;'>{view['team2'][1]}</span>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("##")
+        st.markdown("<h3 style='text-align: center;'>VS</h3>", unsafe_allow_html=True)
+    
+    with col3:
+        if view['score']:
+            # Scored from the court's own phone
+            st.markdown("##")
+            st.success(f"✅ {view['score'][0]} – {view['score'][1]}")
+            st.session_state.pending_scores.pop(court_num, None)
+        else:
+            team1_score = st.number_input(
+                "Score",
+                min_value=0,
+                max_value=30,
+                value=None,
+                key=f"single_t1_c{court_num}_g{game_index}_r{state.current_round}",
+                label_visibility="collapsed",
+                placeholder="Enter score"
+            )
+            
+            st.markdown("---")
+            
+            team2_score = st.number_input(
+                "Score",
+                min_value=0,
+                max_value=30,
+                value=None,
+                key=f"single_t2_c{court_num}_g{game_index}_r{state.current_round}",
+                label_visibility="collapsed",
+                placeholder="Enter score"
+            )
+            
+            # Read by SUBMIT ALL, outside this fragment
+            st.session_state.pending_scores[court_num] = {
+                'team1': view['team1'],
+                'team2': view['team2'],
+                'score1': team1_score,
+                'score2': team2_score
+            }
+            
+            # Continuous play: each court reports on its own and gets its next game straight away
+            if continuous and st.button("✅ Submit", key=f"single_submit_c{court_num}_g{game_index}",
+                                        type="primary", use_container_width=True):
+                courts_before = {g['court'] for g in state.current_games}
+                try:
+                    submit_court_score(
+                        live.log, state, uuid.uuid4().hex,
+                        state.current_round, court_num, game_index,
+                        view['team1'], view['team2'], team1_score, team2_score
+                    )
+                except ScoreError as e:
+                    st.error(str(e))
+                else:
+                    st.session_state.pending_scores.pop(court_num, None)
+                    court_score_submitted(live, courts_before)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+
+@st.fragment
+def show_group_court(live, court_num):
+    """One court group's expander: the game it's on and score entry, drawn from its cached view model"""
+    state = live.state
+    view = live.court_view(court_num)
+    game_index = view['game_index']
+    # Keys keep the names they had before groups had their own fragment
+    prefix = "mg" if view['players'] else "fp"
+    
+    label = f"🏟️ Court {court_num}" + (f" — {', '.join(view['players'])}" if view['players'] else "")
+    with st.expander(
+        label + (" ✅ COMPLETE" if view['done'] else f" — Game {view['game']}/{view['games']}"),
+        expanded=not view['done']
+    ):
+        if view['pairs']:
+            pair1, pair2 = view['pairs']
+            st.markdown(f"**{pair1[0]} & {pair1[1]}** vs **{pair2[0]} & {pair2[1]}**")
+            st.markdown("")
+        
+        if view['done']:
+            st.success("✅ All games completed!" if view['players'] else "✅ All games completed on this court!")
+            return
+        
+        st.markdown(f"**Game {view['game']} of {view['games']}**")
+        st.markdown("")
+        
+        col_team1, col_score, col_team2 = st.columns([2, 1.5, 2])
+        
+        with col_team1:
+            st.markdown("### 🔵 Team 1")
+            st.markdown(f"**{view['team1'][0]}**")
+            st.markdown(f"**{view['team1'][1]}**")
+        
+        with col_score:
+            st.markdown("### Score")
+            
+            col_s1, col_vs, col_s2 = st.columns([1, 0.3, 1])
+            
+            with col_s1:
+                team1_score = st.number_input(
+                    "Team 1",
+                    min_value=0,
+                    max_value=30,
+                    value=None,
+                    key=f"{prefix}_t1_c{court_num}_g{game_index}_r{state.current_round}",
+                    label_visibility="collapsed",
+                    placeholder="Score"
+                )
+            
+            with col_vs:
+                st.markdown("## -")
+            
+            with col_s2:
+                team2_score = st.number_input(
+                    "Team 2",
+                    min_value=0,
+                    max_value=30,
+                    value=None,
+                    key=f"{prefix}_t2_c{court_num}_g{game_index}_r{state.current_round}",
+                    label_visibility="collapsed",
+                    placeholder="Score"
+                )
+            
+            st.markdown("")
+            
+            if st.button("✅ Submit", key=f"{prefix}_submit_c{court_num}_g{game_index}_r{state.current_round}",
+                         type="primary", use_container_width=True):
+                try:
+                    submit_court_score(
+                        live.log, state, uuid.uuid4().hex,
+                        state.current_round, court_num, game_index,
+                        view['team1'], view['team2'], team1_score, team2_score
+                    )
+                except ScoreError as e:
+                    st.error(str(e))
+                else:
+                    court_score_submitted(live, set())
+        
+        with col_team2:
+            st.markdown("### 🔴 Team 2")
+            st.markdown(f"**{view['team2'][0]}**")
+            st.markdown(f"**{view['team2'][1]}**")
+
+@st.fragment(run_every=PLAY_POLL_SECONDS)
+def show_bench(live):
+    """Who's sitting out, or waiting for a court in continuous play - follows the queue on its own"""
+    bench = live.bench_view()
+    if bench['players']:
+        st.markdown("---")
+        st.markdown(f"""
+        <div style='background-color: #f5f5f5; padding: 18px; border-radius: 8px; border-left: 4px solid #9e9e9e;'>
+            <h4 style='margin: 0; color: #616161;'>{bench['title']}</h4>
+            <p style='margin: 8px 0 0 0; font-size: 20px; font-weight: 500; color: #424242;'>{', '.join(bench['players'])}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
 # ============================================
 # PAGE 5: STANDINGS
 # ============================================
 
 def show_standings_page():
+    state = st.session_state.tournament
     col_nav1, col_nav2, col_nav3 = st.columns([1, 2, 1])
     
     with col_nav1:
@@ -1311,60 +826,27 @@ def show_standings_page():
     
     st.markdown("---")
     
-    if st.session_state.scores:
-        standings = []
-        
-        for player, stats in st.session_state.scores.items():
-            win_pct = calculate_win_percentage(stats['wins'], stats['games_played'])
-            
-            standings.append({
-                'Rank': 0,
-                'Player': player,
-                'Wins': stats['wins'],
-                'Losses': stats['losses'],
-                'Games': stats['games_played'],
-                'Win %': f"{win_pct:.1f}%",
-                'Points For': stats.get('points_for', 0),
-                'Points Against': stats.get('points_against', 0),
-                'Point Diff': stats.get('point_diff', 0)
-            })
-        
-        standings.sort(key=lambda x: (x['Points For'], x['Point Diff'], x['Wins']), reverse=True)
-        
-        for i, standing in enumerate(standings):
-            standing['Rank'] = i + 1
-        
-        if standings:
-            st.markdown("## 🎉 Top Players")
-            
-            col1, col2, col3 = st.columns(3)
-            
-            if len(standings) >= 1:
-                with col1:
-                    st.markdown(f"### 🥇 1st Place")
-                    st.markdown(f"## {standings[0]['Player']}")
-                    st.markdown(f"**{standings[0]['Wins']} wins** | {standings[0]['Points For']} pts scored")
-            
-            if len(standings) >= 2:
-                with col2:
-                    st.markdown(f"### 🥈 2nd Place")
-                    st.markdown(f"## {standings[1]['Player']}")
-                    st.markdown(f"**{standings[1]['Wins']} wins** | {standings[1]['Points For']} pts scored")
-            
-            if len(standings) >= 3:
-                with col3:
-                    st.markdown(f"### 🥉 3rd Place")
-                    st.markdown(f"## {standings[2]['Player']}")
-                    st.markdown(f"**{standings[2]['Wins']} wins** | {standings[2]['Points For']} pts scored")
-            
-            st.markdown("---")
-            st.markdown("## Full Standings")
-            
-            st.dataframe(standings, use_container_width=True, hide_index=True)
-        else:
-            st.info("No games played yet!")
-    else:
-        st.info("No scores recorded yet!")
+    show_standings_table(get_live_event(st.session_state.event_code))
+    
+    # Court utilization - compare continuous play against rounds
+    utilization = court_utilization(state)
+    if utilization:
+        with st.expander("📊 Court Utilization", expanded=False):
+            col_u1, col_u2, col_u3 = st.columns(3)
+            col_u1.metric("Courts in use", f"{utilization['utilization']:.0%}")
+            col_u2.metric("Games per hour", f"{utilization['games_per_hour']:.1f}")
+            col_u3.metric("Avg court changeover", f"{utilization['avg_changeover_seconds'] / 60:.1f} min")
+            st.dataframe([
+                {
+                    'Court': c['court'],
+                    'Games': c['games'],
+                    'Minutes in use': round(c['busy_minutes']),
+                    'Utilization': f"{c['utilization']:.0%}"
+                }
+                for c in utilization['courts']
+            ], use_container_width=True, hide_index=True)
+            st.caption(f"Over {utilization['span_minutes']:.0f} minutes. A court counts as free once its score "
+                       "is in, so score from the courts' phones to measure round-based play fairly.")
     
     st.markdown("---")
     
@@ -1373,8 +855,8 @@ def show_standings_page():
         st.markdown("### Current Players")
         st.caption("Remove players who left early or replace players with substitutes")
         
-        if st.session_state.players:
-            for i, player in enumerate(st.session_state.players):
+        if state.players:
+            for i, player in enumerate(state.players):
                 col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
                 
                 with col1:
@@ -1395,38 +877,12 @@ def show_standings_page():
                             old_name = player
                             new_name = new_name.strip()
                             
-                            # Update players list
-                            st.session_state.players[i] = new_name
-                            
-                            # Update scores dictionary
-                            if old_name in st.session_state.scores:
-                                st.session_state.scores[new_name] = st.session_state.scores.pop(old_name)
+                            # Update players, scores, fixed partners and history
+                            st.session_state.event_log.record(state, 'replacement', old_name=old_name, new_name=new_name)
                             
                             # Update event data
                             if st.session_state.event_code:
-                                event_data = load_event_data(st.session_state.event_code)
-                                if event_data:
-                                    event_data['players'] = st.session_state.players
-                                    save_event_data(st.session_state.event_code, event_data)
-                            
-                            # Update any fixed partners
-                            if old_name in st.session_state.fixed_partners:
-                                partner = st.session_state.fixed_partners[old_name]
-                                del st.session_state.fixed_partners[old_name]
-                                st.session_state.fixed_partners[new_name] = partner
-                                # Update the partner's reference
-                                if partner in st.session_state.fixed_partners:
-                                    st.session_state.fixed_partners[partner] = new_name
-                            
-                            # Update partner history
-                            if old_name in st.session_state.partner_history:
-                                st.session_state.partner_history[new_name] = st.session_state.partner_history.pop(old_name)
-                            
-                            # Update all partner history references
-                            for p in st.session_state.partner_history:
-                                if old_name in st.session_state.partner_history[p]:
-                                    st.session_state.partner_history[p].discard(old_name)
-                                    st.session_state.partner_history[p].add(new_name)
+                                rename_player_in_event(st.session_state.event_code, old_name, new_name)
                             
                             st.success(f"✅ Replaced {old_name} with {new_name}")
                             st.rerun()
@@ -1435,34 +891,13 @@ def show_standings_page():
                 
                 with col4:
                     if st.button("❌", key=f"remove_player_{i}"):
-                        # Remove player
-                        removed_player = st.session_state.players.pop(i)
-                        
-                        # Remove from scores
-                        if removed_player in st.session_state.scores:
-                            del st.session_state.scores[removed_player]
+                        # Remove player from roster, scores, fixed partners and history
+                        removed_player = player
+                        st.session_state.event_log.record(state, 'removal', player=removed_player)
                         
                         # Update event data
                         if st.session_state.event_code:
-                            event_data = load_event_data(st.session_state.event_code)
-                            if event_data:
-                                event_data['players'] = st.session_state.players
-                                save_event_data(st.session_state.event_code, event_data)
-                        
-                        # Remove from fixed partners
-                        if removed_player in st.session_state.fixed_partners:
-                            partner = st.session_state.fixed_partners[removed_player]
-                            del st.session_state.fixed_partners[removed_player]
-                            if partner in st.session_state.fixed_partners:
-                                del st.session_state.fixed_partners[partner]
-                        
-                        # Remove from partner history
-                        if removed_player in st.session_state.partner_history:
-                            del st.session_state.partner_history[removed_player]
-                        
-                        # Remove from all partner history references
-                        for p in st.session_state.partner_history:
-                            st.session_state.partner_history[p].discard(removed_player)
+                            remove_player_from_event(st.session_state.event_code, removed_player)
                         
                         st.success(f"✅ Removed {removed_player}")
                         st.rerun()
@@ -1478,15 +913,16 @@ def show_standings_page():
         st.markdown("### Players Taking a Break")
         st.caption("Select players who want to sit out the next round")
         
-        if st.session_state.players:
+        if state.players:
             # Show currently sitting out
-            if st.session_state.players_on_break:
-                st.info(f"🪑 Currently sitting out: {', '.join(st.session_state.players_on_break)}")
+            if state.players_on_break:
+                st.info(f"🪑 Currently sitting out: {', '.join(state.players_on_break)}")
                 st.markdown("")
             
             # Create checkboxes for each player
-            for player in st.session_state.players:
-                is_on_break = player in st.session_state.players_on_break
+            on_break = []
+            for player in state.players:
+                is_on_break = player in state.players_on_break
                 
                 col1, col2 = st.columns([4, 1])
                 with col1:
@@ -1495,20 +931,17 @@ def show_standings_page():
                         value=is_on_break,
                         key=f"break_{player}"
                     ):
-                        # Add to break list
-                        if player not in st.session_state.players_on_break:
-                            st.session_state.players_on_break.append(player)
-                    else:
-                        # Remove from break list
-                        if player in st.session_state.players_on_break:
-                            st.session_state.players_on_break.remove(player)
+                        on_break.append(player)
                 
                 with col2:
                     if is_on_break:
                         st.markdown("⏸️")
             
+            # Logged like every other setting, so the breaks survive the event being rebuilt
+            save_settings(state, st.session_state.event_log, players_on_break=on_break)
+            
             # Show count
-            active_players = len([p for p in st.session_state.players if p not in st.session_state.players_on_break])
+            active_players = len([p for p in state.players if p not in state.players_on_break])
             st.markdown("")
             st.success(f"✅ {active_players} players will play in the next round")
             
@@ -1522,22 +955,75 @@ def show_standings_page():
     col_a, col_b, col_c = st.columns(3)
     
     with col_a:
-        if st.button("➡️ Generate Next Round", type="primary", use_container_width=True):
-            st.session_state.current_round += 1
-            generate_new_round()
+        if continuous_play(state) and state.current_games:
+            st.info("⏩ Continuous play - courts refill as they report")
+        elif st.button("➡️ Generate Next Round", type="primary", use_container_width=True):
+            start_round(state, st.session_state.event_log, state.current_round + 1)
             # Reset sit-out selections for the next round
-            st.session_state.players_on_break = []
+            save_settings(state, st.session_state.event_log, players_on_break=[])
             go_to_page('play')
     
     with col_b:
         if st.button("🔄 Reset & Start New", use_container_width=True):
-            reset_tournament()
+            st.session_state.event_log.record(state, 'reset')
             go_to_page('home')
     
     with col_c:
         if st.button("🏠 Home", use_container_width=True):
             go_to_page('home')
 
+# How often the standings follow scores reported from the courts
+STANDINGS_POLL_SECONDS = 5
+
+@st.fragment(run_every=STANDINGS_POLL_SECONDS)
+def show_standings_table(live):
+    """Top players and the full table - reruns on its own as scores come in or the tiebreaks change"""
+    live.refresh()
+    state = live.state
+    if state.scores:
+        # Rank using the chosen tiebreak chain; the index is kept sorted as scores come in
+        preset_names = list(TIEBREAK_PRESETS)
+        current_preset = next(
+            (name for name, chain in TIEBREAK_PRESETS.items() if chain == state.standings.tiebreaks),
+            preset_names[0]
+        )
+        rank_by = st.selectbox("Rank by", preset_names, index=preset_names.index(current_preset))
+        save_settings(state, live.log, tiebreaks=TIEBREAK_PRESETS[rank_by])
+        
+        standings = live.standings_view()
+
+        if standings:
+            st.markdown("## 🎉 Top Players")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            if len(standings) >= 1:
+                with col1:
+                    st.markdown(f"### 🥇 1st Place")
+                    st.markdown(f"## {standings[0]['Player']}")
+                    st.markdown(f"**{standings[0]['Wins']} wins** | {standings[0]['Points For']} pts scored")
+            
+            if len(standings) >= 2:
+                with col2:
+                    st.markdown(f"### 🥈 2nd Place")
+                    st.markdown(f"## {standings[1]['Player']}")
+                    st.markdown(f"**{standings[1]['Wins']} wins** | {standings[1]['Points For']} pts scored")
+            
+            if len(standings) >= 3:
+                with col3:
+                    st.markdown(f"### 🥉 3rd Place")
+                    st.markdown(f"## {standings[2]['Player']}")
+                    st.markdown(f"**{standings[2]['Wins']} wins** | {standings[2]['Points For']} pts scored")
+            
+            st.markdown("---")
+            st.markdown("## Full Standings")
+            
+            st.dataframe(standings, use_container_width=True, hide_index=True)
+        else:
+            st.info("No games played yet!")
+    else:
+        st.info("No scores recorded yet!")
+
 # ============================================
 # MAIN APP ROUTER
 # ============================================
@@ -1599,11 +1085,14 @@ def show_player_registration_page(event_code):
         if st.button("✅ Check In", type="primary", use_container_width=True, key="player_checkin"):
             if not player_name or not player_name.strip():
                 st.error("⚠️ Please enter your name")
-            elif player_name.strip() in current_players:
-                st.warning(f"👋 {player_name} is already checked in!")
             else:
-                # Add player to event
-                if add_player_to_event(event_code, player_name.strip()):
+                # Add player to event - atomic, so simultaneous scans can't overwrite each other
+                result = check_in_player(event_code, player_name)
+                if result == ALREADY_CHECKED_IN:
+                    st.warning(f"👋 {player_name} is already checked in!")
+                elif result == EVENT_FULL:
+                    st.error("🚫 This event is full!")
+                elif result == CHECKED_IN:
                     st.success(f"✅ Welcome, {player_name}!")
                     st.balloons()
                     st.markdown("---")
@@ -1624,6 +1113,99 @@ def show_player_registration_page(event_code):
             for i, player in enumerate(current_players, 1):
                 st.markdown(f"{i}. {player}")
 
+# ============================================
+# COURT SCORE ENTRY (players' phones)
+# ============================================
+
+# How often a court's page checks for the next game or round
+COURT_POLL_SECONDS = 5
+
+def show_court_score_page(event_code, court_num):
+    """Court-scoped score entry, reached through ?join=CODE&court=N"""
+    event_data = load_event_data(event_code)
+    live = get_live_event(event_code) if event_data else None
+    if live is None:
+        st.error("❌ Event not found")
+        st.info("The event code may be incorrect or the event may have ended.")
+        st.stop()
+    
+    st.title(f"🏓 Court {court_num}")
+    st.caption(event_data['event_name'])
+    st.markdown("---")
+    show_court_game(live, court_num)
+
+@st.fragment(run_every=COURT_POLL_SECONDS)
+def show_court_game(live, court_num):
+    """The game on this court right now, with score entry; reruns on its own to follow the round"""
+    live.refresh()
+    state = live.state
+    current = current_court_game(state, court_num)
+    
+    if current is None:
+        st.info(f"⏳ No game on court {court_num} right now - this page updates when the next round starts.")
+        return
+    
+    game_index, game = current
+    round_number = state.current_round
+    report = court_report(state, court_num, game_index)
+    if report:
+        st.success(f"✅ Score in: {report['score'][0]} – {report['score'][1]}. Waiting for the next game.")
+        return
+    
+    st.markdown(f"### Round {round_number}" + (f" · Game {game_index + 1}" if state.court_groups else ""))
+    slot = f"{live.event_code}_{round_number}_{court_num}_{game_index}"
+    
+    # One submission ID per game on this phone, so a retried or double-tapped submit counts once
+    submission_key = f"court_submission_{slot}"
+    if submission_key not in st.session_state:
+        st.session_state[submission_key] = uuid.uuid4().hex
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown(f"**🔵 {game['team1'][0]} & {game['team1'][1]}**")
+        score1 = st.number_input("Team 1", min_value=0, max_value=30, value=None,
+                                 key=f"court_t1_{slot}", placeholder="Score")
+    with col2:
+        st.markdown(f"**🔴 {game['team2'][0]} & {game['team2'][1]}**")
+        score2 = st.number_input("Team 2", min_value=0, max_value=30, value=None,
+                                 key=f"court_t2_{slot}", placeholder="Score")
+    
+    if st.button("✅ Submit Score", type="primary", use_container_width=True, key=f"court_submit_{slot}"):
+        try:
+            submit_court_score(
+                live.log, state, st.session_state[submission_key], round_number, court_num, game_index,
+                game['team1'], game['team2'], score1, score2
+            )
+        except ScoreError as e:
+            # Includes ScoreConflict: another phone already scored this game differently, or it moved on
+            st.error(f"⚠️ {e}")
+        else:
+            st.rerun(scope="fragment")
+
+# ============================================
+# SPECTATOR DISPLAY (read-only)
+# ============================================
+
+# How often the display screen picks up new scores and rounds
+DISPLAY_POLL_SECONDS = 5
+
+def show_display_page(event_code):
+    """Read-only courts and standings for a TV or projector, reached through ?view=CODE"""
+    event_data = load_event_data(event_code)
+    live = get_live_event(event_code) if event_data else None
+    if live is None:
+        st.error("❌ Event not found")
+        st.info("The event code may be incorrect or the event may have ended.")
+        st.stop()
+    
+    show_display_board(live, event_data['event_name'])
+
+@st.fragment(run_every=DISPLAY_POLL_SECONDS)
+def show_display_board(live, event_name):
+    """The board itself - rendered once per event version and shared by every screen watching"""
+    live.refresh()
+    st.markdown(live.display_html(event_name), unsafe_allow_html=True)
+
 # ============================================
 # MAIN APP ROUTER
 # ============================================
@@ -1634,10 +1216,28 @@ def main():
     join_code = query_params.get('join', None)
     
     if join_code:
-        # Show the dedicated player registration page
-        show_player_registration_page(join_code)
+        court = query_params.get('court', None)
+        if court and court.isdigit():
+            # A court's phone reporting its own scores
+            show_court_score_page(join_code, int(court))
+        else:
+            # Show the dedicated player registration page
+            show_player_registration_page(join_code)
         return  # Exit here - don't show any other pages
     
+    view_code = query_params.get('view', None)
+    if view_code:
+        show_display_page(view_code)
+        return
+    
+    # Organizer refreshed the page: rebuild the tournament from its event log
+    resume_code = query_params.get('event', None)
+    if resume_code and resume_code != st.session_state.event_code:
+        resume_event(resume_code)
+    elif st.session_state.event_code:
+        # Re-attach every rerun: picks up other devices' changes, and reloads the event if it was evicted
+        attach_event(st.session_state.event_code)
+    
     # NORMAL FLOW: For organizers
     page = st.session_state.page
     
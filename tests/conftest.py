@@ -0,0 +1,27 @@
+import pytest
+
+from pickleball_engine import JsonFileStore, TournamentState, current_settings, get_event_cache, get_live_event, save_event_data, set_store
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Events, logs and snapshots in a temporary directory, with an empty live-event cache"""
+    monkeypatch.setenv("PICKLEBALL_DATA_DIR", str(tmp_path))
+    set_store(JsonFileStore(tmp_path))
+    get_event_cache().clear()
+    yield tmp_path
+    get_event_cache().clear()
+    set_store(None)
+
+@pytest.fixture
+def new_event(data_dir):
+    """Start a file-backed event the way the organizer's home page does, with players checked in"""
+    def create(code, players, **settings):
+        state = TournamentState(**settings)
+        save_event_data(code, {'event_name': code, 'event_code': code, 'players': []})
+        live = get_live_event(code, state)
+        live.record('settings', settings=current_settings(live.state))
+        for player in players:
+            live.record('check_in', player=player)
+        return live
+    return create
@@ -0,0 +1,65 @@
+import time
+from collections import Counter
+
+import pytest
+
+from pickleball_engine import court_game_at, court_game_count, court_game_design, generate_court_games
+from pickleball_engine.court_games import SEARCHED_DESIGN_MAX_PLAYERS
+
+SIZES = list(range(4, 41)) + [50, 64, 66, 99, 100]
+
+
+def opponent_counts(design, n):
+    met = Counter()
+    for (a, b), (c, d) in design:
+        for p, q in ((a, c), (a, d), (b, c), (b, d)):
+            met[min(p, q), max(p, q)] += 1
+    return [met[p, q] for p in range(n) for q in range(p + 1, n)]
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_equal_play_and_no_repeat_partners(n):
+    design = court_game_design(n)
+    assert all(len(set(team1 + team2)) == 4 for team1, team2 in design)
+    played = Counter(p for game in design for team in game for p in team)
+    assert set(played) == set(range(n))
+    assert len(set(played.values())) == 1
+    partners = Counter(tuple(sorted(team)) for game in design for team in game)
+    assert max(partners.values()) == 1
+    # Everyone skips at most two possible partners
+    assert played[0] >= n - 3
+
+@pytest.mark.parametrize("n", [4, 5, 8, 9, 12, 13])
+def test_whist_sizes_oppose_exactly_twice(n):
+    assert set(opponent_counts(court_game_design(n), n)) == {2}
+
+@pytest.mark.parametrize("n", [6, 7, 10, 11])
+def test_searched_sizes_oppose_once_or_twice(n):
+    assert set(opponent_counts(court_game_design(n), n)) <= {1, 2}
+
+@pytest.mark.parametrize("n", [n for n in SIZES if n > SEARCHED_DESIGN_MAX_PLAYERS])
+def test_big_courts_mostly_oppose_twice(n):
+    counts = opponent_counts(court_game_design(n), n)
+    assert max(counts) <= 4
+    assert sum(c == 2 for c in counts) >= len(counts) // 2
+
+@pytest.mark.parametrize("n", [20, 40, 64, 66, 100])
+def test_big_courts_build_quickly(n):
+    court_game_design.cache_clear()
+    started = time.perf_counter()
+    court_game_design(n)
+    assert time.perf_counter() - started < 1.0
+
+def test_designs_are_the_same_every_build():
+    first = court_game_design(30)
+    court_game_design.cache_clear()
+    assert court_game_design(30) == first
+
+@pytest.mark.parametrize("repeats", [1, 2])
+def test_games_served_by_index_match_the_schedule(repeats):
+    players = [f"P{i}" for i in range(7)]
+    games = generate_court_games(players, repeats)
+    assert len(games) == court_game_count(players, repeats) == repeats * len(court_game_design(7))
+    assert [court_game_at(players, i, repeats) for i in range(len(games))] == games
+    with pytest.raises(IndexError):
+        court_game_at(players, len(games), repeats)
@@ -0,0 +1,103 @@
+import pytest
+
+from pickleball_engine import (
+    RECORDED,
+    PairHistory,
+    TournamentState,
+    continuous_play,
+    dispatch_courts,
+    get_event_cache,
+    get_live_event,
+    pick_game,
+    start_round,
+    submit_court_score,
+)
+
+
+def continuous_state(num_players, num_courts, games, waiting):
+    players = [f"P{i}" for i in range(num_players)]
+    state = TournamentState(players=players, num_courts=num_courts, format_choice="Classic Round Robin",
+                            play_mode="Continuous")
+    state.ensure_player_stats(players)
+    state.current_games = [{'court': c, 'team1': four[:2], 'team2': four[2:], 'game': 0}
+                           for c, four in games.items()]
+    state.court_game_index = {c: 0 for c in games}
+    state.sitting_out = list(waiting)
+    return state
+
+def on_court(games):
+    return [p for g in games for p in g['team1'] + g['team2']]
+
+
+@pytest.mark.parametrize("settings, expected", [
+    ({'play_mode': "Continuous", 'format_choice': "Popcorn"}, True),
+    ({'play_mode': "Rounds", 'format_choice': "Popcorn"}, False),
+    ({'play_mode': "Continuous", 'format_choice': "Gauntlet"}, False),
+    ({'play_mode': "Continuous", 'format_choice': "Popcorn", 'partner_mode': "Fixed Partners",
+      'fixed_partners': {"A": "B", "B": "A"}}, False),
+])
+def test_continuous_play(settings, expected):
+    assert continuous_play(TournamentState(**settings)) == expected
+
+def test_pick_game_needs_four():
+    assert pick_game(["A", "B", "C"], PairHistory()) is None
+
+def test_pick_game_avoids_repeat_partners():
+    history = PairHistory()
+    history.record_game(["A", "B"], ["C", "D"])
+    team1, team2 = pick_game(["A", "B", "C", "D"], history)
+    assert "A" in team1
+    assert sorted(team1) not in (["A", "B"], ["C", "D"]) and sorted(team2) not in (["A", "B"], ["C", "D"])
+
+def test_front_of_queue_always_plays():
+    history = PairHistory()
+    history.record_game(["A", "B"], ["C", "D"])
+    history.record_game(["A", "C"], ["B", "D"])
+    team1, team2 = pick_game(["A", "B", "C", "D", "E", "F", "G", "H"], history)
+    assert "A" in team1 + team2
+
+def test_players_coming_off_rest_while_four_wait():
+    state = continuous_state(12, 2, {1: ["P0", "P1", "P2", "P3"], 2: ["P4", "P5", "P6", "P7"]},
+                             ["P8", "P9", "P10", "P11"])
+    before = state.to_dict()
+    dispatch = dispatch_courts(state, 1)
+    assert state.to_dict() == before
+    assert dispatch['freed'] == [1]
+    [game] = dispatch['games']
+    assert game['court'] == 1 and game['game'] == 1
+    assert sorted(on_court([game])) == ["P10", "P11", "P8", "P9"]
+    assert dispatch['waiting'] == ["P0", "P1", "P2", "P3"]
+
+def test_short_queue_calls_back_who_has_played_least():
+    state = continuous_state(10, 2, {1: ["P0", "P1", "P2", "P3"], 2: ["P4", "P5", "P6", "P7"]}, ["P8", "P9"])
+    state.scores["P0"]['games_played'] = 3
+    state.scores["P1"]['games_played'] = 3
+    [game] = dispatch_courts(state, 1)['games']
+    assert sorted(on_court([game])) == ["P2", "P3", "P8", "P9"]
+
+def test_fills_empty_courts_only_with_four_free():
+    state = continuous_state(10, 3, {1: ["P0", "P1", "P2", "P3"], 2: ["P4", "P5", "P6", "P7"]}, ["P8", "P9"])
+    dispatch = dispatch_courts(state, 1)
+    assert [g['court'] for g in dispatch['games']] == [1]
+    assert len(dispatch['waiting']) == 2
+    # Players on another court are never called
+    assert not set(on_court(dispatch['games'])) & {"P4", "P5", "P6", "P7"}
+
+def test_reported_court_gets_the_next_game_and_replays(new_event):
+    live = new_event("QUEUE", [f"P{i}" for i in range(12)], format_choice="Classic Round Robin",
+                     play_mode="Continuous", num_courts=2, num_rounds=4)
+    start_round(live.state, live.log, 1)
+    state = live.state
+    assert len(state.current_games) == 2 and len(state.sitting_out) == 4
+    game = next(g for g in state.current_games if g['court'] == 2)
+    assert submit_court_score(live.log, state, "phone-2", 1, 2, 0, game['team1'], game['team2'], 11, 8) == RECORDED
+
+    refilled = next(g for g in state.current_games if g['court'] == 2)
+    assert refilled['game'] == 1
+    assert not set(on_court([refilled])) & set(on_court([game]))
+    playing = on_court(state.current_games)
+    assert len(playing) == len(set(playing)) == 8
+    assert sorted(playing + state.sitting_out) == sorted(state.players)
+
+    get_event_cache().clear()
+    assert get_live_event("QUEUE").state.current_games == state.current_games
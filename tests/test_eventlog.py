@@ -0,0 +1,84 @@
+import json
+
+from pickleball_engine import (
+    EventLog,
+    get_event_cache,
+    get_live_event,
+    open_event_log,
+    save_settings,
+    start_round,
+    submit_round_scores,
+)
+
+PLAYERS = [f"P{i}" for i in range(1, 11)]
+
+
+def score_round(live):
+    results = [{'court': g['court'], 'team1': g['team1'], 'team2': g['team2'], 'score1': 11, 'score2': 7 + i % 3}
+               for i, g in enumerate(live.state.current_games)]
+    submit_round_scores(live.log, live.state, results)
+
+
+def test_replay_matches_live_state(new_event):
+    live = new_event("REPLAY", PLAYERS, format_choice="Classic Round Robin", num_courts=2, num_rounds=6)
+    for round_number in range(1, 4):
+        start_round(live.state, live.log, round_number)
+        score_round(live)
+    live.record('replacement', old_name="P3", new_name="Pat")
+    save_settings(live.state, live.log, players_on_break=["P4"])
+    start_round(live.state, live.log, 4)
+
+    assert live.log.replay().to_dict() == live.state.to_dict()
+    # From the file alone, as another server process would
+    assert open_event_log("REPLAY").replay().to_dict() == live.state.to_dict()
+
+def test_replay_from_snapshot(new_event):
+    live = new_event("SNAP", PLAYERS, format_choice="Gauntlet", num_courts=2, num_rounds=6)
+    live.log.snapshot_interval = 5
+    for round_number in range(1, 5):
+        start_round(live.state, live.log, round_number)
+        score_round(live)
+
+    reopened = EventLog(live.log.path)
+    assert reopened.snapshot is not None
+    assert reopened.replay().to_dict() == live.state.to_dict()
+
+def test_evicted_event_keeps_its_settings(new_event):
+    live = new_event("EVICT", PLAYERS, format_choice="Classic Round Robin")
+    save_settings(live.state, live.log, num_courts=3, num_rounds=5, format_choice="Gauntlet",
+                  partner_mode="Doubles", pairing_mode="Balanced", players_on_break=["P2"],
+                  tiebreaks=("point_diff", "wins"))
+    expected = live.state.to_dict()
+
+    get_event_cache().clear()
+    rebuilt = get_live_event("EVICT")
+    assert rebuilt is not live
+    assert rebuilt.state.to_dict() == expected
+    assert rebuilt.state.format_choice == "Gauntlet"
+    assert rebuilt.state.num_courts == 3
+    assert rebuilt.state.players_on_break == ["P2"]
+    assert tuple(rebuilt.state.standings.tiebreaks) == ("point_diff", "wins")
+
+def test_unchanged_settings_are_not_logged(new_event):
+    live = new_event("SAME", PLAYERS, num_courts=2)
+    seq = live.log.seq
+    assert save_settings(live.state, live.log, num_courts=2) is None
+    assert live.log.seq == seq
+
+def test_cold_load_skips_a_line_still_being_written(new_event):
+    live = new_event("PARTIAL", PLAYERS[:4])
+    seq = live.log.seq
+    line = json.dumps({'seq': seq + 1, 'type': 'check_in', 'player': "Late"}) + '\n'
+    # Another process is halfway through appending an event
+    with open(live.log.path, 'a') as f:
+        f.write(line[:10])
+    
+    log = EventLog(live.log.path)
+    assert log.seq == seq
+    state = log.replay()
+    assert state.players == PLAYERS[:4]
+    
+    with open(live.log.path, 'a') as f:
+        f.write(line[10:])
+    assert log.catch_up(state) == 1
+    assert state.players == PLAYERS[:4] + ["Late"]
@@ -0,0 +1,117 @@
+from concurrent.futures import Future
+
+import pytest
+
+from pickleball_engine import (
+    TournamentState,
+    fair_bench,
+    prefetch_next_round,
+    repair_round,
+    round_inputs,
+    start_round,
+    take_prefetched_round,
+)
+
+PLAYERS = [f"P{i}" for i in range(10)]
+
+
+def planned_round():
+    return {
+        'current_games': [
+            {'court': 1, 'team1': ["P0", "P1"], 'team2': ["P2", "P3"]},
+            {'court': 2, 'team1': ["P4", "P5"], 'team2': ["P6", "P7"]},
+        ],
+        'sitting_out': ["P8", "P9"],
+        'court_groups': []
+    }
+
+def on_court(round_data):
+    return [p for g in round_data['current_games'] for p in g['team1'] + g['team2']]
+
+def prefetched_state(format_choice="Gauntlet"):
+    state = TournamentState(players=list(PLAYERS), num_courts=2, num_rounds=4, format_choice=format_choice)
+    state.current_round = 1
+    prefetch_next_round(state)
+    return state
+
+
+def test_repair_gives_the_spot_to_whoever_sat_out_most():
+    active = [p for p in PLAYERS if p != "P2"]
+    repaired = repair_round(planned_round(), active, 2, {"P9": 1})
+    assert repaired['current_games'][0]['team2'] == ["P9", "P3"]
+    assert repaired['sitting_out'] == ["P8"]
+    assert repaired['current_games'][1] == planned_round()['current_games'][1]
+
+def test_repair_without_breaks_changes_nothing():
+    assert repair_round(planned_round(), PLAYERS, 2, {}) == planned_round()
+
+def test_repair_adds_late_players_to_the_bench():
+    repaired = repair_round(planned_round(), PLAYERS + ["P10"], 2, {})
+    assert repaired['sitting_out'] == ["P8", "P9", "P10"]
+
+@pytest.mark.parametrize("active, num_courts, sit_out_counts", [
+    # Three on a break, two on the bench
+    ([p for p in PLAYERS if p not in ("P0", "P1", "P2")], 2, {}),
+    # Enough on the bench to open the third court
+    (PLAYERS + ["P10", "P11"], 3, {}),
+    # Whoever stays benched has sat out more than the players on court
+    ([p for p in PLAYERS if p != "P2"], 2, {"P8": 1, "P9": 2}),
+])
+def test_repair_gives_up(active, num_courts, sit_out_counts):
+    assert repair_round(planned_round(), active, num_courts, sit_out_counts) is None
+
+def test_repair_leaves_court_groups_alone():
+    groups = {'court_groups': [{'court': 1, 'players': PLAYERS[:5]}], 'sitting_out': [], 'current_games': []}
+    assert repair_round(groups, PLAYERS[1:5], 1, {}) is None
+
+def test_take_prefetched_round():
+    state = prefetched_state()
+    assert state.prefetched['inputs'] == round_inputs(state, 2)
+    round_data = take_prefetched_round(state, 2)
+    assert state.prefetched is None
+    assert sorted(on_court(round_data) + round_data['sitting_out']) == sorted(PLAYERS)
+
+def test_take_prefetched_round_repairs_for_a_break():
+    state = prefetched_state()
+    state.players_on_break = ["P0"]
+    state.sit_out_counts = {p: 1 for p in PLAYERS}
+    round_data = take_prefetched_round(state, 2)
+    assert sorted(on_court(round_data) + round_data['sitting_out']) == PLAYERS[1:]
+    assert fair_bench(on_court(round_data), round_data['sitting_out'], state.sit_out_counts)
+
+@pytest.mark.parametrize("change", [
+    lambda state: setattr(state, 'num_courts', 3),
+    lambda state: state.players.append("P10"),
+    lambda state: state.game_scores.append({'team1': ["P0", "P1"], 'team2': ["P2", "P3"], 'score': [11, 3]}),
+])
+def test_stale_prefetch_is_dropped(change):
+    state = prefetched_state()
+    change(state)
+    assert take_prefetched_round(state, 2) is None
+    assert state.prefetched is None
+
+def test_wrong_round_is_dropped():
+    state = prefetched_state()
+    assert take_prefetched_round(state, 3) is None
+
+def test_failed_prefetch_falls_back():
+    state = TournamentState(players=list(PLAYERS), num_courts=2, format_choice="Gauntlet")
+    future = Future()
+    future.set_exception(RuntimeError("speculative build failed"))
+    state.prefetched = {'inputs': round_inputs(state, 2), 'future': future}
+    assert take_prefetched_round(state, 2) is None
+
+def test_no_prefetch_in_continuous_play():
+    state = TournamentState(players=list(PLAYERS), num_courts=2, format_choice="Popcorn", play_mode="Continuous")
+    state.current_round = 1
+    prefetch_next_round(state)
+    assert state.prefetched is None
+
+def test_start_round_uses_the_prefetched_round(new_event):
+    live = new_event("AHEAD", PLAYERS, format_choice="Gauntlet", num_courts=2, num_rounds=4)
+    start_round(live.state, live.log, 1)
+    future = live.state.prefetched['future']
+    expected, _ = future.result()
+    start_round(live.state, live.log, 2)
+    assert live.state.current_games == expected['current_games']
+    assert live.state.sitting_out == expected['sitting_out']
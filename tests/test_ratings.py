@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from pickleball_engine import INITIAL_RATING, RatingTable, TournamentState, expected_score, record_games_batch
+
+GAMES = [
+    {'team1': ["Ann", "Bob"], 'team2': ["Cat", "Dan"], 'score': [11, 4]},
+    {'team1': ["Ann", "Cat"], 'team2': ["Bob", "Dan"], 'score': [11, 9]},
+    {'team1': ["Bob", "Cat"], 'team2': ["Ann", "Dan"], 'score': [6, 11]},
+]
+
+
+def test_expected_score():
+    assert expected_score(1500, 1500) == 0.5
+    assert expected_score(1900, 1500) == pytest.approx(10 / 11)
+    assert expected_score(1600, 1400) + expected_score(1400, 1600) == pytest.approx(1)
+
+def test_winners_gain_what_losers_lose():
+    table = RatingTable()
+    table.record(["Ann", "Bob"], ["Cat", "Dan"], 11, 7)
+    assert table.rating("Ann") == table.rating("Bob") > INITIAL_RATING
+    assert table.rating("Cat") == table.rating("Dan") < INITIAL_RATING
+    assert sum(table.ratings.values()) == pytest.approx(4 * INITIAL_RATING)
+    assert table.rating("Eve") == INITIAL_RATING
+
+def test_upsets_move_ratings_more():
+    favourite = RatingTable({"Ann": 1700, "Bob": 1700})
+    favourite.record(["Ann", "Bob"], ["Cat", "Dan"], 11, 5)
+    upset = RatingTable({"Ann": 1700, "Bob": 1700})
+    upset.record(["Ann", "Bob"], ["Cat", "Dan"], 5, 11)
+    favourite_gain = favourite.rating("Ann") - 1700
+    underdog_gain = upset.rating("Dan") - INITIAL_RATING
+    assert underdog_gain > favourite_gain > 0
+
+def test_provisional_players_settle():
+    table = RatingTable(games={"Ann": 0, "Bob": 5, "Cat": 10, "Dan": 40})
+    assert table.k_factor("Ann") > table.k_factor("Bob") > table.k_factor("Cat") == table.k_factor("Dan")
+
+def test_batch_matches_game_by_game():
+    table = RatingTable()
+    for game in GAMES:
+        table.record(game['team1'], game['team2'], *game['score'])
+    batch = RatingTable.from_game_scores(GAMES)
+    assert batch.ratings == table.ratings and batch.games == table.games
+
+def test_ranked_best_first():
+    table = RatingTable.from_game_scores(GAMES)
+    ranked = table.ranked(["Bob", "Cat", "Dan", "Ann", "Eve"])
+    assert ranked[0] == "Ann" and ranked[-1] == "Dan"
+    assert [table.rating(p) for p in ranked] == sorted((table.rating(p) for p in ranked), reverse=True)
+
+def test_json_round_trip_and_rename():
+    table = RatingTable.from_game_scores(GAMES)
+    loaded = RatingTable.from_dict(json.loads(json.dumps(table.to_dict())))
+    assert loaded.ratings == table.ratings and loaded.games == table.games
+    loaded.rename("Ann", "Anna")
+    assert loaded.rating("Anna") == table.rating("Ann")
+    assert loaded.rating("Ann") == INITIAL_RATING
+    assert loaded.k_factor("Anna") == table.k_factor("Ann")
+
+def test_state_rebuilds_ratings_from_old_snapshots():
+    state = TournamentState(players=["Ann", "Bob", "Cat", "Dan"], num_courts=1)
+    state.ensure_player_stats(state.players)
+    state.current_round = 1
+    for game in GAMES:
+        record_games_batch(state, [{'court': 1, 'team1': game['team1'], 'team2': game['team2'],
+                                    'score1': game['score'][0], 'score2': game['score'][1]}])
+    data = state.to_dict()
+    assert TournamentState.from_dict(data).ratings.ratings == pytest.approx(state.ratings.ratings)
+    del data['ratings']
+    assert TournamentState.from_dict(data).ratings.ratings == pytest.approx(state.ratings.ratings)
@@ -0,0 +1,91 @@
+import json
+
+from pickleball_engine import PairHistory, PlayerRegistry, TournamentState
+
+
+def sample_history():
+    history = PairHistory()
+    history.record_game(["Ann", "Bob"], ["Cat", "Dan"])
+    history.record_game(["Ann", "Cat"], ["Bob", "Eve"])
+    history.record_game(["Ann", "Dan"], ["Bob", "Cat"])
+    return history
+
+def snapshot(history, players):
+    """Every pair's partnered flag and opponent count, by name"""
+    return {(a, b): (history.partnered(a, b), history.opponent_count(a, b)) for a in players for b in players}
+
+PLAYERS = ["Ann", "Bob", "Cat", "Dan", "Eve"]
+
+
+def test_registry_ids_are_dense_and_never_reused():
+    registry = PlayerRegistry(["Ann", "Bob"])
+    assert registry.intern("Cat") == 2
+    assert registry.intern("Ann") == 0
+    assert registry.remove("Bob") == 1
+    assert registry.intern("Bob") == 3
+    assert "Bob" in registry and len(registry) == 3
+    registry.rename("Cat", "Cathy")
+    assert registry.id_of("Cathy") == 2 and registry.id_of("Cat") is None
+
+def test_partners_and_opponent_counts():
+    history = sample_history()
+    assert history.partnered("Ann", "Bob") and history.partnered("Bob", "Ann")
+    assert not history.partnered("Ann", "Eve")
+    assert history.opponent_count("Ann", "Bob") == 2
+    assert history.opponent_count("Cat", "Eve") == 1
+    assert history.opponent_count("Ann", "Zed") == 0
+    assert history.partners_of("Ann") == {"Bob", "Cat", "Dan"}
+    assert history.partners_of("Zed") == set()
+
+def test_rename_keeps_the_history():
+    history = sample_history()
+    before = snapshot(history, PLAYERS)
+    history.rename("Ann", "Anna")
+    names = ["Anna" if p == "Ann" else p for p in PLAYERS]
+    assert list(snapshot(history, names).values()) == list(before.values())
+    assert not history.partnered("Ann", "Bob")
+
+def test_remove_clears_both_directions():
+    history = sample_history()
+    history.remove("Bob")
+    assert history.partners_of("Ann") == {"Cat", "Dan"}
+    assert history.opponent_count("Cat", "Bob") == 0
+    history.record_game(["Bob", "Eve"], ["Ann", "Cat"])
+    assert history.partners_of("Bob") == {"Eve"}
+    assert history.opponent_count("Ann", "Bob") == 1
+
+def test_json_round_trip():
+    history = sample_history()
+    history.remove("Eve")
+    loaded = PairHistory.from_dict(json.loads(json.dumps(history.to_dict())))
+    assert snapshot(loaded, PLAYERS) == snapshot(history, PLAYERS)
+    assert loaded.registry.names == history.registry.names
+
+def test_remapped_uses_slots():
+    history = sample_history()
+    players = ["Dan", "Ann", "New", "Bob"]
+    slots = history.remapped(players)
+    for a, name_a in enumerate(players):
+        for b, name_b in enumerate(players):
+            assert slots.partnered(a, b) == history.partnered(name_a, name_b)
+            assert slots.opponent_count(a, b) == history.opponent_count(name_a, name_b)
+    assert slots.partners_of(1) == {0, 3}
+
+def test_from_legacy_matches_recorded_games():
+    legacy_partners = {"Ann": {"Bob", "Cat", "Dan"}, "Bob": {"Ann", "Eve"}, "Cat": {"Ann", "Dan"},
+                       "Dan": {"Ann", "Cat"}, "Eve": {"Bob"}}
+    legacy_opponents = {"Ann": {"Bob": 2, "Cat": 2, "Dan": 1, "Eve": 1}}
+    history = PairHistory.from_legacy(legacy_partners, legacy_opponents)
+    assert history.partners_of("Ann") == {"Bob", "Cat", "Dan"}
+    assert history.opponent_count("Ann", "Bob") == 2
+    assert history.opponent_count("Ann", "Eve") == 1
+    assert history.opponent_count("Bob", "Ann") == 0
+
+def test_old_snapshots_load_their_history():
+    data = TournamentState(players=PLAYERS).to_dict()
+    del data['history']
+    data['partner_history'] = {"Ann": ["Bob"], "Bob": ["Ann"]}
+    data['opponent_history'] = {"Ann": {"Cat": 3}}
+    state = TournamentState.from_dict(data)
+    assert state.history.partnered("Bob", "Ann")
+    assert state.history.opponent_count("Ann", "Cat") == 3
@@ -0,0 +1,92 @@
+import pytest
+
+from pickleball_engine import (
+    DUPLICATE,
+    RECORDED,
+    ScoreConflict,
+    ScoreError,
+    TournamentState,
+    record_games_batch,
+    start_round,
+    submit_court_score,
+)
+
+PLAYERS = ["A", "B", "C", "D", "E", "F", "G", "H"]
+
+
+def result(court, team1, team2, score1, score2):
+    return {'court': court, 'team1': team1, 'team2': team2, 'score1': score1, 'score2': score2}
+
+
+def test_batch_records_every_court():
+    state = TournamentState(players=list(PLAYERS), current_round=1)
+    entries = record_games_batch(state, [result(1, ["A", "B"], ["C", "D"], 11, 5),
+                                         result(2, ["E", "F"], ["G", "H"], 9, 11)])
+    assert len(entries) == 2
+    assert state.scores["A"]['wins'] == 1 and state.scores["C"]['losses'] == 1
+    assert state.scores["G"]['point_diff'] == 2
+
+@pytest.mark.parametrize("bad", [
+    result(2, ["E", "F"], ["G", "H"], 11, 11),
+    result(2, ["E", "F"], ["G", "H"], -1, 11),
+    result(2, ["E", "F"], ["G", "H"], 0, 0),
+    result(2, ["E", "F"], ["G", "H"], 11, None),
+    result(2, ["E", "F"], ["G", "H"], None, None),
+    result(2, ["E", "F"], ["A", "H"], 11, 4),
+])
+def test_bad_court_leaves_state_untouched(bad):
+    state = TournamentState(players=list(PLAYERS), current_round=1)
+    before = state.to_dict()
+    with pytest.raises(ScoreError):
+        record_games_batch(state, [result(1, ["A", "B"], ["C", "D"], 11, 5), bad])
+    assert state.to_dict() == before
+
+def test_empty_score_box_is_not_a_zero():
+    state = TournamentState(players=list(PLAYERS), current_round=1)
+    with pytest.raises(ScoreError, match="Court 1: Please enter both scores"):
+        record_games_batch(state, [result(1, ["A", "B"], ["C", "D"], 11, None)])
+    assert state.game_scores == []
+
+def test_missing_court_leaves_state_untouched():
+    state = TournamentState(players=list(PLAYERS), current_round=1)
+    before = state.to_dict()
+    with pytest.raises(ScoreError, match="court 2"):
+        record_games_batch(state, [result(1, ["A", "B"], ["C", "D"], 11, 5)], expected_courts=[1, 2])
+    assert state.to_dict() == before
+
+
+@pytest.fixture
+def live_round(new_event):
+    live = new_event("COURTS", PLAYERS, format_choice="Classic Round Robin", num_courts=2, num_rounds=4)
+    start_round(live.state, live.log, 1)
+    return live
+
+def submit(live, submission_id, score1, score2, court=1):
+    game = next(g for g in live.state.current_games if g['court'] == court)
+    return submit_court_score(live.log, live.state, submission_id, 1, court, 0, game['team1'], game['team2'],
+                              score1, score2)
+
+def test_court_score_retry_is_idempotent(live_round):
+    assert submit(live_round, "phone-1", 11, 6) == RECORDED
+    seq, scores = live_round.log.seq, live_round.state.to_dict()['scores']
+    assert submit(live_round, "phone-1", 11, 6) == DUPLICATE
+    # The same score from another device is a duplicate too
+    assert submit(live_round, "phone-2", 11, 6) == DUPLICATE
+    assert live_round.log.seq == seq
+    assert live_round.state.to_dict()['scores'] == scores
+    assert len(live_round.state.game_scores) == 1
+
+def test_court_score_conflict(live_round):
+    submit(live_round, "phone-1", 11, 6)
+    seq = live_round.log.seq
+    with pytest.raises(ScoreConflict, match="already scored 11-6"):
+        submit(live_round, "phone-2", 6, 11)
+    assert live_round.log.seq == seq
+
+@pytest.mark.parametrize("score1, score2", [(11, 11), (11, None), (None, 7)])
+def test_invalid_court_score_is_not_logged(live_round, score1, score2):
+    seq = live_round.log.seq
+    with pytest.raises(ScoreError):
+        submit(live_round, "phone-1", score1, score2)
+    assert live_round.log.seq == seq
+    assert live_round.state.game_scores == []
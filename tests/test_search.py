@@ -0,0 +1,81 @@
+import random
+import threading
+import time
+
+import pytest
+
+from pickleball_engine import (
+    SEARCH_DEADLINE,
+    PairHistory,
+    cost_floor,
+    multi_start_search,
+    round_cost,
+    serial_search,
+)
+from pickleball_engine.search import SEARCH_GRACE
+
+
+def crowded_history(players, rounds, seed=1):
+    """A history with so many past games that no round is free of repeats"""
+    rng = random.Random(seed)
+    history = PairHistory()
+    for _ in range(rounds):
+        order = list(players)
+        rng.shuffle(order)
+        for i in range(0, len(order) - 3, 4):
+            history.record_game(order[i:i + 2], order[i + 2:i + 4])
+    return history
+
+def check_round(result, players, num_courts):
+    placed = [p for g in result['games'] for p in g['team1'] + g['team2']]
+    assert len(result['games']) == min(num_courts, len(players) // 4)
+    assert sorted(placed + list(result['sitting'])) == sorted(players)
+
+
+def test_stops_at_the_floor_without_the_pool():
+    players = [f"P{i}" for i in range(104)]
+    started = time.perf_counter()
+    result = multi_start_search(players, 25, processes=4, rng=random.Random(1))
+    assert result['cost'] == cost_floor(players, 25, {}) == 0
+    assert result['restarts'] == 1
+    assert time.perf_counter() - started < SEARCH_DEADLINE
+    check_round(result, players, 25)
+
+@pytest.mark.parametrize("processes", [1, 3])
+def test_keeps_its_deadline(processes):
+    players = [f"P{i}" for i in range(24)]
+    history = crowded_history(players, 40)
+    counts = {p: i % 3 for i, p in enumerate(players)}
+    started = time.perf_counter()
+    result = multi_start_search(players, 5, history, counts, deadline=0.3, processes=processes, rng=random.Random(2))
+    # Even a first call, while the pool is still starting up
+    assert time.perf_counter() - started < 0.3 + SEARCH_GRACE + 0.1
+    check_round(result, players, 5)
+    assert result['cost'] == round_cost(result['games'], result['sitting'], history, counts)
+    assert result['cost'] >= cost_floor(players, 5, counts)
+    assert result['restarts'] >= 1
+
+def test_concurrent_searches_each_get_an_answer():
+    players = [f"P{i}" for i in range(20)]
+    history = crowded_history(players, 30)
+    results = []
+    def search():
+        results.append(multi_start_search(players, 4, history, deadline=0.2, processes=3))
+    threads = [threading.Thread(target=search) for _ in range(3)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Side by side, not one after another
+    assert time.perf_counter() - started < 3 * 0.2
+    assert len(results) == 3
+    for result in results:
+        check_round(result, players, 4)
+
+def test_serial_search_stays_in_process():
+    players = [f"P{i}" for i in range(16)]
+    history = crowded_history(players, 30)
+    with serial_search():
+        result = multi_start_search(players, 3, history, deadline=0.1, processes=4, rng=random.Random(3))
+    check_round(result, players, 3)
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from pickleball_engine import generate_new_round, simulate_configs, simulate_session
+from pickleball_engine.simulation import _new_state
+
+# Formats whose rounds depend only on the seed - no search against the clock
+CONFIGS = [
+    {'format': "Popcorn", 'players': 14, 'courts': 3, 'rounds': 5},
+    {'format': "Scramble", 'players': 13, 'courts': 3, 'rounds': 4},
+    {'format': "Gauntlet", 'players': 10, 'courts': 2, 'rounds': 4},
+    {'format': "Mixed Madness", 'players': 12, 'courts': 2, 'rounds': 4},
+    {'format': "Popcorn", 'players': 12, 'courts': 3, 'rounds': 4, 'pairing_mode': "Balanced"},
+]
+
+
+@pytest.mark.parametrize("config", CONFIGS)
+def test_same_seed_same_session(config):
+    assert simulate_session(config, 7) == simulate_session(config, 7)
+
+@pytest.mark.parametrize("config", CONFIGS)
+def test_session_leaves_the_global_generator_alone(config):
+    random.seed(1)
+    expected = [random.random() for _ in range(5)]
+    random.seed(1)
+    simulate_session(config, 7)
+    assert [random.random() for _ in range(5)] == expected
+
+def test_serial_configs_leave_the_global_generator_alone():
+    random.seed(1)
+    expected = random.getstate()
+    simulate_configs(CONFIGS[:2], sessions=3, processes=1)
+    assert random.getstate() == expected
+
+def test_results_do_not_depend_on_processes():
+    serial = simulate_configs(CONFIGS[:2], sessions=4, processes=1, batch_size=2)
+    pooled = simulate_configs(CONFIGS[:2], sessions=4, processes=2, batch_size=2)
+    assert serial == pooled
+
+@pytest.mark.parametrize("config", CONFIGS)
+def test_round_follows_the_given_generator(config):
+    rounds = []
+    for _ in range(2):
+        state = _new_state(config)
+        state.current_round = 1
+        rounds.append(generate_new_round(state, random.Random(3)))
+    assert rounds[0] == rounds[1]
@@ -0,0 +1,54 @@
+import pytest
+
+from pickleball_engine import fair_bench, start_round
+
+PLAYERS = [f"P{i}" for i in range(1, 11)]
+
+
+def on_court(state):
+    games = [p for g in state.current_games for p in g['team1'] + g['team2']]
+    return games + [p for group in state.court_groups for p in group['players']]
+
+def spread(state, players):
+    counts = [state.sit_out_counts.get(p, 0) for p in players]
+    return max(counts) - min(counts)
+
+def play_rounds(live, first, last):
+    """Start rounds first..last, checking each bench against the counts it was chosen from"""
+    state = live.state
+    for round_number in range(first, last + 1):
+        counts = dict(state.sit_out_counts)
+        start_round(state, live.log, round_number)
+        playing = on_court(state)
+        assert len(playing) == len(set(playing))
+        assert sorted(playing + state.sitting_out) == sorted(state.active_players())
+        assert fair_bench(playing, state.sitting_out, counts)
+
+
+@pytest.mark.parametrize("format_choice", [
+    "Classic Round Robin", "Popcorn", "Scramble", "Double Header",
+    "Gauntlet", "Up and Down the River", "Cream of the Crop",
+])
+def test_steady_roster_spread(new_event, format_choice):
+    live = new_event("SPREAD", PLAYERS, format_choice=format_choice, num_courts=2, num_rounds=9)
+    for round_number in range(1, 10):
+        play_rounds(live, round_number, round_number)
+        assert spread(live.state, PLAYERS) <= 1
+
+@pytest.mark.parametrize("format_choice", ["Classic Round Robin", "Popcorn", "Scramble", "Gauntlet"])
+def test_late_arrival_catches_up(new_event, format_choice):
+    live = new_event("LATE", PLAYERS[:-1], format_choice=format_choice, num_courts=2, num_rounds=12)
+    play_rounds(live, 1, 4)
+    live.record('check_in', player=PLAYERS[-1])
+    play_rounds(live, 5, 12)
+    assert spread(live.state, PLAYERS) <= 1
+
+@pytest.mark.parametrize("format_choice", ["Classic Round Robin", "Gauntlet"])
+def test_breaks_are_covered_fairly(new_event, format_choice):
+    live = new_event("BREAK", PLAYERS, format_choice=format_choice, num_courts=2, num_rounds=8)
+    play_rounds(live, 1, 3)
+    live.record('settings', settings={'players_on_break': [PLAYERS[0], PLAYERS[1]]})
+    play_rounds(live, 4, 4)
+    assert not {PLAYERS[0], PLAYERS[1]} & set(on_court(live.state) + live.state.sitting_out)
+    live.record('settings', settings={'players_on_break': []})
+    play_rounds(live, 5, 8)
@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from pickleball_engine import (
+    HEAD_TO_HEAD,
+    TIEBREAK_KEYS,
+    TIEBREAK_PRESETS,
+    StandingsIndex,
+    TournamentState,
+    record_game,
+)
+
+
+def full_sort(state):
+    """The old per-render ranking: sort everyone on the whole tiebreak chain"""
+    tiebreaks = state.standings.tiebreaks
+    return sorted(state.scores, key=lambda p: tuple(TIEBREAK_KEYS[k](state.scores[p]) for k in tiebreaks), reverse=True)
+
+def played_state(seed, players=12, games=40, tiebreaks=None):
+    rng = random.Random(seed)
+    state = TournamentState(players=[f"P{i}" for i in range(players)])
+    if tiebreaks:
+        state.set_tiebreaks(tiebreaks)
+    for _ in range(games):
+        a, b, c, d = rng.sample(state.players, 4)
+        winner, loser = 11, rng.randint(0, 9)
+        scores = (winner, loser) if rng.random() < 0.5 else (loser, winner)
+        record_game(state, 1, [a, b], [c, d], *scores)
+    return state
+
+def sort_values(state, player):
+    return tuple(TIEBREAK_KEYS[k](state.scores[player]) for k in state.standings.sort_keys)
+
+
+@pytest.mark.parametrize("preset", ["Points For", "Point Diff"])
+def test_index_matches_a_full_sort(preset):
+    for seed in range(5):
+        state = played_state(seed, tiebreaks=TIEBREAK_PRESETS[preset])
+        ranked = state.standings.top()
+        assert [sort_values(state, p) for p in ranked] == [sort_values(state, p) for p in full_sort(state)]
+        assert state.standings.top(3) == ranked[:3]
+
+def stats(wins, losses, points_for, points_against):
+    return {'wins': wins, 'losses': losses, 'games_played': wins + losses, 'points_for': points_for,
+            'points_against': points_against, 'point_diff': points_for - points_against}
+
+@pytest.mark.parametrize("winner, loser", [("A", "C"), ("C", "A")])
+def test_head_to_head_breaks_ties(winner, loser):
+    index = StandingsIndex(TIEBREAK_PRESETS["Win %"])
+    index.update("B", stats(2, 0, 22, 10))
+    index.update("A", stats(1, 1, 20, 20))
+    index.update("C", stats(1, 1, 20, 20))
+    index.update("D", stats(0, 2, 10, 22))
+    index.record_head_to_head([winner], [loser])
+    assert index.top() == ["B", winner, loser, "D"]
+    assert index.top(2) == ["B", winner]
+
+def test_changing_tiebreaks_reranks():
+    state = played_state(1)
+    state.set_tiebreaks(TIEBREAK_PRESETS["Point Diff"])
+    diffs = [state.scores[p]['point_diff'] for p in state.standings.top()]
+    assert diffs == sorted(diffs, reverse=True)
+
+def test_rows_follow_the_ranking():
+    state = played_state(2)
+    rows = state.standings.rows(5)
+    assert [row['Player'] for row in rows] == state.standings.top(5)
+    assert [row['Rank'] for row in rows] == [1, 2, 3, 4, 5]
+
+def test_unknown_tiebreak():
+    with pytest.raises(ValueError):
+        StandingsIndex(('points_for', 'height'))
+
+def test_renamed_player_ranks_the_same_after_a_reload():
+    state = played_state(3, tiebreaks=TIEBREAK_PRESETS["Win %"])
+    state.rename_player("P0", "Pat")
+    assert HEAD_TO_HEAD in state.standings.tiebreaks
+    assert all("P0" not in game['team1'] + game['team2'] for game in state.game_scores)
+    reloaded = TournamentState.from_dict(state.to_dict())
+    assert reloaded.standings.head_to_head == state.standings.head_to_head
+    assert reloaded.standings.top() == state.standings.top()
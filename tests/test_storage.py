@@ -0,0 +1,94 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from pickleball_engine import (
+    ALREADY_CHECKED_IN,
+    CHECKED_IN,
+    EVENT_FULL,
+    EVENT_NOT_FOUND,
+    JsonFileStore,
+    SQLiteEventStore,
+    check_in_player,
+    process_context,
+    save_event_data,
+)
+
+
+@pytest.fixture(params=['sqlite', 'json'])
+def store(request, tmp_path):
+    if request.param == 'sqlite':
+        return SQLiteEventStore(tmp_path / "events.db")
+    return JsonFileStore(tmp_path)
+
+
+def test_event_round_trips(store):
+    data = {'event_name': "Tuesday Ladder", 'event_code': "ABC123", 'players': ["Ann", "Bob"], 'player_cap': 8}
+    store.save_event("ABC123", data)
+    assert store.load_event("ABC123") == data
+
+def test_missing_event(store):
+    assert store.load_event("NOPE00") is None
+    assert store.get_version("NOPE00") is None
+
+def test_roster_keeps_check_in_order(store):
+    store.save_event("ABC123", {'event_code': "ABC123", 'players': ["Cat", "Ann", "Bob"]})
+    store.rename_player("ABC123", "Ann", "Anna")
+    store.remove_player("ABC123", "Cat")
+    assert store.load_event("ABC123")['players'] == ["Anna", "Bob"]
+
+def test_version_changes_with_the_roster(tmp_path):
+    # The JSON store's version is the file's mtime, too coarse for back-to-back changes
+    store = SQLiteEventStore(tmp_path / "events.db")
+    store.save_event("ABC123", {'event_code': "ABC123", 'players': []})
+    versions = [store.get_version("ABC123")]
+    for change in (lambda: store.check_in("ABC123", "Ann"), lambda: store.rename_player("ABC123", "Ann", "Anna"),
+                   lambda: store.remove_player("ABC123", "Anna")):
+        change()
+        versions.append(store.get_version("ABC123"))
+    assert len(set(versions)) == len(versions)
+
+def test_sqlite_events_survive_a_new_store(tmp_path):
+    SQLiteEventStore(tmp_path / "events.db").save_event("ABC123", {'event_code': "ABC123", 'players': ["Ann"]})
+    assert SQLiteEventStore(tmp_path / "events.db").load_event("ABC123")['players'] == ["Ann"]
+
+def _check_in_all(path, names):
+    store = SQLiteEventStore(path)
+    return [store.check_in("ABC123", name) for name in names]
+
+def test_check_in_results(store):
+    assert store.check_in("NOPE00", "Ann") == EVENT_NOT_FOUND
+    store.save_event("ABC123", {'event_code': "ABC123", 'players': [], 'player_cap': 2})
+    assert store.check_in("ABC123", "Ann") == CHECKED_IN
+    assert store.check_in("ABC123", "Ann") == ALREADY_CHECKED_IN
+    assert store.check_in("ABC123", "Bob") == CHECKED_IN
+    assert store.check_in("ABC123", "Cat") == EVENT_FULL
+    # A full event still recognises someone already on it
+    assert store.check_in("ABC123", "Bob") == ALREADY_CHECKED_IN
+    assert store.load_event("ABC123")['players'] == ["Ann", "Bob"]
+
+def test_check_in_player_trims_the_name(data_dir):
+    save_event_data("ABC123", {'event_code': "ABC123", 'players': []})
+    assert check_in_player("ABC123", "  Ann ") == CHECKED_IN
+    assert check_in_player("ABC123", "Ann") == ALREADY_CHECKED_IN
+
+def test_concurrent_check_ins_stop_at_the_cap(store):
+    store.save_event("ABC123", {'event_code': "ABC123", 'players': [], 'player_cap': 10})
+    names = [f"P{i}" for i in range(40)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda name: store.check_in("ABC123", name), names))
+    assert results.count(CHECKED_IN) == 10
+    assert results.count(EVENT_FULL) == 30
+    assert sorted(store.load_event("ABC123")['players']) == sorted(n for n, r in zip(names, results) if r == CHECKED_IN)
+
+def test_sqlite_cap_holds_across_processes(tmp_path):
+    path = tmp_path / "events.db"
+    SQLiteEventStore(path).save_event("ABC123", {'event_code': "ABC123", 'players': [], 'player_cap': 12})
+    # Everyone scans twice, from four processes each with its own connection
+    batches = [[f"P{i}" for i in range(start, 40, 4)] * 2 for start in range(4)]
+    with ProcessPoolExecutor(max_workers=4, mp_context=process_context()) as pool:
+        results = [r for batch in pool.map(_check_in_all, [path] * 4, batches) for r in batch]
+    players = SQLiteEventStore(path).load_event("ABC123")['players']
+    assert len(players) == 12 == len(set(players))
+    assert results.count(CHECKED_IN) == 12
+    assert results.count(ALREADY_CHECKED_IN) == 12